@@ -24,8 +24,15 @@ logger = logging.getLogger("kalshi_weather")
 # ── Scan subcommand (original behavior) ──────────────────────────────
 
 
-def _run_scan() -> int:
-    """Run the full Kalshi Weather Scanner pipeline."""
+def _run_scan(
+    candidate_cache: str | None = None, refresh_gridpoints: bool = False,
+) -> int:
+    """Run the full Kalshi Weather Scanner pipeline.
+
+    ``candidate_cache`` is an optional SQLite path for reusing enrichment
+    of unchanged markets across runs. ``refresh_gridpoints`` discards the
+    stored station -> NWS grid lookups and resolves them again.
+    """
     logger.info("Kalshi Weather Scanner starting")
 
     # ── Load Kalshi credentials ──────────────────────────────────────
@@ -41,24 +48,31 @@ def _run_scan() -> int:
 
     # ── Create API clients ───────────────────────────────────────────
     from kalshi_weather.kalshi_client import KalshiClient
-    from kalshi_weather.weather_api import WeatherAPI
+    from kalshi_weather.weather_api import DEFAULT_GRIDPOINT_CACHE, WeatherAPI
 
     client = KalshiClient(
         api_key_id=api_key_id,
         private_key_path=private_key_path,
     )
-    weather = WeatherAPI()
+    weather = WeatherAPI(
+        gridpoint_cache=DEFAULT_GRIDPOINT_CACHE,
+        refresh_gridpoints=refresh_gridpoints,
+    )
 
     # ── Run full scan ────────────────────────────────────────────────
+    from kalshi_weather.candidate_cache import CandidateCache
     from kalshi_weather.runner import run_full_scan
 
+    cache = CandidateCache(candidate_cache) if candidate_cache else None
     try:
-        slate, output_dir = run_full_scan(client, weather)
+        slate, output_dir = run_full_scan(client, weather, cache=cache)
     except Exception:
         logger.exception("Full scan failed")
         return 1
     finally:
         client.close()
+        if cache is not None:
+            cache.close()
 
     logger.info(
         "Scan complete: %d PRIMARY, %d TIGHT, %d NEAR-MISS, %d REJECTED",
@@ -221,6 +235,7 @@ def _run_spike(args) -> int:
         spike_threshold_cents=args.threshold,
         window_seconds=args.window,
         poll_interval_seconds=args.interval,
+        min_poll_interval_seconds=min(args.min_interval, args.interval),
         burst_count=args.burst_count,
         burst_interval_seconds=args.burst_interval,
         start_hour_est=start_h,
@@ -279,7 +294,17 @@ def main(argv: list[str] | None = None) -> int:
     subparsers = parser.add_subparsers(dest="command")
 
     # scan subcommand (default)
-    subparsers.add_parser("scan", help="Run full Kalshi Weather Scanner pipeline")
+    scan_parser = subparsers.add_parser(
+        "scan", help="Run full Kalshi Weather Scanner pipeline",
+    )
+    scan_parser.add_argument(
+        "--candidate-cache", type=str, default=None, metavar="PATH",
+        help="SQLite file caching enriched candidates across runs (default: off)",
+    )
+    scan_parser.add_argument(
+        "--refresh-gridpoints", action="store_true",
+        help="Re-resolve cached station -> NWS gridpoint lookups",
+    )
 
     # edge subcommand
     edge_parser = subparsers.add_parser(
@@ -315,6 +340,11 @@ def main(argv: list[str] | None = None) -> int:
         "--interval", type=int, default=30,
         help="Polling interval in seconds (default: 30)",
     )
+    spike_parser.add_argument(
+        "--min-interval", type=int, default=5,
+        help="Fastest adaptive polling interval when prices move "
+             "(default: 5; set to --interval to disable)",
+    )
     spike_parser.add_argument(
         "--burst-count", type=int, default=5,
         help="Number of emails per burst (default: 5)",
@@ -340,7 +370,10 @@ def main(argv: list[str] | None = None) -> int:
 
     # Default to 'scan' if no subcommand given
     if args.command is None or args.command == "scan":
-        return _run_scan()
+        return _run_scan(
+            getattr(args, "candidate_cache", None),
+            getattr(args, "refresh_gridpoints", False),
+        )
     elif args.command == "edge":
         return _run_edge(args.city, args.watch, args.interval)
     elif args.command == "spike":
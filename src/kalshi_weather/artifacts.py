@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-import json
+import gzip
 import logging
 from pathlib import Path
 from typing import Optional
 
 from jinja2 import Template
 
-from kalshi_weather.schemas import DailySlate, UnifiedCandidate
+from kalshi_weather.schemas import DailySlate, UnifiedCandidate, dump_slate_json
 
 logger = logging.getLogger(__name__)
 
@@ -26,13 +26,18 @@ def _ensure_output_dir() -> Path:
 # ── JSON Writer ────────────────────────────────────────────────────────
 
 def write_daily_slate_json(slate: DailySlate, path: Optional[Path] = None) -> Path:
-    """Serialize DailySlate to JSON and write to disk."""
+    """Serialize DailySlate to JSON and write to disk.
+
+    A ``.gz`` path writes a gzip-compressed slate for archiving; the
+    repeated field names compress several-fold. ``load_slate`` reads both.
+    """
     out = path or _ensure_output_dir() / f"DAILY_SLATE_{slate.run_time_et[:10]}.json"
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(
-        json.dumps(slate.model_dump(mode="json"), indent=2, default=str),
-        encoding="utf-8",
-    )
+    data = dump_slate_json(slate)
+    if out.suffix == ".gz":
+        # mtime=0 keeps the archive byte-identical for identical slates.
+        data = gzip.compress(data, compresslevel=6, mtime=0)
+    out.write_bytes(data)
     return out
 
 
@@ -59,7 +64,7 @@ _REPORT_TEMPLATE = Template("""\
 | Rank | City | High/Low | Bracket | impl NO ask | best NO bid | bid room | p(NO) | Edge % | Rec Limit | Max Buy | Stake | Notes |
 |------|------|----------|---------|-------------|-------------|----------|-------|--------|-----------|---------|-------|-------|
 {% for p in slate.picks_primary -%}
-| {{ p.rank or loop.index }} | {{ p.city }} | {{ p.market_type.value }} | {{ p.bracket_definition }} | {{ ob(p).implied_best_no_ask_cents }} | {{ ob(p).best_no_bid_cents }} | {{ ob(p).bid_room_cents }} | {{ mdl_pno(p) }} | {{ edge(p) }} | {{ rec_limit(p) }} | {{ max_buy(p) }} | {{ stake(p) }} | {{ notes_short(p) }} |
+| {{ p.rank or loop.index }} | {{ p.city }} | {{ p.market_type }} | {{ p.bracket_definition }} | {{ ob(p).implied_best_no_ask_cents }} | {{ ob(p).best_no_bid_cents }} | {{ ob(p).bid_room_cents }} | {{ mdl_pno(p) }} | {{ edge(p) }} | {{ rec_limit(p) }} | {{ max_buy(p) }} | {{ stake(p) }} | {{ notes_short(p) }} |
 {% endfor -%}
 {% else %}
 _No PRIMARY picks this run._
@@ -70,7 +75,7 @@ _No PRIMARY picks this run._
 | Rank | City | High/Low | Bracket | impl NO ask | best NO bid | bid room | p(NO) | Edge % | Rec Limit | Max Buy | Stake | Notes |
 |------|------|----------|---------|-------------|-------------|----------|-------|--------|-----------|---------|-------|-------|
 {% for p in slate.picks_tight -%}
-| {{ p.rank or loop.index }} | {{ p.city }} | {{ p.market_type.value }} | {{ p.bracket_definition }} | {{ ob(p).implied_best_no_ask_cents }} | {{ ob(p).best_no_bid_cents }} | {{ ob(p).bid_room_cents }} | {{ mdl_pno(p) }} | {{ edge(p) }} | {{ rec_limit(p) }} | {{ max_buy(p) }} | {{ stake(p) }} | {{ notes_short(p) }} |
+| {{ p.rank or loop.index }} | {{ p.city }} | {{ p.market_type }} | {{ p.bracket_definition }} | {{ ob(p).implied_best_no_ask_cents }} | {{ ob(p).best_no_bid_cents }} | {{ ob(p).bid_room_cents }} | {{ mdl_pno(p) }} | {{ edge(p) }} | {{ rec_limit(p) }} | {{ max_buy(p) }} | {{ stake(p) }} | {{ notes_short(p) }} |
 {% endfor -%}
 {% else %}
 _No TIGHT picks this run._
@@ -81,7 +86,7 @@ _No TIGHT picks this run._
 | Rank | City | High/Low | Bracket | impl NO ask | best NO bid | bid room | p(NO) | Edge % | Rec Limit | Max Buy | Stake | Notes |
 |------|------|----------|---------|-------------|-------------|----------|-------|--------|-----------|---------|-------|-------|
 {% for p in slate.picks_near_miss -%}
-| {{ p.rank or loop.index }} | {{ p.city }} | {{ p.market_type.value }} | {{ p.bracket_definition }} | {{ ob(p).implied_best_no_ask_cents }} | {{ ob(p).best_no_bid_cents }} | {{ ob(p).bid_room_cents }} | {{ mdl_pno(p) }} | {{ edge(p) }} | {{ rec_limit(p) }} | {{ max_buy(p) }} | {{ stake(p) }} | {{ notes_short(p) }} |
+| {{ p.rank or loop.index }} | {{ p.city }} | {{ p.market_type }} | {{ p.bracket_definition }} | {{ ob(p).implied_best_no_ask_cents }} | {{ ob(p).best_no_bid_cents }} | {{ ob(p).bid_room_cents }} | {{ mdl_pno(p) }} | {{ edge(p) }} | {{ rec_limit(p) }} | {{ max_buy(p) }} | {{ stake(p) }} | {{ notes_short(p) }} |
 {% endfor -%}
 {% else %}
 _No near-miss candidates this run._
@@ -163,9 +168,9 @@ def _notes_short(candidate: UnifiedCandidate) -> str:
     parts = []
     if candidate.model:
         if candidate.model.lock_in_flag_if_low:
-            parts.append(f"low:{candidate.model.lock_in_flag_if_low.value}")
+            parts.append(f"low:{candidate.model.lock_in_flag_if_low}")
         if candidate.model.high_lock_in_flag:
-            parts.append(f"high:{candidate.model.high_lock_in_flag.value}")
+            parts.append(f"high:{candidate.model.high_lock_in_flag}")
         vol_hrs = candidate.model.hours_remaining_in_meaningful_volatility_window
         parts.append(f"{vol_hrs:.1f}h vol")
     if candidate.warnings:
@@ -6,13 +6,12 @@ and produces performance metrics.
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from kalshi_weather.config import DEFAULT_CONFIG, Config
-from kalshi_weather.schemas import DailySlate, UnifiedCandidate
+from kalshi_weather.schemas import DailySlate, UnifiedCandidate, load_slate
 
 logger = logging.getLogger(__name__)
 
@@ -61,8 +60,7 @@ def backtest_from_slates(
             continue
 
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            slate = DailySlate.model_validate(data)
+            slate = load_slate(path.read_bytes())
         except Exception:
             logger.warning("Failed to load slate: %s", path, exc_info=True)
             continue
@@ -0,0 +1,126 @@
+"""SQLite-backed cache of enriched candidates across scan runs.
+
+Repeated scans (e.g. a cron every few minutes) re-enrich every bracket even
+when its orderbook hasn't moved. This cache stores each enriched
+UnifiedCandidate keyed by (ticker, target date, orderbook fingerprint), so
+unchanged markets skip the weather fetches and modeling on the next run.
+Entries expire after ``max_age_seconds`` because observations go stale.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+from kalshi_weather.schemas import (
+    UNIFIED_CANDIDATE_ADAPTER,
+    CandidateRaw,
+    UnifiedCandidate,
+)
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS enriched (
+    ticker      TEXT NOT NULL,
+    target_date TEXT NOT NULL,
+    ob_hash     TEXT NOT NULL,
+    ts          REAL NOT NULL,
+    payload     BLOB NOT NULL,
+    PRIMARY KEY (ticker, target_date, ob_hash)
+)
+"""
+
+
+def orderbook_fingerprint(raw: CandidateRaw) -> str:
+    """Stable digest of a candidate's orderbook snapshot.
+
+    Python's ``hash()`` is salted per process, so it can't key a cache
+    that outlives the run.
+    """
+    data = raw.orderbook_snapshot.model_dump_json().encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class CandidateCache:
+    """Persistent {(ticker, date, orderbook) -> UnifiedCandidate} cache.
+
+    Parameters
+    ----------
+    path : SQLite database file (created if missing).
+    max_age_seconds : entries older than this are ignored and evicted.
+    max_rows : hard cap on stored rows; oldest are evicted first.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_age_seconds: float = 900.0,
+        max_rows: int = 5000,
+    ) -> None:
+        self._max_age = max_age_seconds
+        self._max_rows = max_rows
+        self._conn = sqlite3.connect(str(path))
+        # Disposable cache — durability isn't worth the journal and fsyncs.
+        self._conn.execute("PRAGMA journal_mode=OFF")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute("PRAGMA mmap_size=268435456")
+        self._conn.execute(_SCHEMA)
+        self.evict_stale()
+
+    def lookup(self, raw: CandidateRaw) -> Optional[UnifiedCandidate]:
+        """Return the cached enrichment for ``raw``, or None on a miss."""
+        row = self._conn.execute(
+            "SELECT ts, payload FROM enriched"
+            " WHERE ticker = ? AND target_date = ? AND ob_hash = ?",
+            (raw.market_ticker, raw.target_date_local, orderbook_fingerprint(raw)),
+        ).fetchone()
+        if row is None or time.time() - row[0] > self._max_age:
+            return None
+        cached = UNIFIED_CANDIDATE_ADAPTER.validate_json(row[1])
+        # Re-stamp with this run's time; everything else is unchanged.
+        return cached.model_copy(update={"run_time_et": raw.run_time_et})
+
+    def store(self, raw: CandidateRaw, candidate: UnifiedCandidate) -> None:
+        """Store a freshly enriched candidate (before bucketing/ranking)."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO enriched VALUES (?, ?, ?, ?, ?)",
+            (
+                raw.market_ticker,
+                raw.target_date_local,
+                orderbook_fingerprint(raw),
+                time.time(),
+                UNIFIED_CANDIDATE_ADAPTER.dump_json(candidate),
+            ),
+        )
+        self._conn.commit()
+
+    def evict_stale(self) -> int:
+        """Drop expired rows and enforce ``max_rows``. Returns rows removed."""
+        cur = self._conn.execute(
+            "DELETE FROM enriched WHERE ts < ?", (time.time() - self._max_age,),
+        )
+        removed = cur.rowcount
+        cur = self._conn.execute(
+            "DELETE FROM enriched WHERE rowid NOT IN"
+            " (SELECT rowid FROM enriched ORDER BY ts DESC LIMIT ?)",
+            (self._max_rows,),
+        )
+        removed += cur.rowcount
+        self._conn.commit()
+        if removed:
+            logger.debug("Evicted %d stale candidate cache rows", removed)
+        return removed
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -90,6 +90,14 @@ class RateLimitConfig:
     retry_jitter_seconds: float = 0.5
 
 
+@dataclass(frozen=True)
+class ConcurrencyConfig:
+    """Thread-pool sizes for network-bound fan-out."""
+
+    orderbook_workers: int = 8
+    enrich_workers: int = 8
+
+
 @dataclass(frozen=True)
 class Config:
     """Top-level configuration aggregating all sub-configs."""
@@ -104,6 +112,7 @@ class Config:
     schedule: RunScheduleConfig = field(default_factory=RunScheduleConfig)
     picks: PickLimitsConfig = field(default_factory=PickLimitsConfig)
     rate_limit: RateLimitConfig = field(default_factory=RateLimitConfig)
+    concurrency: ConcurrencyConfig = field(default_factory=ConcurrencyConfig)
 
 
 # Singleton default config — import this throughout the project.
@@ -279,15 +279,15 @@ def analyze_city(city: str, scraper: NWSScraper) -> Optional[EdgeReport]:
         logger.warning("City '%s' not found in station database", city)
         return None
 
-    icao = entry["station_icao"]
-    cli_code = entry["cli_issuedby"]
-    tz_str = entry["timezone"]
+    icao = entry.station_icao
+    cli_code = entry.cli_issuedby
+    tz_str = entry.timezone
     tz = ZoneInfo(tz_str)
     now_utc = datetime.now(ZoneInfo("UTC"))
     now_local = now_utc.astimezone(tz)
 
     report = EdgeReport(
-        city=entry["kalshi_city"],
+        city=entry.kalshi_city,
         station_icao=icao,
         cli_code=cli_code,
         timezone=tz_str,
@@ -417,7 +417,7 @@ def analyze_all_cities(scraper: NWSScraper) -> list[EdgeReport]:
     """Run edge analysis for all 26 cities in the station database."""
     reports: list[EdgeReport] = []
     for entry in _STATION_DB:
-        city = entry["kalshi_city"]
+        city = entry.kalshi_city
         report = analyze_city(city, scraper)
         if report is not None:
             reports.append(report)
@@ -31,6 +31,9 @@ _ALLOWED_PATH_PREFIXES = (
     "/trade-api/v2/series",
 )
 
+# Most tickers the bulk orderbook endpoint accepts per request.
+_ORDERBOOK_BATCH_SIZE = 100
+
 
 class KalshiClient:
     """Authenticated, read-only Kalshi API client.
@@ -211,3 +214,43 @@ class KalshiClient:
         params: dict[str, Any] = {"depth": depth}
         data = self._get(f"/trade-api/v2/markets/{ticker}/orderbook", params=params)
         return data
+
+    def get_orderbook_best_yes(self, ticker: str) -> Optional[int]:
+        """Best YES bid in cents for a market, or None if the YES side is empty.
+
+        Requests a single level, so the response carries just the top of
+        each side instead of the full ladder.
+        """
+        yes_bids = (self.get_orderbook(ticker, depth=1).get("orderbook") or {}).get("yes")
+        return yes_bids[-1][0] if yes_bids else None
+
+    def get_orderbooks(self, tickers: list[str], depth: int = 10) -> dict[str, dict]:
+        """Fetch orderbooks for many markets via the bulk endpoint.
+
+        Returns {ticker: response} where each response has the same
+        'orderbook' shape as :meth:`get_orderbook` at the same ``depth``.
+        Tickers the API leaves out are absent from the result. If the first
+        batch fails the error propagates, so callers can fall back to
+        per-ticker fetches; a later batch failing keeps the books already
+        fetched and leaves that batch's tickers out.
+        """
+        books: dict[str, dict] = {}
+        for i in range(0, len(tickers), _ORDERBOOK_BATCH_SIZE):
+            chunk = tickers[i:i + _ORDERBOOK_BATCH_SIZE]
+            try:
+                data = self._get(
+                    "/trade-api/v2/markets/orderbooks",
+                    params={"tickers": ",".join(chunk), "depth": depth},
+                )
+            except Exception as exc:
+                if i == 0:
+                    raise
+                logger.warning(
+                    "Bulk orderbook batch of %d tickers failed: %s", len(chunk), exc,
+                )
+                continue
+            for entry in data.get("orderbooks") or []:
+                ticker = entry.get("ticker")
+                if ticker:
+                    books[ticker] = {"orderbook": entry.get("orderbook") or {}}
+        return books
@@ -279,7 +279,7 @@ def model_candidate(
 
     # Station ICAO.
     entry = lookup_station(city)
-    station_icao = entry["station_icao"] if entry else "KNYC"
+    station_icao = entry.station_icao if entry else "KNYC"
 
     # Sunrise + peak time.
     sunrise_local = _get_sunrise(station_icao, target_date, tz_str)
@@ -149,11 +149,11 @@ def apply_stability_rules(
             if should_suppress_change(curr, prev, config):
                 logger.info(
                     "Stability: suppressing %s bucket change %s -> %s",
-                    curr.market_ticker, prev.bucket.value, curr.bucket.value,
+                    curr.market_ticker, prev.bucket, curr.bucket,
                 )
                 curr.bucket = prev.bucket
                 curr.bucket_reason = (
-                    f"Stability: kept {prev.bucket.value} "
+                    f"Stability: kept {prev.bucket} "
                     f"(change suppressed — thresholds not met)"
                 )
 
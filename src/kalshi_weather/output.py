@@ -6,14 +6,13 @@ and orchestrates writing REPORT.md and DAILY_SLATE.json.
 
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
 from typing import Optional
 
 from kalshi_weather.artifacts import write_daily_slate_json, write_report_md
 from kalshi_weather.config import DEFAULT_CONFIG, Config
-from kalshi_weather.schemas import DailySlate, ScanStats, UnifiedCandidate
+from kalshi_weather.schemas import DailySlate, ScanStats, UnifiedCandidate, load_slate
 
 logger = logging.getLogger(__name__)
 
@@ -124,7 +123,7 @@ def compute_delta(
     for ticker, curr in current_map.items():
         prev = prior_map.get(ticker)
         if prev is None:
-            notes.append(f"NEW: {ticker} appeared (bucket: {curr.bucket.value})")
+            notes.append(f"NEW: {ticker} appeared (bucket: {curr.bucket})")
             continue
 
         changes = _compare_candidates(curr, prev, min_move)
@@ -136,7 +135,7 @@ def compute_delta(
         if ticker not in current_map:
             prev = prior_map[ticker]
             notes.append(
-                f"REMOVED: {ticker} (was {prev.bucket.value})"
+                f"REMOVED: {ticker} (was {prev.bucket})"
             )
 
     # Summary stats delta.
@@ -167,7 +166,7 @@ def _compare_candidates(
     # Bucket change.
     if curr.bucket != prev.bucket:
         changes.append(
-            f"bucket {prev.bucket.value} -> {curr.bucket.value}"
+            f"bucket {prev.bucket} -> {curr.bucket}"
         )
 
     # Price movement.
@@ -236,8 +235,7 @@ def load_prior_slate(path: Path) -> Optional[DailySlate]:
     if not path.exists():
         return None
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return DailySlate.model_validate(data)
+        return load_slate(path.read_bytes())
     except Exception:
         logger.warning("Failed to load prior slate from %s", path, exc_info=True)
         return None
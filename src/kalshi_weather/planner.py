@@ -29,7 +29,7 @@ class SpreadVerdict(str, Enum):
     REJECT = "REJECT"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LiquidityAssessment:
     verdict: LiquidityVerdict
     top_of_book_depth: int
@@ -37,7 +37,7 @@ class LiquidityAssessment:
     notes: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SpreadAssessment:
     verdict: SpreadVerdict
     spread_cents: Optional[int]
@@ -46,6 +46,21 @@ class SpreadAssessment:
 
 # ── Liquidity (Task #24) ──────────────────────────────────────────────
 
+def _top_of_book(
+    cumdepth: tuple[int, ...], top3_bids: tuple[tuple[int, int], ...],
+) -> int:
+    """Best-level depth for one side of the book.
+
+    Reads the scanner's precomputed cumulative depth; snapshots built
+    without it fall back to the top-3 levels.
+    """
+    if cumdepth:
+        return cumdepth[0]
+    if top3_bids:
+        return top3_bids[0][1]
+    return 0
+
+
 def assess_liquidity(ob: OrderbookSnapshot) -> LiquidityAssessment:
     """Evaluate orderbook liquidity.
 
@@ -53,15 +68,11 @@ def assess_liquidity(ob: OrderbookSnapshot) -> LiquidityAssessment:
     - Top-of-book depth is zero (no bids at all)
     - Top-3 depth is near-zero (< 5 contracts total)
     """
-    # Top-of-book: quantity at the best bid level.
-    yes_top = ob.top3_yes_bids[0][1] if ob.top3_yes_bids else 0
-    no_top = ob.top3_no_bids[0][1] if ob.top3_no_bids else 0
-    top_of_book = yes_top + no_top
-
-    # Top-3 aggregate depth.
-    yes_depth = sum(q for _, q in ob.top3_yes_bids)
-    no_depth = sum(q for _, q in ob.top3_no_bids)
-    top3 = yes_depth + no_depth
+    top_of_book = (
+        _top_of_book(ob.yes_cumdepth, ob.top3_yes_bids)
+        + _top_of_book(ob.no_cumdepth, ob.top3_no_bids)
+    )
+    top3 = ob.depth_top3_total
 
     if top_of_book == 0:
         return LiquidityAssessment(
@@ -116,12 +127,13 @@ def assess_spread(
         )
 
     spread = ob.bid_room_cents
+    max_spread = config.spread.max_spread_cents
 
-    if spread <= config.spread.max_spread_cents:
+    if spread <= max_spread:
         return SpreadAssessment(
             verdict=SpreadVerdict.OK,
             spread_cents=spread,
-            notes=f"Spread {spread}c within limit ({config.spread.max_spread_cents}c)",
+            notes=f"Spread {spread}c within limit ({max_spread}c)",
         )
 
     # Spread is wide — check for exception.
@@ -135,7 +147,7 @@ def assess_spread(
             verdict=SpreadVerdict.WIDE_EXCEPTION,
             spread_cents=spread,
             notes=(
-                f"WIDE-SPREAD EXCEPTION: spread {spread}c > {config.spread.max_spread_cents}c "
+                f"WIDE-SPREAD EXCEPTION: spread {spread}c > {max_spread}c "
                 f"but depth is strong and edge is {model_edge_pct:.1f}%"
             ),
         )
@@ -144,7 +156,7 @@ def assess_spread(
         verdict=SpreadVerdict.REJECT,
         spread_cents=spread,
         notes=(
-            f"Spread {spread}c exceeds limit ({config.spread.max_spread_cents}c) "
+            f"Spread {spread}c exceeds limit ({max_spread}c) "
             f"without qualifying for exception"
         ),
     )
@@ -175,11 +187,14 @@ def compute_recommended_limit(
             "UNKNOWN fill probability — no ask data",
         )
 
-    room = ob.bid_room_cents if ob.bid_room_cents is not None else 0
+    room = ob.bid_room_cents
+    if room is None:
+        room = 0
 
     if room >= 2:
         # Standard case: bid 2-6c below the ask. Target midpoint.
-        improvement = min(max(room // 2, 2), 6)
+        improvement = room >> 1
+        improvement = 2 if improvement < 2 else 6 if improvement > 6 else improvement
         limit = ask - improvement
         rationale = (
             f"bid_room={room}c >= 2: improving {improvement}c below "
@@ -188,7 +203,7 @@ def compute_recommended_limit(
         fill_notes = "NORMAL fill probability"
     else:
         # Tight spread: bid 1-3c below ask.
-        improvement = min(max(1, room), 3)
+        improvement = 1 if room < 1 else 3 if room > 3 else room
         limit = ask - improvement
         rationale = (
             f"TIGHT: bid_room={room}c < 2: improving {improvement}c below "
@@ -200,63 +215,73 @@ def compute_recommended_limit(
         fill_notes = "LOW FILL PROBABILITY — improvement exceeds 6c"
 
     # Clamp to valid range.
-    limit = max(1, min(99, limit))
+    limit = 1 if limit < 1 else 99 if limit > 99 else limit
 
     return limit, rationale, fill_notes
 
 
 # ── Manual order steps (Task #27) ──────────────────────────────────────
 
+# Fixed wording shared by every plan; only the ticker/price steps vary.
+_STEP_SELECT_NO = "2. Select the NO side"
+_STEP_ORDER_TYPE = "3. Set order type to LIMIT"
+_STEP_SUBMIT = "7. Submit order"
+_STEP_WAIT = "8. Wait 5-10 minutes, then check fill status"
+
+
 def generate_manual_steps(
     market_ticker: str,
     market_url: str,
     limit_no_cents: int,
     stake_usd: Optional[float] = None,
-) -> list[str]:
+) -> tuple[str, ...]:
     """Generate human-readable manual order placement steps."""
     contracts_note = ""
     if stake_usd is not None and limit_no_cents > 0:
         max_contracts = int(stake_usd * 100 / limit_no_cents)
         contracts_note = f" ({max_contracts} contracts at {limit_no_cents}c)"
 
-    return [
+    return (
         f"1. Navigate to {market_url}",
-        "2. Select the NO side",
-        "3. Set order type to LIMIT",
+        _STEP_SELECT_NO,
+        _STEP_ORDER_TYPE,
         f"4. Set limit price to {limit_no_cents}c ($0.{limit_no_cents:02d})",
         f"5. Set quantity{contracts_note}",
         f"6. Review order summary — verify ticker is {market_ticker}",
-        "7. Submit order",
-        "8. Wait 5-10 minutes, then check fill status",
-    ]
+        _STEP_SUBMIT,
+        _STEP_WAIT,
+    )
 
 
 # ── Cancel/replace rules (Task #28) ────────────────────────────────────
 
+_RULE_HALTED = "CANCEL if market status changes to closed/halted"
+_RULE_STALE = "CANCEL if not filled within 15 minutes and edge is shrinking"
+_RULE_NO_MARKET = "NEVER place market orders — always use limits"
+
+
 def generate_cancel_replace_rules(
     limit_no_cents: int,
     implied_no_ask_cents: Optional[int],
-) -> list[str]:
+) -> tuple[str, ...]:
     """Generate conditions for when the human should cancel or revise."""
-    rules = [
+    cancel_above = (
         f"CANCEL if implied NO ask moves above {limit_no_cents + 3}c "
-        f"(edge has evaporated)",
-        "CANCEL if market status changes to closed/halted",
-        "CANCEL if not filled within 15 minutes and edge is shrinking",
-    ]
-
-    if implied_no_ask_cents is not None:
-        rules.append(
-            f"ADJUST +1c toward ask (to {limit_no_cents + 1}c) if not filled "
-            f"after 10 min and ask is still at {implied_no_ask_cents}c"
-        )
-        rules.append(
-            f"DO NOT chase above {min(limit_no_cents + 2, implied_no_ask_cents)}c"
-        )
-
-    rules.append("NEVER place market orders — always use limits")
+        f"(edge has evaporated)"
+    )
 
-    return rules
+    if implied_no_ask_cents is None:
+        return (cancel_above, _RULE_HALTED, _RULE_STALE, _RULE_NO_MARKET)
+
+    return (
+        cancel_above,
+        _RULE_HALTED,
+        _RULE_STALE,
+        f"ADJUST +1c toward ask (to {limit_no_cents + 1}c) if not filled "
+        f"after 10 min and ask is still at {implied_no_ask_cents}c",
+        f"DO NOT chase above {min(limit_no_cents + 2, implied_no_ask_cents)}c",
+        _RULE_NO_MARKET,
+    )
 
 
 # ── Full execution plan builder ────────────────────────────────────────
@@ -283,7 +308,7 @@ def build_execution_plan(
         bid_room_cents=ob.bid_room_cents,
         recommended_limit_no_cents=limit,
         limit_rationale=rationale,
-        manual_order_steps=steps,
-        cancel_replace_rules=cancel_rules,
+        manual_order_steps=list(steps),
+        cancel_replace_rules=list(cancel_rules),
         fill_probability_notes=fill_notes,
     )
@@ -8,7 +8,9 @@ from __future__ import annotations
 
 import logging
 import random
+import threading
 import time
+from functools import lru_cache
 from typing import Optional
 
 import httpx
@@ -18,26 +20,70 @@ from kalshi_weather.config import DEFAULT_CONFIG, RateLimitConfig
 logger = logging.getLogger(__name__)
 
 # HTTP status codes that warrant a retry.
-_RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Transport errors that are always retryable (timeouts, connection failures).
+_RETRYABLE_TRANSPORT_ERRORS = (httpx.TimeoutException, httpx.ConnectError)
+
+# Concrete classes httpx actually raises — exact-type hits skip the MRO walk.
+_RETRYABLE_EXACT_TYPES = frozenset({
+    httpx.TimeoutException,
+    httpx.ConnectTimeout,
+    httpx.ReadTimeout,
+    httpx.WriteTimeout,
+    httpx.PoolTimeout,
+    httpx.ConnectError,
+})
+
+# Bound once — wait() reads the clock on every HTTP request.
+_monotonic = time.monotonic
+
+# Per-thread RNG for retry jitter, so concurrent retries don't contend on
+# the module-level random instance.
+_tls = threading.local()
+
+
+def _rng() -> random.Random:
+    """Return this thread's jitter RNG, creating it on first use."""
+    r = getattr(_tls, "rng", None)
+    if r is None:
+        r = _tls.rng = random.Random()
+    return r
 
 
 class RateLimiter:
-    """Token-bucket rate limiter for API requests."""
+    """Token-bucket rate limiter for API requests.
+
+    Thread-safe: concurrent callers are handed successive slots.
+    """
 
     def __init__(self, requests_per_second: float) -> None:
         self._min_interval = 1.0 / requests_per_second if requests_per_second > 0 else 0
         self._last_request_time: float = 0.0
+        self._lock = threading.Lock()
 
     def wait(self) -> None:
         """Block until we're allowed to make the next request."""
         if self._min_interval <= 0:
             return
-        now = time.monotonic()
-        elapsed = now - self._last_request_time
-        if elapsed < self._min_interval:
-            sleep_time = self._min_interval - elapsed
+        with self._lock:
+            now = _monotonic()
+            # Reserve the next slot rather than re-reading the clock after
+            # sleeping, so oversleeping doesn't push later requests back.
+            slot = self._last_request_time + self._min_interval
+            if slot < now:
+                slot = now
+            self._last_request_time = slot
+        # Sleep outside the lock so other threads can queue their slots.
+        sleep_time = slot - now
+        if sleep_time > 0:
             time.sleep(sleep_time)
-        self._last_request_time = time.monotonic()
+
+
+@lru_cache(maxsize=8)
+def _backoff_table(base: float, max_delay: float, n: int) -> tuple[float, ...]:
+    """Capped base delays for attempts 0..n-1: min(base * 2^i, max_delay)."""
+    return tuple(min(base * (1 << i), max_delay) for i in range(n))
 
 
 def compute_backoff_delay(
@@ -48,20 +94,27 @@ def compute_backoff_delay(
 
     delay = min(base * 2^attempt + jitter, max_delay)
     """
-    base = config.retry_base_delay_seconds * (2 ** attempt)
-    jitter = random.uniform(0, config.retry_jitter_seconds)
-    return min(base + jitter, config.retry_max_delay_seconds)
+    max_delay = config.retry_max_delay_seconds
+    table = _backoff_table(
+        config.retry_base_delay_seconds, max_delay, config.retry_max_attempts,
+    )
+    if attempt < len(table):
+        base = table[attempt]
+    else:
+        base = min(config.retry_base_delay_seconds * (1 << attempt), max_delay)
+    jitter = _rng().random() * config.retry_jitter_seconds
+    return min(base + jitter, max_delay)
 
 
 def is_retryable_error(exc: Exception) -> bool:
     """Check if an exception is retryable (transient)."""
-    if isinstance(exc, httpx.TimeoutException):
-        return True
-    if isinstance(exc, httpx.ConnectError):
-        return True
+    # Status errors (429/5xx) are the common retry case — check them first.
     if isinstance(exc, httpx.HTTPStatusError):
-        return exc.response.status_code in _RETRYABLE_STATUS_CODES
-    return False
+        response = getattr(exc, "response", None)
+        return response is not None and response.status_code in _RETRYABLE_STATUS_CODES
+    if type(exc) in _RETRYABLE_EXACT_TYPES:
+        return True
+    return isinstance(exc, _RETRYABLE_TRANSPORT_ERRORS)
 
 
 def request_with_retry(
@@ -95,25 +148,30 @@ def request_with_retry(
     The last exception if all retries are exhausted.
     """
     last_exc: Optional[Exception] = None
+    max_attempts = config.retry_max_attempts
+    last_attempt = max_attempts - 1
+    do_wait = rate_limiter.wait if rate_limiter is not None else None
+    do_request = client.request
 
-    for attempt in range(config.retry_max_attempts):
-        if rate_limiter is not None:
-            rate_limiter.wait()
+    for attempt in range(max_attempts):
+        if do_wait is not None:
+            do_wait()
 
         try:
-            resp = client.request(method, url, headers=headers, params=params)
+            resp = do_request(method, url, headers=headers, params=params)
             resp.raise_for_status()
             return resp
         except Exception as exc:
             last_exc = exc
-            if not is_retryable_error(exc) or attempt >= config.retry_max_attempts - 1:
+            if not is_retryable_error(exc) or attempt >= last_attempt:
                 raise
 
             delay = compute_backoff_delay(attempt, config)
-            logger.warning(
-                "Request to %s failed (attempt %d/%d): %s — retrying in %.1fs",
-                url, attempt + 1, config.retry_max_attempts, exc, delay,
-            )
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "Request to %s failed (attempt %d/%d): %r - retrying in %.1fs",
+                    url, attempt + 1, max_attempts, exc, delay,
+                )
             time.sleep(delay)
 
     raise last_exc  # type: ignore[misc]  # pragma: no cover
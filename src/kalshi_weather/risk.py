@@ -7,7 +7,11 @@ bankroll across picks, and aggregates risk flags.
 from __future__ import annotations
 
 import logging
-from collections import Counter
+import re
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Sequence
 
 from kalshi_weather.config import DEFAULT_CONFIG, Config
 from kalshi_weather.schemas import (
@@ -79,45 +83,81 @@ METRO_CLUSTERS: dict[str, list[str]] = {
     "NorCal": ["San Francisco", "SF"],
 }
 
-# Precompute reverse lookups.
-_CITY_TO_CORR_GROUP: dict[str, str] = {}
-for _group, _cities in CORRELATION_GROUPS.items():
-    for _city in _cities:
-        _CITY_TO_CORR_GROUP[_city.lower()] = _group
 
-_CITY_TO_METRO: dict[str, str] = {}
-for _cluster, _cities in METRO_CLUSTERS.items():
-    for _city in _cities:
-        _CITY_TO_METRO[_city.lower()] = _cluster
+def _normalize_city(city: str) -> str:
+    """Canonical lookup key for a city name."""
+    return city.strip().lower()
+
+
+def _build_alias_index(groups: dict[str, list[str]]) -> MappingProxyType[str, str]:
+    """Flatten {group: [city, alias, ...]} into a read-only {key: group} map.
+
+    Every alias is inserted as an exact key at import time so lookups are a
+    single dict probe — add new spellings to the group lists above.
+    """
+    index: dict[str, str] = {}
+    for group, cities in groups.items():
+        # Interned so every lookup hands back the same object, and the
+        # downstream count-dict probes short-circuit on identity.
+        group = sys.intern(group)
+        for city in cities:
+            index[sys.intern(_normalize_city(city))] = group
+    return MappingProxyType(index)
+
+
+# Aliases shorter than this are too ambiguous to match inside a longer name.
+_MIN_FALLBACK_ALIAS_LEN = 4
+
+
+def _build_alias_scanner(index: MappingProxyType[str, str]) -> re.Pattern[str]:
+    """Compile every fallback-eligible alias into one alternation.
 
+    Longest aliases come first so the leftmost match is also the most
+    specific; a miss is then resolved in a single scan of the input.
+    """
+    aliases = sorted(
+        (k for k in index if len(k) >= _MIN_FALLBACK_ALIAS_LEN), key=len, reverse=True,
+    )
+    return re.compile("|".join(map(re.escape, aliases)))
 
-def _safe_substring_match(key: str, candidate: str) -> bool:
-    """Substring match that requires at least 4 chars to avoid false positives."""
-    if len(candidate) < 4 or len(key) < 4:
-        return False
-    return candidate in key or key in candidate
 
+def _resolve_alias(
+    index: MappingProxyType[str, str],
+    scanner: re.Pattern[str],
+    city: str,
+    default: str,
+) -> str:
+    key = _normalize_city(city)
+    group = index.get(key)
+    if group is not None:
+        return group
+    # Unlisted spelling (e.g. "Chicago O'Hare") — look for a known alias inside it.
+    if len(key) >= _MIN_FALLBACK_ALIAS_LEN:
+        m = scanner.search(key)
+        if m is not None:
+            return index[m.group()]
+    return default
 
+
+# Precompute reverse lookups.
+_CITY_TO_CORR_GROUP = _build_alias_index(CORRELATION_GROUPS)
+_CITY_TO_METRO = _build_alias_index(METRO_CLUSTERS)
+_CORR_ALIAS_SCANNER = _build_alias_scanner(_CITY_TO_CORR_GROUP)
+_METRO_ALIAS_SCANNER = _build_alias_scanner(_CITY_TO_METRO)
+_NO_CORR_GROUP = sys.intern("Other")
+_NO_METRO = sys.intern("Standalone")
+
+
+@lru_cache(maxsize=512)
 def get_correlation_group(city: str) -> str:
     """Return the correlation group for a city, or 'Other'."""
-    key = city.strip().lower()
-    if key in _CITY_TO_CORR_GROUP:
-        return _CITY_TO_CORR_GROUP[key]
-    for k, v in _CITY_TO_CORR_GROUP.items():
-        if _safe_substring_match(key, k):
-            return v
-    return "Other"
+    return _resolve_alias(_CITY_TO_CORR_GROUP, _CORR_ALIAS_SCANNER, city, _NO_CORR_GROUP)
 
 
+@lru_cache(maxsize=512)
 def get_metro_cluster(city: str) -> str:
     """Return the metro cluster for a city, or 'Standalone'."""
-    key = city.strip().lower()
-    if key in _CITY_TO_METRO:
-        return _CITY_TO_METRO[key]
-    for k, v in _CITY_TO_METRO.items():
-        if _safe_substring_match(key, k):
-            return v
-    return "Standalone"
+    return _resolve_alias(_CITY_TO_METRO, _METRO_ALIAS_SCANNER, city, _NO_METRO)
 
 
 # ── Correlation caps (Task #30) ────────────────────────────────────────
@@ -140,38 +180,46 @@ def enforce_correlation_caps(
     max_corr = config.correlation.max_picks_per_correlation_group
     max_metro = config.correlation.max_picks_per_metro_cluster
 
-    # Sort by rank_score descending (best first).
-    sorted_picks = sorted(picks, key=lambda p: p.get("rank_score", 0), reverse=True)
+    # Resolve groups once, then walk pick indices by rank_score descending
+    # (best first) so the pick dicts themselves are never re-sorted.
+    cities = [p.get("city", "") for p in picks]
+    groups = [get_correlation_group(c) for c in cities]
+    metros = [get_metro_cluster(c) for c in cities]
+    order = sorted(
+        range(len(picks)), key=lambda i: picks[i].get("rank_score", 0), reverse=True,
+    )
 
-    corr_counts: Counter = Counter()
-    metro_counts: Counter = Counter()
+    corr_counts: dict[str, int] = {}
+    metro_counts: dict[str, int] = {}
     kept: list[dict] = []
-    rejected: list[NoTradeEntry] = []
-
-    for pick in sorted_picks:
-        city = pick.get("city", "")
-        ticker = pick.get("market_ticker", "")
-        corr_group = get_correlation_group(city)
-        metro = get_metro_cluster(city)
-
-        if corr_counts[corr_group] >= max_corr:
-            rejected.append(NoTradeEntry(
-                market_ticker=ticker,
-                reason=f"Correlation cap: {corr_group} already has {max_corr} picks",
+    # (ticker, reason) pairs — NoTradeEntry models are built once at the end.
+    dropped: list[tuple[str, str]] = []
+
+    for i in order:
+        corr_group = groups[i]
+        metro = metros[i]
+
+        corr_n = corr_counts.get(corr_group, 0)
+        if corr_n >= max_corr:
+            dropped.append((
+                picks[i].get("market_ticker", ""),
+                f"Correlation cap: {corr_group} already has {max_corr} picks",
             ))
             continue
 
-        if metro_counts[metro] >= max_metro:
-            rejected.append(NoTradeEntry(
-                market_ticker=ticker,
-                reason=f"Metro cap: {metro} already has {max_metro} picks",
+        metro_n = metro_counts.get(metro, 0)
+        if metro_n >= max_metro:
+            dropped.append((
+                picks[i].get("market_ticker", ""),
+                f"Metro cap: {metro} already has {max_metro} picks",
             ))
             continue
 
-        corr_counts[corr_group] += 1
-        metro_counts[metro] += 1
-        kept.append(pick)
+        corr_counts[corr_group] = corr_n + 1
+        metro_counts[metro] = metro_n + 1
+        kept.append(picks[i])
 
+    rejected = [NoTradeEntry(market_ticker=t, reason=r) for t, r in dropped]
     return kept, rejected
 
 
@@ -199,16 +247,19 @@ def allocate_stakes(
     if not picks:
         return picks
 
-    bankroll = config.bankroll.total_usd
-    n = len(picks)
-    base_stake = bankroll / n
+    # Work in integer cents and basis points so stakes are exact; only
+    # convert back to dollars when writing the pick.
+    bankroll_cents = round(config.bankroll.total_usd * 100)
+    denom = len(picks) * 10_000
+    half = denom // 2
 
     for pick in picks:
-        risk_mult = pick.get("risk_multiplier", 1.0)
-        stake = round(base_stake * risk_mult, 2)
-        stake = max(0.01, min(stake, bankroll))  # Clamp.
+        mult_bp = round(pick.get("risk_multiplier", 1.0) * 10_000)
+        stake_cents = (bankroll_cents * mult_bp + half) // denom
+        stake_cents = max(1, min(stake_cents, bankroll_cents))  # Clamp.
 
         # Max loss = stake (we lose the entire buy if NO doesn't hit).
+        stake = stake_cents / 100
         pick["suggested_stake_usd"] = stake
         pick["max_loss_usd"] = stake
 
@@ -217,16 +268,21 @@ def allocate_stakes(
 
 # ── Risk flag aggregation (Task #32) ───────────────────────────────────
 
-def compute_risk_multiplier(
+def _hours_bucket(hours_vol_remaining: float) -> int:
+    """0 = window closing (< 1h), 2 = long window (> 8h), 1 = otherwise."""
+    if hours_vol_remaining < 1:
+        return 0
+    if hours_vol_remaining > 8:
+        return 2
+    return 1
+
+
+def _risk_multiplier_for(
     uncertainty: UncertaintyLevel,
     knife_edge: KnifeEdgeRisk,
-    hours_vol_remaining: float,
-    liquidity_thin: bool = False,
+    hours_bucket: int,
+    liquidity_thin: bool,
 ) -> float:
-    """Compute a 0-1 risk multiplier for stake sizing.
-
-    1.0 = full allocation, lower = reduced allocation.
-    """
     mult = 1.0
 
     if uncertainty == UncertaintyLevel.HIGH:
@@ -239,9 +295,9 @@ def compute_risk_multiplier(
     elif knife_edge == KnifeEdgeRisk.MED:
         mult *= 0.7
 
-    if hours_vol_remaining < 1:
+    if hours_bucket == 0:
         mult *= 1.0  # Locked in — actually safer.
-    elif hours_vol_remaining > 8:
+    elif hours_bucket == 2:
         mult *= 0.8  # Still very uncertain.
 
     if liquidity_thin:
@@ -250,44 +306,68 @@ def compute_risk_multiplier(
     return round(max(0.1, mult), 2)
 
 
+# Every input combination is a small finite set (3 x 3 x 3 x 2), so the
+# multiplier is precomputed once and looked up per candidate.
+_RISK_MULT_TABLE: MappingProxyType[tuple, float] = MappingProxyType({
+    (u, k, h, thin): _risk_multiplier_for(u, k, h, thin)
+    for u in UncertaintyLevel
+    for k in KnifeEdgeRisk
+    for h in (0, 1, 2)
+    for thin in (False, True)
+})
+
+
+def compute_risk_multiplier(
+    uncertainty: UncertaintyLevel,
+    knife_edge: KnifeEdgeRisk,
+    hours_vol_remaining: float,
+    liquidity_thin: bool = False,
+) -> float:
+    """Compute a 0-1 risk multiplier for stake sizing.
+
+    1.0 = full allocation, lower = reduced allocation.
+    """
+    key = (uncertainty, knife_edge, _hours_bucket(hours_vol_remaining), bool(liquidity_thin))
+    mult = _RISK_MULT_TABLE.get(key)
+    if mult is None:
+        mult = _risk_multiplier_for(*key)
+    return mult
+
+
+# (flag, predicate(model, accounting, liquidity_thin, spread_wide)) in the
+# order flags are reported.
+_RISK_FLAG_TABLE: tuple[
+    tuple[str, Callable[[ModelOutput, Accounting, bool, bool], bool]], ...
+] = (
+    ("HIGH_UNCERTAINTY", lambda m, a, thin, wide: m.uncertainty_level == UncertaintyLevel.HIGH),
+    ("KNIFE_EDGE_HIGH", lambda m, a, thin, wide: m.knife_edge_risk == KnifeEdgeRisk.HIGH),
+    ("KNIFE_EDGE_MED", lambda m, a, thin, wide: m.knife_edge_risk == KnifeEdgeRisk.MED),
+    ("LOW_TEMP_LOCKING", lambda m, a, thin, wide: m.lock_in_flag_if_low == "LOCKING"),
+    ("HIGH_TEMP_LOCKING", lambda m, a, thin, wide: m.high_lock_in_flag == "LOCKING"),
+    ("LONG_VOL_WINDOW", lambda m, a, thin, wide: (
+        m.hours_remaining_in_meaningful_volatility_window > 8
+    )),
+    ("VOL_WINDOW_CLOSING", lambda m, a, thin, wide: (
+        m.hours_remaining_in_meaningful_volatility_window < 1
+    )),
+    ("THIN_LIQUIDITY", lambda m, a, thin, wide: thin),
+    ("WIDE_SPREAD", lambda m, a, thin, wide: wide),
+    ("NEGATIVE_EV", lambda m, a, thin, wide: bool(a.no_trade_reason_if_any)),
+    ("MINIMAL_EDGE", lambda m, a, thin, wide: a.edge_vs_implied_pct < 1.0),
+)
+
+
 def aggregate_risk_flags(
     model: ModelOutput,
     accounting: Accounting,
     liquidity_thin: bool = False,
     spread_wide: bool = False,
-) -> list[str]:
+) -> tuple[str, ...]:
     """Collect all risk flags for a candidate."""
-    flags: list[str] = []
-
-    if model.uncertainty_level == UncertaintyLevel.HIGH:
-        flags.append("HIGH_UNCERTAINTY")
-    if model.knife_edge_risk == KnifeEdgeRisk.HIGH:
-        flags.append("KNIFE_EDGE_HIGH")
-    if model.knife_edge_risk == KnifeEdgeRisk.MED:
-        flags.append("KNIFE_EDGE_MED")
-
-    if model.lock_in_flag_if_low and model.lock_in_flag_if_low.value == "LOCKING":
-        flags.append("LOW_TEMP_LOCKING")
-    if model.high_lock_in_flag and model.high_lock_in_flag.value == "LOCKING":
-        flags.append("HIGH_TEMP_LOCKING")
-
-    if model.hours_remaining_in_meaningful_volatility_window > 8:
-        flags.append("LONG_VOL_WINDOW")
-    if model.hours_remaining_in_meaningful_volatility_window < 1:
-        flags.append("VOL_WINDOW_CLOSING")
-
-    if liquidity_thin:
-        flags.append("THIN_LIQUIDITY")
-    if spread_wide:
-        flags.append("WIDE_SPREAD")
-
-    if accounting.no_trade_reason_if_any:
-        flags.append("NEGATIVE_EV")
-
-    if accounting.edge_vs_implied_pct < 1.0:
-        flags.append("MINIMAL_EDGE")
-
-    return flags
+    return tuple(
+        flag for flag, cond in _RISK_FLAG_TABLE
+        if cond(model, accounting, liquidity_thin, spread_wide)
+    )
 
 
 def build_risk_recommendation(
@@ -317,14 +397,6 @@ def build_risk_recommendation(
     base_stake = config.bankroll.total_usd * risk_mult / 10  # assume ~10 picks
     base_stake = round(max(0.01, base_stake), 2)
 
-    notes: list[str] = []
-    if risk_mult < 0.5:
-        notes.append(f"Heavily reduced stake (risk_mult={risk_mult})")
-    if "NEGATIVE_EV" in flags:
-        notes.append("NO TRADE — negative EV")
-    if "KNIFE_EDGE_HIGH" in flags and "HIGH_UNCERTAINTY" in flags:
-        notes.append("REJECT — knife-edge + high uncertainty combo")
-
     return RiskRecommendation(
         market_ticker=market_ticker,
         suggested_stake_usd=base_stake,
@@ -332,5 +404,17 @@ def build_risk_recommendation(
         risk_flags=flags,
         correlation_group=corr_group,
         metro_cluster=metro,
-        risk_notes=notes,
+        risk_notes=_risk_notes(risk_mult, flags),
     )
+
+
+def _risk_notes(risk_mult: float, flags: Sequence[str]) -> tuple[str, ...]:
+    notes: list[str] = []
+    if risk_mult < 0.5:
+        notes.append(f"Heavily reduced stake (risk_mult={risk_mult})")
+    if "NEGATIVE_EV" in flags:
+        notes.append("NO TRADE — negative EV")
+    if "KNIFE_EDGE_HIGH" in flags and "HIGH_UNCERTAINTY" in flags:
+        notes.append("REJECT — knife-edge + high uncertainty combo")
+    return tuple(notes)
+
@@ -7,8 +7,11 @@ computes mapping confidence, and flags special risks.
 from __future__ import annotations
 
 import logging
+import re
+import sys
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import cache, lru_cache
+from typing import NamedTuple, Optional
 from zoneinfo import ZoneInfo
 
 from kalshi_weather.schemas import MappingConfidence, MarketType, SettlementSpec
@@ -27,6 +30,7 @@ _CLI_URL = (
 #
 # Fields:
 #   kalshi_city     — city name as it appears in Kalshi event titles
+#   aliases         — other spellings that map to the same station
 #   station_icao    — ICAO station code used for METAR / observation
 #   cli_issuedby    — 3-letter code for NWS CLI product (?issuedby=XXX)
 #   timezone        — IANA timezone (for local standard time logic)
@@ -35,319 +39,407 @@ _CLI_URL = (
 #   confidence      — mapping confidence (HIGH if confirmed via Kalshi rules + CLI)
 #   notes           — any special considerations
 
-_STATION_DB: list[dict] = [
-    {
-        "kalshi_city": "New York",
-        "aliases": ["NYC", "New York City"],
-        "station_icao": "KNYC",
-        "cli_issuedby": "NYC",
-        "timezone": "America/New_York",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["Central Park observation site"],
-    },
-    {
-        "kalshi_city": "Chicago",
-        "aliases": [],
-        "station_icao": "KMDW",
-        "cli_issuedby": "MDW",
-        "timezone": "America/Chicago",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["Midway Airport; some Kalshi markets may use KORD (O'Hare)"],
-    },
-    {
-        "kalshi_city": "Miami",
-        "aliases": [],
-        "station_icao": "KMIA",
-        "cli_issuedby": "MIA",
-        "timezone": "America/New_York",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["Miami International Airport"],
-    },
-    {
-        "kalshi_city": "Austin",
-        "aliases": [],
-        "station_icao": "KAUS",
-        "cli_issuedby": "AUS",
-        "timezone": "America/Chicago",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["Austin-Bergstrom International Airport"],
-    },
-    {
-        "kalshi_city": "Los Angeles",
-        "aliases": ["LA"],
-        "station_icao": "KLAX",
-        "cli_issuedby": "LAX",
-        "timezone": "America/Los_Angeles",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["LAX airport observation"],
-    },
-    {
-        "kalshi_city": "Denver",
-        "aliases": [],
-        "station_icao": "KDEN",
-        "cli_issuedby": "DEN",
-        "timezone": "America/Denver",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["Denver International Airport"],
-    },
-    {
-        "kalshi_city": "Las Vegas",
-        "aliases": [],
-        "station_icao": "KLAS",
-        "cli_issuedby": "LAS",
-        "timezone": "America/Los_Angeles",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["Harry Reid International Airport"],
-    },
-    {
-        "kalshi_city": "Seattle",
-        "aliases": [],
-        "station_icao": "KSEA",
-        "cli_issuedby": "SEA",
-        "timezone": "America/Los_Angeles",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["Seattle-Tacoma International Airport"],
-    },
-    {
-        "kalshi_city": "Atlanta",
-        "aliases": [],
-        "station_icao": "KATL",
-        "cli_issuedby": "ATL",
-        "timezone": "America/New_York",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["Hartsfield-Jackson Atlanta International Airport"],
-    },
-    {
-        "kalshi_city": "Boston",
-        "aliases": [],
-        "station_icao": "KBOS",
-        "cli_issuedby": "BOS",
-        "timezone": "America/New_York",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["Logan International Airport"],
-    },
-    {
-        "kalshi_city": "Charlotte",
-        "aliases": [],
-        "station_icao": "KCLT",
-        "cli_issuedby": "CLT",
-        "timezone": "America/New_York",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["Charlotte Douglas International Airport"],
-    },
-    {
-        "kalshi_city": "Dallas",
-        "aliases": ["Dallas-Fort Worth", "DFW"],
-        "station_icao": "KDFW",
-        "cli_issuedby": "DFW",
-        "timezone": "America/Chicago",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["Dallas/Fort Worth International Airport"],
-    },
-    {
-        "kalshi_city": "Detroit",
-        "aliases": [],
-        "station_icao": "KDTW",
-        "cli_issuedby": "DTW",
-        "timezone": "America/Detroit",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["Detroit Metropolitan Airport"],
-    },
-    {
-        "kalshi_city": "Houston",
-        "aliases": [],
-        "station_icao": "KHOU",
-        "cli_issuedby": "HOU",
-        "timezone": "America/Chicago",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["William P. Hobby Airport"],
-    },
-    {
-        "kalshi_city": "Jacksonville",
-        "aliases": [],
-        "station_icao": "KJAX",
-        "cli_issuedby": "JAX",
-        "timezone": "America/New_York",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["Jacksonville International Airport"],
-    },
-    {
-        "kalshi_city": "Minneapolis",
-        "aliases": [],
-        "station_icao": "KMSP",
-        "cli_issuedby": "MSP",
-        "timezone": "America/Chicago",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["Minneapolis-Saint Paul International Airport"],
-    },
-    {
-        "kalshi_city": "Nashville",
-        "aliases": [],
-        "station_icao": "KBNA",
-        "cli_issuedby": "BNA",
-        "timezone": "America/Chicago",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["Nashville International Airport"],
-    },
-    {
-        "kalshi_city": "New Orleans",
-        "aliases": [],
-        "station_icao": "KMSY",
-        "cli_issuedby": "MSY",
-        "timezone": "America/Chicago",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["Louis Armstrong New Orleans International Airport"],
-    },
-    {
-        "kalshi_city": "Oklahoma City",
-        "aliases": ["OKC"],
-        "station_icao": "KOKC",
-        "cli_issuedby": "OKC",
-        "timezone": "America/Chicago",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["Will Rogers World Airport"],
-    },
-    {
-        "kalshi_city": "Philadelphia",
-        "aliases": ["Philly"],
-        "station_icao": "KPHL",
-        "cli_issuedby": "PHL",
-        "timezone": "America/New_York",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["Philadelphia International Airport"],
-    },
-    {
-        "kalshi_city": "Phoenix",
-        "aliases": [],
-        "station_icao": "KPHX",
-        "cli_issuedby": "PHX",
-        "timezone": "America/Phoenix",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["Phoenix Sky Harbor; Arizona does not observe DST"],
-    },
-    {
-        "kalshi_city": "San Antonio",
-        "aliases": [],
-        "station_icao": "KSAT",
-        "cli_issuedby": "SAT",
-        "timezone": "America/Chicago",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["San Antonio International Airport"],
-    },
-    {
-        "kalshi_city": "San Francisco",
-        "aliases": ["SF"],
-        "station_icao": "KSFO",
-        "cli_issuedby": "SFO",
-        "timezone": "America/Los_Angeles",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["San Francisco International Airport"],
-    },
-    {
-        "kalshi_city": "Tampa",
-        "aliases": [],
-        "station_icao": "KTPA",
-        "cli_issuedby": "TPA",
-        "timezone": "America/New_York",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["Tampa International Airport"],
-    },
-    {
-        "kalshi_city": "Washington",
-        "aliases": ["Washington D.C.", "DC", "Washington DC"],
-        "station_icao": "KDCA",
-        "cli_issuedby": "DCA",
-        "timezone": "America/New_York",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.HIGH,
-        "notes": ["Reagan National Airport"],
-    },
-    {
-        "kalshi_city": "LaGuardia",
-        "aliases": ["LGA"],
-        "station_icao": "KLGA",
-        "cli_issuedby": "LGA",
-        "timezone": "America/New_York",
-        "cli_field_high": "MAXIMUM TEMPERATURE",
-        "cli_field_low": "MINIMUM TEMPERATURE",
-        "confidence": MappingConfidence.MED,
-        "notes": [
+
+class Station(NamedTuple):
+    """One row of the station database."""
+
+    kalshi_city: str
+    aliases: tuple[str, ...]
+    station_icao: str
+    cli_issuedby: str
+    timezone: str
+    cli_field_high: str
+    cli_field_low: str
+    confidence: MappingConfidence
+    notes: tuple[str, ...]
+
+
+# Every station reads the same two CLI fields — share one string object each.
+_HIGH_FIELD = sys.intern("MAXIMUM TEMPERATURE")
+_LOW_FIELD = sys.intern("MINIMUM TEMPERATURE")
+
+_STATION_DB: tuple[Station, ...] = (
+    Station(
+        kalshi_city="New York",
+        aliases=("NYC", "New York City"),
+        station_icao="KNYC",
+        cli_issuedby="NYC",
+        timezone="America/New_York",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("Central Park observation site",),
+    ),
+    Station(
+        kalshi_city="Chicago",
+        aliases=(),
+        station_icao="KMDW",
+        cli_issuedby="MDW",
+        timezone="America/Chicago",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("Midway Airport; some Kalshi markets may use KORD (O'Hare)",),
+    ),
+    Station(
+        kalshi_city="Miami",
+        aliases=(),
+        station_icao="KMIA",
+        cli_issuedby="MIA",
+        timezone="America/New_York",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("Miami International Airport",),
+    ),
+    Station(
+        kalshi_city="Austin",
+        aliases=(),
+        station_icao="KAUS",
+        cli_issuedby="AUS",
+        timezone="America/Chicago",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("Austin-Bergstrom International Airport",),
+    ),
+    Station(
+        kalshi_city="Los Angeles",
+        aliases=("LA",),
+        station_icao="KLAX",
+        cli_issuedby="LAX",
+        timezone="America/Los_Angeles",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("LAX airport observation",),
+    ),
+    Station(
+        kalshi_city="Denver",
+        aliases=(),
+        station_icao="KDEN",
+        cli_issuedby="DEN",
+        timezone="America/Denver",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("Denver International Airport",),
+    ),
+    Station(
+        kalshi_city="Las Vegas",
+        aliases=(),
+        station_icao="KLAS",
+        cli_issuedby="LAS",
+        timezone="America/Los_Angeles",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("Harry Reid International Airport",),
+    ),
+    Station(
+        kalshi_city="Seattle",
+        aliases=(),
+        station_icao="KSEA",
+        cli_issuedby="SEA",
+        timezone="America/Los_Angeles",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("Seattle-Tacoma International Airport",),
+    ),
+    Station(
+        kalshi_city="Atlanta",
+        aliases=(),
+        station_icao="KATL",
+        cli_issuedby="ATL",
+        timezone="America/New_York",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("Hartsfield-Jackson Atlanta International Airport",),
+    ),
+    Station(
+        kalshi_city="Boston",
+        aliases=(),
+        station_icao="KBOS",
+        cli_issuedby="BOS",
+        timezone="America/New_York",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("Logan International Airport",),
+    ),
+    Station(
+        kalshi_city="Charlotte",
+        aliases=(),
+        station_icao="KCLT",
+        cli_issuedby="CLT",
+        timezone="America/New_York",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("Charlotte Douglas International Airport",),
+    ),
+    Station(
+        kalshi_city="Dallas",
+        aliases=("Dallas-Fort Worth", "DFW"),
+        station_icao="KDFW",
+        cli_issuedby="DFW",
+        timezone="America/Chicago",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("Dallas/Fort Worth International Airport",),
+    ),
+    Station(
+        kalshi_city="Detroit",
+        aliases=(),
+        station_icao="KDTW",
+        cli_issuedby="DTW",
+        timezone="America/Detroit",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("Detroit Metropolitan Airport",),
+    ),
+    Station(
+        kalshi_city="Houston",
+        aliases=(),
+        station_icao="KHOU",
+        cli_issuedby="HOU",
+        timezone="America/Chicago",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("William P. Hobby Airport",),
+    ),
+    Station(
+        kalshi_city="Jacksonville",
+        aliases=(),
+        station_icao="KJAX",
+        cli_issuedby="JAX",
+        timezone="America/New_York",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("Jacksonville International Airport",),
+    ),
+    Station(
+        kalshi_city="Minneapolis",
+        aliases=(),
+        station_icao="KMSP",
+        cli_issuedby="MSP",
+        timezone="America/Chicago",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("Minneapolis-Saint Paul International Airport",),
+    ),
+    Station(
+        kalshi_city="Nashville",
+        aliases=(),
+        station_icao="KBNA",
+        cli_issuedby="BNA",
+        timezone="America/Chicago",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("Nashville International Airport",),
+    ),
+    Station(
+        kalshi_city="New Orleans",
+        aliases=(),
+        station_icao="KMSY",
+        cli_issuedby="MSY",
+        timezone="America/Chicago",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("Louis Armstrong New Orleans International Airport",),
+    ),
+    Station(
+        kalshi_city="Oklahoma City",
+        aliases=("OKC",),
+        station_icao="KOKC",
+        cli_issuedby="OKC",
+        timezone="America/Chicago",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("Will Rogers World Airport",),
+    ),
+    Station(
+        kalshi_city="Philadelphia",
+        aliases=("Philly",),
+        station_icao="KPHL",
+        cli_issuedby="PHL",
+        timezone="America/New_York",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("Philadelphia International Airport",),
+    ),
+    Station(
+        kalshi_city="Phoenix",
+        aliases=(),
+        station_icao="KPHX",
+        cli_issuedby="PHX",
+        timezone="America/Phoenix",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("Phoenix Sky Harbor; Arizona does not observe DST",),
+    ),
+    Station(
+        kalshi_city="San Antonio",
+        aliases=(),
+        station_icao="KSAT",
+        cli_issuedby="SAT",
+        timezone="America/Chicago",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("San Antonio International Airport",),
+    ),
+    Station(
+        kalshi_city="San Francisco",
+        aliases=("SF",),
+        station_icao="KSFO",
+        cli_issuedby="SFO",
+        timezone="America/Los_Angeles",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("San Francisco International Airport",),
+    ),
+    Station(
+        kalshi_city="Tampa",
+        aliases=(),
+        station_icao="KTPA",
+        cli_issuedby="TPA",
+        timezone="America/New_York",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("Tampa International Airport",),
+    ),
+    Station(
+        kalshi_city="Washington",
+        aliases=("Washington D.C.", "DC", "Washington DC"),
+        station_icao="KDCA",
+        cli_issuedby="DCA",
+        timezone="America/New_York",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.HIGH,
+        notes=("Reagan National Airport",),
+    ),
+    Station(
+        kalshi_city="LaGuardia",
+        aliases=("LGA",),
+        station_icao="KLGA",
+        cli_issuedby="LGA",
+        timezone="America/New_York",
+        cli_field_high=_HIGH_FIELD,
+        cli_field_low=_LOW_FIELD,
+        confidence=MappingConfidence.MED,
+        notes=(
             "LaGuardia Airport; less common Kalshi market",
             "Verify ticker mapping before trading",
-        ],
-    },
-]
+        ),
+    ),
+)
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+
+
+def _normalize_city_key(city: str) -> str:
+    """Lookup key: lowercase with punctuation and whitespace removed."""
+    return _NON_ALNUM_RE.sub("", city.lower())
+
+
+# One CLI URL per issuing office, shared by every spec that cites it.
+_CLI_URL_BY_ISSUEDBY: dict[str, str] = {
+    e.cli_issuedby: _CLI_URL.format(issuedby=e.cli_issuedby) for e in _STATION_DB
+}
+
+# Build lookup indices — kalshi_city and every alias, normalized, so
+# "Washington D.C." / "washington dc" / "WashingtonDC" all hit one key.
+_CITY_INDEX: dict[str, Station] = {}
+for _entry in _STATION_DB:
+    _CITY_INDEX[_normalize_city_key(_entry.kalshi_city)] = _entry
+    for _alias in _entry.aliases:
+        _CITY_INDEX[_normalize_city_key(_alias)] = _entry
+
+
+class _SpecTemplate(NamedTuple):
+    """Per-station SettlementSpec fields that don't depend on the call."""
+
+    issuedby: str
+    cli_url: str
+    tz_str: str
+    field_high: str
+    field_low: str
+    base_risks: tuple[str, ...]
+    confidence: MappingConfidence
+    mapping_note: str
+    undated_day_note: str
+
+
+_PHOENIX_DST_RISK = sys.intern("Arizona does not observe DST — no LST/LDT shift")
+
+
+def _build_spec_template(entry: Station) -> _SpecTemplate:
+    tz_str = entry.timezone
+    risks = tuple(sys.intern(note) for note in entry.notes)
+    # Phoenix DST exception.
+    if tz_str == "America/Phoenix":
+        risks += (_PHOENIX_DST_RISK,)
+    return _SpecTemplate(
+        issuedby=entry.cli_issuedby,
+        cli_url=_CLI_URL_BY_ISSUEDBY[entry.cli_issuedby],
+        tz_str=tz_str,
+        field_high=entry.cli_field_high,
+        field_low=entry.cli_field_low,
+        base_risks=risks,
+        confidence=entry.confidence,
+        mapping_note=f"Station: {entry.station_icao} ({entry.kalshi_city})",
+        undated_day_note=f"CLI day = midnight-midnight LST ({tz_str})",
+    )
+
 
-# Build lookup indices.
-_CITY_INDEX: dict[str, dict] = {}
+# Same keys as _CITY_INDEX; aliases share their station's template.
+_SPEC_TEMPLATES: dict[str, _SpecTemplate] = {}
 for _entry in _STATION_DB:
-    _key = _entry["kalshi_city"].lower()
-    _CITY_INDEX[_key] = _entry
-    for _alias in _entry.get("aliases", []):
-        _CITY_INDEX[_alias.lower()] = _entry
+    _tmpl = _build_spec_template(_entry)
+    for _name in (_entry.kalshi_city, *_entry.aliases):
+        _SPEC_TEMPLATES[_normalize_city_key(_name)] = _tmpl
 
 
 # ── Public API ─────────────────────────────────────────────────────────
 
-def lookup_station(city: str) -> Optional[dict]:
-    """Look up a station entry by city name (case-insensitive, alias-aware)."""
-    key = city.strip().lower()
-    if key in _CITY_INDEX:
-        return _CITY_INDEX[key]
-    # Fuzzy: try substring match.
-    for idx_key, entry in _CITY_INDEX.items():
-        if idx_key in key or key in idx_key:
-            return entry
-    return None
+@lru_cache(maxsize=256)
+def lookup_station(city: str) -> Optional[Station]:
+    """Look up a station entry by city name (case-insensitive, alias-aware).
+
+    Unlisted spellings return None — register them as aliases above.
+    """
+    return _CITY_INDEX.get(_normalize_city_key(city))
+
+
+_UTC = ZoneInfo("UTC")
+_ONE_DAY = timedelta(days=1)
+
+
+@lru_cache(maxsize=32)
+def _zone(timezone_str: str) -> ZoneInfo:
+    return ZoneInfo(timezone_str)
+
+
+@lru_cache(maxsize=32)
+def _std_offset(timezone_str: str, year: int) -> timedelta:
+    """Standard UTC offset (January 1 is always standard time in the US)."""
+    return datetime(year, 1, 1, tzinfo=_zone(timezone_str)).utcoffset()
 
 
 def get_cli_day_window(
@@ -361,23 +453,57 @@ def get_cli_day_window(
 
     Returns (start_utc, end_utc) — the UTC boundaries of the CLI day.
     """
-    tz = ZoneInfo(timezone_str)
-
-    # Get the standard UTC offset (January 1 is always standard time in the US).
-    jan1 = datetime(target_date.year, 1, 1, tzinfo=tz)
-    std_offset = jan1.utcoffset()
+    std_offset = _std_offset(timezone_str, target_date.year)
 
     # CLI day: midnight-to-midnight in local standard time.
     # Convert to UTC using the standard offset (NOT the DST-aware offset).
-    start_lst = datetime(
-        target_date.year, target_date.month, target_date.day, 0, 0, 0
+    start_utc = datetime(
+        target_date.year, target_date.month, target_date.day, tzinfo=_UTC,
+    ) - std_offset
+    end_utc = start_utc + _ONE_DAY
+
+    return start_utc, end_utc
+
+
+def _dated_day_note(tz_str: str, target_date: datetime) -> str:
+    start_utc, end_utc = get_cli_day_window(target_date, tz_str)
+    return (
+        f"CLI day = midnight-midnight LST ({tz_str}); "
+        f"UTC window: {start_utc.strftime('%H:%M')}Z — {end_utc.strftime('%H:%M')}Z"
     )
-    end_lst = start_lst + timedelta(days=1)
 
-    start_utc = (start_lst - std_offset).replace(tzinfo=ZoneInfo("UTC"))
-    end_utc = (end_lst - std_offset).replace(tzinfo=ZoneInfo("UTC"))
 
-    return start_utc, end_utc
+def _unmapped_spec(city: str, market_type: MarketType) -> SettlementSpec:
+    return SettlementSpec(
+        city=city,
+        market_type=market_type,
+        issuedby="UNKNOWN",
+        cli_url="",
+        what_to_read_in_cli="UNKNOWN",
+        day_window_note="Cannot determine — city not in station database",
+        special_risks=("UNMAPPED CITY — cannot determine settlement source",),
+        mapping_confidence=MappingConfidence.LOW,
+        mapping_notes=(f"City '{city}' not found in station database",),
+    )
+
+
+def _spec_from_template(
+    city: str,
+    market_type: MarketType,
+    t: _SpecTemplate,
+    day_note: str,
+) -> SettlementSpec:
+    return SettlementSpec(
+        city=city,
+        market_type=market_type,
+        issuedby=t.issuedby,
+        cli_url=t.cli_url,
+        what_to_read_in_cli=t.field_high if market_type == MarketType.HIGH_TEMP else t.field_low,
+        day_window_note=day_note,
+        special_risks=t.base_risks,
+        mapping_confidence=t.confidence,
+        mapping_notes=(t.mapping_note,),
+    )
 
 
 def build_settlement_spec(
@@ -389,77 +515,53 @@ def build_settlement_spec(
 
     If the city cannot be mapped, returns a spec with LOW confidence.
     """
-    entry = lookup_station(city)
-
-    if entry is None:
-        return SettlementSpec(
-            city=city,
-            market_type=market_type,
-            issuedby="UNKNOWN",
-            cli_url="",
-            what_to_read_in_cli="UNKNOWN",
-            day_window_note="Cannot determine — city not in station database",
-            special_risks=["UNMAPPED CITY — cannot determine settlement source"],
-            mapping_confidence=MappingConfidence.LOW,
-            mapping_notes=[f"City '{city}' not found in station database"],
-        )
-
-    issuedby = entry["cli_issuedby"]
-    cli_url = _CLI_URL.format(issuedby=issuedby)
-
-    if market_type == MarketType.HIGH_TEMP:
-        cli_field = entry["cli_field_high"]
-    else:
-        cli_field = entry["cli_field_low"]
+    t = _SPEC_TEMPLATES.get(_normalize_city_key(city))
+    if t is None:
+        return _unmapped_spec(city, market_type)
 
-    # Day window note.
-    tz_str = entry["timezone"]
     if target_date is not None:
-        start_utc, end_utc = get_cli_day_window(target_date, tz_str)
-        day_note = (
-            f"CLI day = midnight-midnight LST ({tz_str}); "
-            f"UTC window: {start_utc.strftime('%H:%M')}Z — {end_utc.strftime('%H:%M')}Z"
-        )
+        day_note = _dated_day_note(t.tz_str, target_date)
     else:
-        day_note = f"CLI day = midnight-midnight LST ({tz_str})"
-
-    special_risks = list(entry.get("notes", []))
-
-    # Phoenix DST exception.
-    if tz_str == "America/Phoenix":
-        special_risks.append("Arizona does not observe DST — no LST/LDT shift")
-
-    return SettlementSpec(
-        city=city,
-        market_type=market_type,
-        issuedby=issuedby,
-        cli_url=cli_url,
-        what_to_read_in_cli=cli_field,
-        day_window_note=day_note,
-        special_risks=special_risks,
-        mapping_confidence=entry["confidence"],
-        mapping_notes=[f"Station: {entry['station_icao']} ({entry['kalshi_city']})"],
-    )
+        day_note = t.undated_day_note
+    return _spec_from_template(city, market_type, t, day_note)
 
 
 def build_all_settlement_specs(
     cities_and_types: list[tuple[str, MarketType]],
     target_date: Optional[datetime] = None,
 ) -> list[SettlementSpec]:
-    """Build SettlementSpecs for a batch of (city, market_type) pairs."""
-    return [
-        build_settlement_spec(city, mt, target_date)
-        for city, mt in cities_and_types
-    ]
-
+    """Build SettlementSpecs for a batch of (city, market_type) pairs.
 
+    The dated day-window note is computed once per distinct timezone.
+    """
+    day_notes: dict[str, str] = {}
+    specs: list[SettlementSpec] = []
+    for city, mt in cities_and_types:
+        t = _SPEC_TEMPLATES.get(_normalize_city_key(city))
+        if t is None:
+            specs.append(_unmapped_spec(city, mt))
+            continue
+        if target_date is None:
+            day_note = t.undated_day_note
+        else:
+            day_note = day_notes.get(t.tz_str)
+            if day_note is None:
+                day_note = day_notes[t.tz_str] = _dated_day_note(t.tz_str, target_date)
+        specs.append(_spec_from_template(city, mt, t, day_note))
+    return specs
+
+
+# Cached by raw city string; the station database is static, so the caches
+# only need .cache_clear() if _STATION_DB is mutated at runtime (tests).
+@cache
 def get_station_timezone(city: str) -> Optional[str]:
     """Return the IANA timezone string for a city, or None if unmapped."""
     entry = lookup_station(city)
-    return entry["timezone"] if entry else None
+    return entry.timezone if entry else None
 
 
+@cache
 def get_station_icao(city: str) -> Optional[str]:
     """Return the ICAO station code for a city, or None if unmapped."""
     entry = lookup_station(city)
-    return entry["station_icao"] if entry else None
+    return entry.station_icao if entry else None
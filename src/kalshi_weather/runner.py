@@ -7,10 +7,13 @@ objects for the orchestrator, then runs the full pipeline.
 from __future__ import annotations
 
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
 from kalshi_weather.accountant import compute_accounting
+from kalshi_weather.candidate_cache import CandidateCache
 from kalshi_weather.config import DEFAULT_CONFIG, Config
 from kalshi_weather.kalshi_client import KalshiClient
 from kalshi_weather.modeler import model_candidate
@@ -21,14 +24,51 @@ from kalshi_weather.rules import build_settlement_spec, get_station_icao
 from kalshi_weather.scanner import scan_today_markets
 from kalshi_weather.schemas import CandidateRaw, DailySlate, UnifiedCandidate
 from kalshi_weather.team_lead import merge_candidate
-from kalshi_weather.weather_api import WeatherAPI
+from kalshi_weather.weather_api import CurrentObs, StationForecast, WeatherAPI
 
 logger = logging.getLogger(__name__)
 
 
+class _StationWeatherMemo:
+    """Per-run memo over a WeatherAPI, keyed by ICAO.
+
+    Many brackets share one station, so each station's observation and
+    forecast are fetched once per scan — including when several enrich
+    workers ask for the same station at the same time. ``None`` results
+    are cached too; exceptions are not (the next caller retries).
+    """
+
+    def __init__(self, weather: WeatherAPI) -> None:
+        self._weather = weather
+        self._lock = threading.Lock()
+        self._results: dict[tuple[str, str], Future] = {}
+
+    def _once(self, kind: str, icao: str, fetch: Callable[[str], Any]) -> Any:
+        key = (kind, icao)
+        with self._lock:
+            fut = self._results.get(key)
+            owner = fut is None
+            if owner:
+                fut = self._results[key] = Future()
+        if owner:
+            try:
+                fut.set_result(fetch(icao))
+            except Exception as exc:
+                with self._lock:
+                    del self._results[key]
+                fut.set_exception(exc)
+        return fut.result()
+
+    def get_current_obs(self, station_icao: str) -> Optional[CurrentObs]:
+        return self._once("obs", station_icao, self._weather.get_current_obs)
+
+    def get_hourly_forecast(self, station_icao: str) -> Optional[StationForecast]:
+        return self._once("forecast", station_icao, self._weather.get_hourly_forecast)
+
+
 def enrich_candidate(
     raw: CandidateRaw,
-    weather: WeatherAPI,
+    weather: WeatherAPI | _StationWeatherMemo,
     config: Config = DEFAULT_CONFIG,
 ) -> UnifiedCandidate:
     """Enrich a single CandidateRaw through all 6 modules.
@@ -79,11 +119,13 @@ def run_full_scan(
     weather: WeatherAPI,
     output_dir: Optional[Path] = None,
     config: Config = DEFAULT_CONFIG,
+    cache: Optional[CandidateCache] = None,
 ) -> tuple[DailySlate, Path]:
     """Run the complete scan-to-slate pipeline.
 
     1. Scan Kalshi for today's temperature markets
-    2. Enrich each candidate through all modules
+    2. Enrich each candidate through all modules (reusing ``cache`` hits
+       for brackets whose orderbook hasn't changed since a previous run)
     3. Run the orchestrator pipeline (bucket, rank, stability, artifacts)
 
     Returns (DailySlate, output_directory).
@@ -94,16 +136,40 @@ def run_full_scan(
     candidates_raw = scan_today_markets(client, config)
     logger.info("Scanner found %d candidates in price window", len(candidates_raw))
 
-    # Enrich each candidate
+    # Enrich each candidate — each one makes several NWS round trips, so
+    # overlap them on a bounded pool (WeatherAPI's client and rate limiter
+    # are thread-safe). Results are collected in scan order.
     unified: list[UnifiedCandidate] = []
-    for raw in candidates_raw:
-        try:
-            uc = enrich_candidate(raw, weather, config)
+    station_weather = _StationWeatherMemo(weather)
+    workers = max(1, min(config.concurrency.enrich_workers, len(candidates_raw)))
+    cache_hits = 0
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        jobs: list[tuple[CandidateRaw, UnifiedCandidate | Future]] = []
+        for raw in candidates_raw:
+            hit = cache.lookup(raw) if cache is not None else None
+            if hit is not None:
+                cache_hits += 1
+                jobs.append((raw, hit))
+            else:
+                jobs.append((raw, ex.submit(enrich_candidate, raw, station_weather, config)))
+        for raw, job in jobs:
+            if isinstance(job, UnifiedCandidate):
+                unified.append(job)
+                continue
+            try:
+                uc = job.result()
+            except Exception:
+                logger.exception("Failed to enrich %s — skipping", raw.market_ticker)
+                continue
+            # Stored before run_pipeline buckets and ranks it.
+            if cache is not None:
+                cache.store(raw, uc)
             unified.append(uc)
-        except Exception:
-            logger.exception("Failed to enrich %s — skipping", raw.market_ticker)
 
-    logger.info("Enriched %d / %d candidates", len(unified), len(candidates_raw))
+    logger.info(
+        "Enriched %d / %d candidates (%d from cache)",
+        len(unified), len(candidates_raw), cache_hits,
+    )
 
     # Run orchestrator pipeline
     slate = run_pipeline(
@@ -8,10 +8,14 @@ from __future__ import annotations
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from itertools import accumulate
+from operator import itemgetter
 from typing import Optional
+from zoneinfo import ZoneInfo
 
-import pytz
+import httpx
 
 from kalshi_weather.config import DEFAULT_CONFIG, Config
 from kalshi_weather.kalshi_client import KalshiClient
@@ -21,34 +25,44 @@ logger = logging.getLogger(__name__)
 
 # Known Kalshi series prefixes for temperature markets.
 # KXHIGH* = daily high, KXLOW* = daily low.
-_HIGH_SERIES_RE = re.compile(r"^KXHIGH", re.IGNORECASE)
-_LOW_SERIES_RE = re.compile(r"^KXLOW", re.IGNORECASE)
+_SERIES_PREFIXES = (
+    ("KXHIGH", MarketType.HIGH_TEMP),
+    ("KXLOW", MarketType.LOW_TEMP),
+)
+
+# Event title city extraction, tried in order.
+# Common pattern: "Highest temperature in <City> on ..."
+_CITY_TITLE_RES = (
+    re.compile(r"(?:Highest|Lowest)\s+temperature\s+in\s+(.+?)\s+(?:on|today)", re.IGNORECASE),
+    re.compile(r"(?:Highest|Lowest)\s+temperature\s+in\s+(.+?)$", re.IGNORECASE),
+)
+
+_ET = ZoneInfo("America/New_York")
+
+# Quantity column of a [price_cents, qty] orderbook level.
+_qty = itemgetter(1)
 
 # Kalshi market URL template.
 _MARKET_URL = "https://kalshi.com/markets/{ticker}"
 
 # Market statuses considered tradable.
-_TRADABLE_STATUSES = {"active", "open"}
+_TRADABLE_STATUSES = frozenset({"active", "open"})
 
 
 def _classify_series(series_ticker: str) -> Optional[MarketType]:
     """Determine if a series is HIGH_TEMP or LOW_TEMP from its ticker."""
-    if _HIGH_SERIES_RE.match(series_ticker):
-        return MarketType.HIGH_TEMP
-    if _LOW_SERIES_RE.match(series_ticker):
-        return MarketType.LOW_TEMP
+    ticker = series_ticker.upper()
+    for prefix, market_type in _SERIES_PREFIXES:
+        if ticker.startswith(prefix):
+            return market_type
     return None
 
 
 def _extract_city_from_event(event: dict) -> str:
     """Best-effort city extraction from event title or ticker."""
     title = event.get("title", "")
-    # Common pattern: "Highest temperature in <City> on ..."
-    for pattern in [
-        r"(?:Highest|Lowest)\s+temperature\s+in\s+(.+?)\s+(?:on|today)",
-        r"(?:Highest|Lowest)\s+temperature\s+in\s+(.+?)$",
-    ]:
-        m = re.search(pattern, title, re.IGNORECASE)
+    for pattern in _CITY_TITLE_RES:
+        m = pattern.search(title)
         if m:
             return m.group(1).strip()
     # Fallback: use event ticker suffix
@@ -85,8 +99,12 @@ def _parse_orderbook(raw_ob: dict) -> OrderbookSnapshot:
     yes_bids = ob.get("yes") or []
     no_bids = ob.get("no") or []
 
-    best_yes_bid = yes_bids[-1][0] if yes_bids else None
-    best_no_bid = no_bids[-1][0] if no_bids else None
+    # Best three levels of each side (ascending, so best bid is last).
+    yes_last3 = yes_bids[-3:]
+    no_last3 = no_bids[-3:]
+
+    best_yes_bid = yes_last3[-1][0] if yes_last3 else None
+    best_no_bid = no_last3[-1][0] if no_last3 else None
 
     implied_no_ask = (100 - best_yes_bid) if best_yes_bid is not None else None
     implied_yes_ask = (100 - best_no_bid) if best_no_bid is not None else None
@@ -96,19 +114,26 @@ def _parse_orderbook(raw_ob: dict) -> OrderbookSnapshot:
         bid_room = implied_no_ask - best_no_bid
 
     # Top-3 bids (highest first)
-    top3_yes = [[p, q] for p, q in reversed(yes_bids[-3:])] if yes_bids else []
-    top3_no = [[p, q] for p, q in reversed(no_bids[-3:])] if no_bids else []
+    top3_yes = tuple((p, q) for p, q in reversed(yes_last3))
+    top3_no = tuple((p, q) for p, q in reversed(no_last3))
+
+    # Cumulative depth from the best bid down, built in one pass per side;
+    # the last entry is the side's total depth.
+    yes_cum = tuple(accumulate(map(_qty, reversed(yes_bids))))
+    no_cum = tuple(accumulate(map(_qty, reversed(no_bids))))
 
     depth_parts = []
     if not yes_bids:
         depth_parts.append("NO YES BIDS")
     if not no_bids:
         depth_parts.append("NO NO BIDS")
-    total_yes_depth = sum(q for _, q in yes_bids)
-    total_no_depth = sum(q for _, q in no_bids)
+    total_yes_depth = yes_cum[-1] if yes_cum else 0
+    total_no_depth = no_cum[-1] if no_cum else 0
     depth_parts.append(f"yes_depth={total_yes_depth}, no_depth={total_no_depth}")
 
-    return OrderbookSnapshot(
+    # Every field is derived above from integer cents, so skip pydantic
+    # validation — this runs once per market and dominates parse time.
+    return OrderbookSnapshot.model_construct(
         best_yes_bid_cents=best_yes_bid,
         best_no_bid_cents=best_no_bid,
         implied_best_no_ask_cents=implied_no_ask,
@@ -116,13 +141,15 @@ def _parse_orderbook(raw_ob: dict) -> OrderbookSnapshot:
         bid_room_cents=bid_room,
         top3_yes_bids=top3_yes,
         top3_no_bids=top3_no,
+        yes_cumdepth=yes_cum,
+        no_cumdepth=no_cum,
         depth_notes="; ".join(depth_parts),
     )
 
 
 def _market_is_tradable(market: dict) -> bool:
     """Check if a market is in a tradable state."""
-    status = (market.get("status") or "").lower()
+    status = (market.get("status") or "").strip().lower()
     return status in _TRADABLE_STATUSES
 
 
@@ -147,6 +174,64 @@ def discover_temperature_series(client: KalshiClient) -> list[dict]:
     return temp_series
 
 
+def _fetch_orderbooks_bulk(client: KalshiClient, tickers: list[str]) -> dict[str, dict]:
+    """Try the bulk orderbook endpoint; an empty dict means fall back."""
+    try:
+        return client.get_orderbooks(tickers, depth=10)
+    except httpx.HTTPStatusError as exc:
+        if 400 <= exc.response.status_code < 500:
+            logger.info(
+                "Bulk orderbook endpoint rejected the request (HTTP %d) — "
+                "fetching per ticker", exc.response.status_code,
+            )
+        else:
+            logger.warning("Bulk orderbook fetch failed — fetching per ticker: %s", exc)
+    except Exception as exc:
+        logger.warning("Bulk orderbook fetch failed — fetching per ticker: %s", exc)
+    return {}
+
+
+def _fetch_orderbooks(
+    client: KalshiClient,
+    tickers: list[str],
+    max_workers: int,
+) -> list[Optional[dict]]:
+    """Fetch orderbooks for many tickers.
+
+    Uses one bulk request per batch of tickers; anything the bulk call
+    doesn't return is fetched individually on a bounded thread pool.
+    Results line up with ``tickers``; a failed fetch is logged and yields None.
+    """
+    books = _fetch_orderbooks_bulk(client, tickers) if tickers else {}
+    missing = [t for t in tickers if t not in books]
+    if missing:
+        books.update(zip(missing, _fetch_orderbooks_each(client, missing, max_workers)))
+    return [books.get(t) for t in tickers]
+
+
+def _fetch_orderbooks_each(
+    client: KalshiClient,
+    tickers: list[str],
+    max_workers: int,
+) -> list[Optional[dict]]:
+    """Per-ticker orderbook fetches on a bounded thread pool."""
+    def fetch(ticker: str) -> Optional[dict]:
+        try:
+            return client.get_orderbook(ticker, depth=10)
+        except Exception:
+            # Tracebacks only at DEBUG — formatting them is costly on a bad run.
+            logger.warning(
+                "Failed to fetch orderbook for %s", ticker,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
+            return None
+
+    if max_workers <= 1 or len(tickers) <= 1:
+        return [fetch(t) for t in tickers]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tickers))) as ex:
+        return list(ex.map(fetch, tickers))
+
+
 def scan_today_markets(
     client: KalshiClient,
     config: Config = DEFAULT_CONFIG,
@@ -160,8 +245,7 @@ def scan_today_markets(
     if run_time is None:
         run_time = datetime.now(timezone.utc)
 
-    et = pytz.timezone("US/Eastern")
-    run_time_et = run_time.astimezone(et)
+    run_time_et = run_time.astimezone(_ET)
     run_time_et_str = run_time_et.isoformat()
     today_str = run_time_et.strftime("%Y-%m-%d")
 
@@ -171,9 +255,12 @@ def scan_today_markets(
         logger.warning("No temperature series found")
         return []
 
+    debug = logger.isEnabledFor(logging.DEBUG)
     candidates: list[CandidateRaw] = []
     events_scanned = 0
     brackets_scanned = 0
+    # (market, city, event_name, market_type) for every tradable bracket.
+    tradable: list[tuple[dict, str, str, MarketType]] = []
 
     # Step 2: For each series, fetch today's events with nested markets
     for series in temp_series:
@@ -200,53 +287,63 @@ def scan_today_markets(
             markets = event.get("markets", [])
             for market in markets:
                 brackets_scanned += 1
-                ticker = market.get("ticker", "")
 
                 # Step 4: Market status check (Task #9)
                 if not _market_is_tradable(market):
-                    status_note = f"non-tradable status: {market.get('status')}"
-                    logger.debug("Skipping %s — %s", ticker, status_note)
+                    if debug:
+                        logger.debug(
+                            "Skipping %s — non-tradable status: %s",
+                            market.get("ticker", ""), market.get("status"),
+                        )
                     continue
 
-                # Step 5: Fetch orderbook
-                try:
-                    raw_ob = client.get_orderbook(ticker, depth=10)
-                except Exception:
-                    logger.warning("Failed to fetch orderbook for %s", ticker, exc_info=True)
-                    continue
+                tradable.append((market, city, event_name, market_type))
 
-                ob = _parse_orderbook(raw_ob)
+    # Step 5: Fetch orderbooks (concurrently — the scan is network-bound)
+    raw_obs = _fetch_orderbooks(
+        client,
+        [market.get("ticker", "") for market, _, _, _ in tradable],
+        config.concurrency.orderbook_workers,
+    )
 
-                # Step 6: Filter — implied_best_no_ask in [scan_low, scan_high] (Task #10)
-                if ob.implied_best_no_ask_cents is None:
-                    continue
+    for (market, city, event_name, market_type), raw_ob in zip(tradable, raw_obs):
+        if raw_ob is None:
+            continue
+        ticker = market.get("ticker", "")
 
-                if not (
-                    config.price_window.scan_low
-                    <= ob.implied_best_no_ask_cents
-                    <= config.price_window.scan_high
-                ):
-                    continue
+        ob = _parse_orderbook(raw_ob)
 
-                candidate = CandidateRaw(
-                    run_time_et=run_time_et_str,
-                    target_date_local=today_str,
-                    city=city,
-                    market_type=market_type,
-                    event_name=event_name,
-                    market_ticker=ticker,
-                    market_url=_MARKET_URL.format(ticker=ticker),
-                    bracket_definition=_bracket_definition(market),
-                    orderbook_snapshot=ob,
-                    market_status_notes="",
-                )
-                candidates.append(candidate)
-                logger.info(
-                    "Candidate: %s  implied_no_ask=%s  bid_room=%s",
-                    ticker,
-                    ob.implied_best_no_ask_cents,
-                    ob.bid_room_cents,
-                )
+        # Step 6: Filter — implied_best_no_ask in [scan_low, scan_high] (Task #10)
+        if ob.implied_best_no_ask_cents is None:
+            continue
+
+        if not (
+            config.price_window.scan_low
+            <= ob.implied_best_no_ask_cents
+            <= config.price_window.scan_high
+        ):
+            continue
+
+        candidate = CandidateRaw(
+            run_time_et=run_time_et_str,
+            target_date_local=today_str,
+            city=city,
+            market_type=market_type,
+            event_name=event_name,
+            market_ticker=ticker,
+            market_url=_MARKET_URL.format(ticker=ticker),
+            bracket_definition=_bracket_definition(market),
+            orderbook_snapshot=ob,
+            market_status_notes="",
+        )
+        candidates.append(candidate)
+        if debug:
+            logger.debug(
+                "Candidate: %s  implied_no_ask=%s  bid_room=%s",
+                ticker,
+                ob.implied_best_no_ask_cents,
+                ob.bid_room_cents,
+            )
 
     logger.info(
         "Scan complete: %d events, %d brackets, %d candidates in [%d,%d]",
@@ -6,43 +6,54 @@ and the final DAILY_SLATE.json structure.
 
 from __future__ import annotations
 
-from enum import Enum
+import gzip
+from enum import StrEnum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 # ── Enums ──────────────────────────────────────────────────────────────
+# StrEnum members are their string values everywhere (str(), f-strings,
+# JSON), so callers never need .value.
 
-class MarketType(str, Enum):
+class MarketType(StrEnum):
     HIGH_TEMP = "HIGH_TEMP"
     LOW_TEMP = "LOW_TEMP"
 
 
-class MappingConfidence(str, Enum):
+class MappingConfidence(StrEnum):
     HIGH = "HIGH"
     MED = "MED"
     LOW = "LOW"
 
 
-class UncertaintyLevel(str, Enum):
+class _Level(StrEnum):
+    """LOW/MED/HIGH scale. Each member carries ``rank`` (LOW=0 … HIGH=2)
+    as a plain int, so ranking never goes through a lookup table."""
+
+    def __init__(self, value: str) -> None:
+        self.rank = ("LOW", "MED", "HIGH").index(value)
+
+
+class UncertaintyLevel(_Level):
     LOW = "LOW"
     MED = "MED"
     HIGH = "HIGH"
 
 
-class LockInFlag(str, Enum):
+class LockInFlag(StrEnum):
     LOCKING = "LOCKING"
     NOT_LOCKED = "NOT_LOCKED"
     UNKNOWN = "UNKNOWN"
 
 
-class KnifeEdgeRisk(str, Enum):
+class KnifeEdgeRisk(_Level):
     LOW = "LOW"
     MED = "MED"
     HIGH = "HIGH"
 
 
-class Bucket(str, Enum):
+class Bucket(StrEnum):
     PRIMARY = "PRIMARY"
     TIGHT = "TIGHT"
     NEAR_MISS = "NEAR_MISS"
@@ -58,23 +69,46 @@ class SettlementSpec(BaseModel):
     cli_url: str
     what_to_read_in_cli: str
     day_window_note: str
-    special_risks: list[str] = Field(default_factory=list)
+    special_risks: tuple[str, ...] = ()
     mapping_confidence: MappingConfidence
-    mapping_notes: list[str] = Field(default_factory=list)
+    mapping_notes: tuple[str, ...] = ()
 
 
 # ── B) Scanner — CANDIDATES_RAW ───────────────────────────────────────
 
+def _top3_depth(cumdepth: tuple[int, ...], top3_bids: tuple[tuple[int, int], ...]) -> int:
+    """Top-3 quantity for one side; snapshots built without cumulative
+    depth fall back to summing the top-3 levels."""
+    if cumdepth:
+        return cumdepth[min(3, len(cumdepth)) - 1]
+    return sum(q for _, q in top3_bids)
+
+
 class OrderbookSnapshot(BaseModel):
+    """Immutable once parsed; top-3 levels are (price_cents, qty) pairs."""
+
     best_yes_bid_cents: Optional[int] = None
     best_no_bid_cents: Optional[int] = None
     implied_best_no_ask_cents: Optional[int] = None
     implied_best_yes_ask_cents: Optional[int] = None
     bid_room_cents: Optional[int] = None
-    top3_yes_bids: list[list[int]] = Field(default_factory=list)
-    top3_no_bids: list[list[int]] = Field(default_factory=list)
+    top3_yes_bids: tuple[tuple[int, int], ...] = ()
+    top3_no_bids: tuple[tuple[int, int], ...] = ()
+    # Running quantity totals from the best bid down (index 0 = best level).
+    yes_cumdepth: tuple[int, ...] = ()
+    no_cumdepth: tuple[int, ...] = ()
     depth_notes: str = ""
 
+    model_config = ConfigDict(frozen=True)
+
+    @property
+    def depth_top3_total(self) -> int:
+        """Top-3 resting quantity on both sides, read off the cumulative depth."""
+        return (
+            _top3_depth(self.yes_cumdepth, self.top3_yes_bids)
+            + _top3_depth(self.no_cumdepth, self.top3_no_bids)
+        )
+
 
 class CandidateRaw(BaseModel):
     run_time_et: str
@@ -96,8 +130,8 @@ class ModelOutput(BaseModel):
     p_yes: float
     p_no: float
     method: str
-    signals_used: list[str] = Field(default_factory=list)
-    assumptions: list[str] = Field(default_factory=list)
+    signals_used: tuple[str, ...] = ()
+    assumptions: tuple[str, ...] = ()
     uncertainty_level: UncertaintyLevel
     local_time_at_station: str
     hours_remaining_until_cli_day_close: float
@@ -109,9 +143,17 @@ class ModelOutput(BaseModel):
     p_new_higher_high_after_now: Optional[float] = Field(None, alias="P_new_higher_high_after_now")
     high_lock_in_flag: Optional[LockInFlag] = None
     knife_edge_risk: KnifeEdgeRisk
-    model_notes: list[str] = Field(default_factory=list)
+    model_notes: tuple[str, ...] = ()
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    @property
+    def uncertainty_rank(self) -> int:
+        return self.uncertainty_level.rank
 
-    model_config = {"populate_by_name": True}
+    @property
+    def knife_edge_rank(self) -> int:
+        return self.knife_edge_risk.rank
 
 
 # ── D) Accountant — ACCOUNTING ────────────────────────────────────────
@@ -147,10 +189,11 @@ class RiskRecommendation(BaseModel):
     market_ticker: str
     suggested_stake_usd: float
     max_loss_usd: float
-    risk_flags: list[str] = Field(default_factory=list)
+    # Built once per candidate; add flags by building a new tuple.
+    risk_flags: tuple[str, ...] = ()
     correlation_group: str
     metro_cluster: str
-    risk_notes: list[str] = Field(default_factory=list)
+    risk_notes: tuple[str, ...] = ()
 
 
 class NoTradeEntry(BaseModel):
@@ -178,7 +221,7 @@ class UnifiedCandidate(BaseModel):
     bucket: Bucket = Bucket.REJECTED
     bucket_reason: str = ""
     rank: Optional[int] = None
-    warnings: list[str] = Field(default_factory=list)
+    warnings: tuple[str, ...] = ()
 
 
 # ── DAILY_SLATE.json top-level ────────────────────────────────────────
@@ -192,6 +235,8 @@ class ScanStats(BaseModel):
     near_miss_count: int = 0
     rejected_count: int = 0
 
+    model_config = ConfigDict(frozen=True)
+
 
 class DailySlate(BaseModel):
     run_time_et: str
@@ -203,3 +248,26 @@ class DailySlate(BaseModel):
     picks_near_miss: list[UnifiedCandidate] = Field(default_factory=list)
     rejected: list[UnifiedCandidate] = Field(default_factory=list)
     notes: list[str] = Field(default_factory=list)
+
+
+# ── JSON encode / decode ──────────────────────────────────────────────
+
+# Built once at import; dump_json hands back bytes straight from
+# pydantic-core, so writers skip the str round trip.
+DAILY_SLATE_ADAPTER = TypeAdapter(DailySlate)
+UNIFIED_CANDIDATE_ADAPTER = TypeAdapter(UnifiedCandidate)
+
+
+def dump_slate_json(slate: DailySlate) -> bytes:
+    """Encode a DailySlate as indented UTF-8 JSON (the on-disk format)."""
+    return DAILY_SLATE_ADAPTER.dump_json(slate, indent=2)
+
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def load_slate(data: bytes | str) -> DailySlate:
+    """Decode and validate a DailySlate from JSON (plain or gzip-archived)."""
+    if isinstance(data, bytes) and data[:2] == _GZIP_MAGIC:
+        data = gzip.decompress(data)
+    return DAILY_SLATE_ADAPTER.validate_json(data)
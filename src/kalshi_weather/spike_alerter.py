@@ -6,10 +6,13 @@ Sends to self (Gmail to Gmail) with inline CSS for mobile compatibility.
 
 from __future__ import annotations
 
+import base64
 import logging
 import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import threading
+from collections import deque
+from email.header import Header
+from string import Template
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -19,6 +22,10 @@ SMTP_PORT = 587
 
 # ── Signal color mapping ─────────────────────────────────────────────
 
+_DEFAULT_SIGNAL_COLOR = "#6b7280"
+
+# Plain dict: .get() on it beats both a MappingProxyType wrapper and an
+# if/elif or match chain over these five keys.
 _SIGNAL_COLORS: dict[str, str] = {
     "STRONG_BUY": "#22c55e",
     "BUY": "#22c55e",
@@ -28,13 +35,28 @@ _SIGNAL_COLORS: dict[str, str] = {
 }
 
 
-def signal_to_color(signal: str) -> tuple[str, str]:
-    """Return (hex_color, label) for a signal string."""
-    color = _SIGNAL_COLORS.get(signal, "#6b7280")
-    return color, signal
+# ── Conviction trend rows ────────────────────────────────────────────
 
 
-# ── Conviction trend rows ────────────────────────────────────────────
+_ROW_PENDING = (
+    '<tr style="color:#9ca3af;">'
+    "<td>[{index}/{total}]</td>"
+    "<td>{time_str}</td>"
+    "<td>(pending)</td>"
+    "<td></td>"
+    "<td></td>"
+    "</tr>"
+)
+_ROW_FILLED = (
+    "<tr>"
+    "<td>[{index}/{total}]</td>"
+    "<td>{time_str}</td>"
+    '<td style="color:{color};font-weight:bold;">{signal}</td>'
+    "<td>{temp}</td>"
+    "<td>{price}{marker}</td>"
+    "</tr>"
+)
+_HERE_MARKER = " \u2190 you are here"
 
 
 def build_conviction_row(
@@ -47,32 +69,72 @@ def build_conviction_row(
     is_current: bool,
 ) -> str:
     """Build one row of the conviction trend table."""
-    marker = " \u2190 you are here" if is_current else ""
     if signal is None:
-        return (
-            '<tr style="color:#9ca3af;">'
-            f"<td>[{index}/{total}]</td>"
-            f"<td>{time_str}</td>"
-            f"<td>(pending)</td>"
-            f"<td></td>"
-            f"<td></td>"
-            f"</tr>"
-        )
-    color, _ = signal_to_color(signal)
-    return (
-        f"<tr>"
-        f"<td>[{index}/{total}]</td>"
-        f"<td>{time_str}</td>"
-        f'<td style="color:{color};font-weight:bold;">{signal}</td>'
-        f"<td>{temp_f:.1f}\u00b0F</td>"
-        f"<td>{market_price}\u00a2{marker}</td>"
-        f"</tr>"
+        return _ROW_PENDING.format(index=index, total=total, time_str=time_str)
+    return _ROW_FILLED.format(
+        index=index,
+        total=total,
+        time_str=time_str,
+        color=_SIGNAL_COLORS.get(signal, _DEFAULT_SIGNAL_COLOR),
+        signal=signal,
+        # A failed analysis still gets a row, with no reading to show.
+        temp=f"{temp_f:.1f}\u00b0F" if temp_f is not None else "\u2014",
+        price=f"{market_price}\u00a2" if market_price is not None else "\u2014",
+        marker=_HERE_MARKER if is_current else "",
     )
 
 
 # ── Full HTML email builder ──────────────────────────────────────────
 
 
+# Static shell, parsed once; only the per-alert values are substituted.
+_EMAIL_TEMPLATE = Template("""<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"></head>
+<body style="font-family:Consolas,monospace;background:#1a1a2e;color:#e0e0e0;padding:20px;">
+<div style="max-width:600px;margin:0 auto;">
+
+<h2 style="color:#fff;margin-bottom:4px;">SPIKE ALERT: $city $bracket</h2>
+<p style="color:#9ca3af;margin-top:0;">Email $email_number of $email_total &mdash; $time_str</p>
+
+<div style="background:#16213e;border-radius:8px;padding:16px;margin:12px 0;">
+<h3 style="color:#9ca3af;margin:0 0 8px 0;font-size:13px;">MARKET</h3>
+<p style="font-size:18px;margin:0;">
+$old_price&cent; &rarr; $new_price&cent;
+(+$spike_delta&cent;) &mdash; now at $current_price&cent;
+</p>
+</div>
+
+<div style="background:#16213e;border-radius:8px;padding:16px;margin:12px 0;">
+<h3 style="color:#9ca3af;margin:0 0 8px 0;font-size:13px;">EDGE ANALYSIS</h3>
+<table style="width:100%;color:#e0e0e0;font-size:14px;">
+<tr><td style="color:#9ca3af;">METAR (rounded):</td><td>$metar_str</td></tr>
+$precise_row
+<tr><td style="color:#9ca3af;">Running max:</td><td>$max_str</td></tr>
+<tr><td style="color:#9ca3af;">Margin:</td><td>$margin_str</td></tr>
+</table>
+</div>
+
+<div style="background:$signal_color;border-radius:8px;padding:20px;margin:12px 0;text-align:center;">
+<span style="font-size:24px;font-weight:bold;color:#fff;">$signal</span>
+<br>
+<span style="font-size:13px;color:rgba(255,255,255,0.8);">Time risk: $time_risk</span>
+</div>
+
+<p style="color:#d1d5db;font-size:13px;margin:8px 0;">$signal_reason</p>
+
+<div style="background:#16213e;border-radius:8px;padding:16px;margin:12px 0;">
+<h3 style="color:#9ca3af;margin:0 0 8px 0;font-size:13px;">CONVICTION TREND</h3>
+<table style="width:100%;color:#e0e0e0;font-size:13px;">
+$conviction_html
+</table>
+</div>
+
+</div>
+</body>
+</html>""")
+
+
 def build_spike_email_html(
     city: str,
     bracket: str,
@@ -96,8 +158,6 @@ def build_spike_email_html(
     conviction_rows: list[str],
 ) -> str:
     """Build the full HTML email body."""
-    color, label = signal_to_color(signal)
-
     metar_str = f"{metar_f}\u00b0F" if metar_f is not None else "\u2014"
     precise_f_str = f"{precise_f:.1f}\u00b0F" if precise_f is not None else "\u2014"
     precise_c_str = f"({precise_c:.1f}\u00b0C)" if precise_c is not None else ""
@@ -116,65 +176,54 @@ def build_spike_email_html(
         f"<td>{precise_val}</td></tr>"
     )
 
-    td_grey = 'style="color:#9ca3af;"'
-    bg_panel = "background:#16213e;border-radius:8px;padding:16px;margin:12px 0;"
-    body_css = (
-        "font-family:Consolas,monospace;"
-        "background:#1a1a2e;color:#e0e0e0;padding:20px;"
+    return _EMAIL_TEMPLATE.substitute(
+        signal_color=_SIGNAL_COLORS.get(signal, _DEFAULT_SIGNAL_COLOR),
+        city=city,
+        bracket=bracket,
+        email_number=email_number,
+        email_total=email_total,
+        time_str=time_str,
+        old_price=old_price,
+        new_price=new_price,
+        spike_delta=spike_delta,
+        current_price=current_price,
+        metar_str=metar_str,
+        precise_row=precise_row,
+        max_str=max_str,
+        margin_str=margin_str,
+        signal=signal,
+        time_risk=time_risk,
+        signal_reason=signal_reason,
+        conviction_html=conviction_html,
     )
-    signal_css = (
-        f"background:{color};border-radius:8px;"
-        "padding:20px;margin:12px 0;text-align:center;"
-    )
-
-    return f"""<!DOCTYPE html>
-<html>
-<head><meta charset="utf-8"></head>
-<body style="{body_css}">
-<div style="max-width:600px;margin:0 auto;">
-
-<h2 style="color:#fff;margin-bottom:4px;">SPIKE ALERT: {city} {bracket}</h2>
-<p style="color:#9ca3af;margin-top:0;">Email {email_number} of {email_total} &mdash; {time_str}</p>
 
-<div style="{bg_panel}">
-<h3 style="color:#9ca3af;margin:0 0 8px 0;font-size:13px;">MARKET</h3>
-<p style="font-size:18px;margin:0;">
-{old_price}&cent; &rarr; {new_price}&cent;
-(+{spike_delta}&cent;) &mdash; now at {current_price}&cent;
-</p>
-</div>
 
-<div style="{bg_panel}">
-<h3 style="color:#9ca3af;margin:0 0 8px 0;font-size:13px;">EDGE ANALYSIS</h3>
-<table style="width:100%;color:#e0e0e0;font-size:14px;">
-<tr><td {td_grey}>METAR (rounded):</td><td>{metar_str}</td></tr>
-{precise_row}
-<tr><td {td_grey}>Running max:</td><td>{max_str}</td></tr>
-<tr><td {td_grey}>Margin:</td><td>{margin_str}</td></tr>
-</table>
-</div>
+# ── Send email ───────────────────────────────────────────────────────
 
-<div style="{signal_css}">
-<span style="font-size:24px;font-weight:bold;color:#fff;">{label}</span>
-<br>
-<span style="font-size:13px;color:rgba(255,255,255,0.8);">Time risk: {time_risk}</span>
-</div>
 
-<p style="color:#d1d5db;font-size:13px;margin:8px 0;">{signal_reason}</p>
+# Single UTF-8 HTML part sent to self — fixed enough to preformat rather
+# than run through the email.mime builders on every alert.
+_RAW_HEADERS = (
+    "From: {addr}\r\n"
+    "To: {addr}\r\n"
+    "Subject: {subject}\r\n"
+    "MIME-Version: 1.0\r\n"
+    "Content-Type: text/html; charset=utf-8\r\n"
+    "Content-Transfer-Encoding: base64\r\n"
+    "\r\n"
+)
 
-<div style="{bg_panel}">
-<h3 style="color:#9ca3af;margin:0 0 8px 0;font-size:13px;">CONVICTION TREND</h3>
-<table style="width:100%;color:#e0e0e0;font-size:13px;">
-{conviction_html}
-</table>
-</div>
 
-</div>
-</body>
-</html>"""
-
-
-# ── Send email ───────────────────────────────────────────────────────
+def _build_message(subject: str, html_body: str, gmail_address: str) -> bytes:
+    """Return the raw RFC 5322 message bytes for an HTML alert to self."""
+    if not subject.isascii():
+        # Bracket labels carry a degree sign; RFC 2047-encode the header.
+        subject = Header(subject, "utf-8").encode(linesep="\r\n")
+    head = _RAW_HEADERS.format(addr=gmail_address, subject=subject)
+    # smtplib leaves bytes untouched, so the body must already be 7-bit
+    # with CRLF line endings; base64 lines satisfy both.
+    body = base64.encodebytes(html_body.encode("utf-8")).replace(b"\n", b"\r\n")
+    return head.encode("ascii") + body
 
 
 def send_spike_email(
@@ -184,15 +233,165 @@ def send_spike_email(
     gmail_app_password: str,
 ) -> None:
     """Send an HTML spike alert email to self via Gmail SMTP."""
-    msg = MIMEMultipart("alternative")
-    msg["From"] = gmail_address
-    msg["To"] = gmail_address  # send to self
-    msg["Subject"] = subject
-    msg.attach(MIMEText(html_body, "html", "utf-8"))
+    msg = _build_message(subject, html_body, gmail_address)
 
     logger.info("Sending spike alert: %s", subject)
     with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
         server.starttls()
         server.login(gmail_address, gmail_app_password)
-        server.send_message(msg)
+        server.sendmail(gmail_address, [gmail_address], msg)
     logger.info("Spike alert sent")
+
+
+class SpikeMailer:
+    """Gmail SMTP session reused across spike alerts.
+
+    A burst sends several emails a minute apart; keeping one logged-in
+    connection skips the TCP/TLS/AUTH handshake on every email after the
+    first. The connection opens lazily, is probed with NOOP before each
+    send, and is re-established once if the server has dropped it.
+    """
+
+    def __init__(self, gmail_address: str, gmail_app_password: str) -> None:
+        self._address = gmail_address
+        self._password = gmail_app_password
+        self._server: Optional[smtplib.SMTP] = None
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(SMTP_HOST, SMTP_PORT)
+        try:
+            server.starttls()
+            server.login(self._address, self._password)
+        except Exception:
+            server.close()
+            raise
+        self._server = server
+        return server
+
+    def _live_server(self) -> smtplib.SMTP:
+        server = self._server
+        if server is not None:
+            try:
+                if server.noop()[0] == 250:
+                    return server
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._drop()
+        return self._connect()
+
+    def _drop(self) -> None:
+        server, self._server = self._server, None
+        if server is not None:
+            try:
+                server.close()
+            except OSError:
+                pass
+
+    def send(self, subject: str, html_body: str) -> None:
+        """Send an HTML spike alert to self, reusing the open session."""
+        addr = self._address
+        msg = _build_message(subject, html_body, addr)
+        logger.info("Sending spike alert: %s", subject)
+        try:
+            self._live_server().sendmail(addr, [addr], msg)
+        except smtplib.SMTPServerDisconnected:
+            # Dropped between the NOOP and the send — retry once, fresh.
+            self._drop()
+            self._connect().sendmail(addr, [addr], msg)
+        logger.info("Spike alert sent")
+
+    def close(self) -> None:
+        server, self._server = self._server, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Signals whose alerts may be shed when the send queue backs up.
+_LOW_PRIORITY_SIGNALS = frozenset({"HOLD", "CAUTION", "NO_EDGE"})
+
+
+class QueuedSpikeMailer:
+    """Sends spike alerts from a background thread.
+
+    ``submit`` only enqueues, so the monitor keeps polling while SMTP
+    round trips happen on the worker. At most ``max_pending`` alerts wait;
+    past that, a low-priority (HOLD/CAUTION/NO_EDGE) alert is shed —
+    the oldest queued one, or the new one if nothing queued is shed-able.
+    """
+
+    def __init__(self, mailer: SpikeMailer, max_pending: int = 20) -> None:
+        self._mailer = mailer
+        self._max_pending = max_pending
+        self._pending: deque[tuple[str, str, bool]] = deque()
+        self._cond = threading.Condition()
+        self._closing = False
+        self._worker = threading.Thread(
+            target=self._drain, name="spike-mailer", daemon=True,
+        )
+        self._worker.start()
+
+    def submit(self, subject: str, html_body: str, signal: str = "") -> bool:
+        """Queue an alert. Returns False if it was shed instead."""
+        low = signal in _LOW_PRIORITY_SIGNALS
+        with self._cond:
+            if self._closing:
+                return False
+            if len(self._pending) >= self._max_pending:
+                victim = next((m for m in self._pending if m[2]), None)
+                if victim is None:
+                    if low:
+                        logger.warning("Spike mail queue full — dropped %s", subject)
+                        return False
+                    victim = self._pending[0]
+                self._pending.remove(victim)
+                logger.warning("Spike mail queue full — dropped %s", victim[0])
+            self._pending.append((subject, html_body, low))
+            self._cond.notify()
+        return True
+
+    def _drain(self) -> None:
+        try:
+            while True:
+                with self._cond:
+                    while not self._pending and not self._closing:
+                        self._cond.wait()
+                    if not self._pending:
+                        return
+                    subject, html_body, _ = self._pending.popleft()
+                try:
+                    self._mailer.send(subject, html_body)
+                except Exception:
+                    logger.exception("Failed to send spike email: %s", subject)
+        finally:
+            # Closed here, not in close(), so the session is never torn
+            # down under a send still in flight.
+            self._mailer.close()
+
+    def close(self, timeout: Optional[float] = 30.0) -> None:
+        """Send what's queued (waiting up to ``timeout``), then close the session.
+
+        If the queue hasn't drained in time, the worker keeps going and
+        closes the session itself once it finishes.
+        """
+        with self._cond:
+            self._closing = True
+            self._cond.notify()
+        self._worker.join(timeout)
+        if self._worker.is_alive():
+            logger.warning("Spike mail queue still draining after %ss", timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -5,13 +5,16 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SpikeConfig:
     """All spike monitor thresholds — configurable via CLI flags."""
 
     spike_threshold_cents: int = 15
     window_seconds: int = 420          # 7 minutes
     poll_interval_seconds: int = 30
+    min_poll_interval_seconds: int = 5  # adaptive floor; set = poll to disable
+    quick_check_seconds: int = 5        # between-poll peeks at top movers
+    quick_check_tickers: int = 5        # 0 disables the peeks
     burst_count: int = 5
     burst_interval_seconds: int = 60
     start_hour_est: int = 8            # 08:00 EST
@@ -8,14 +8,19 @@ State machine with two modes:
 
 from __future__ import annotations
 
+import heapq
 import logging
+import math
 import time
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 from zoneinfo import ZoneInfo
 
+import httpx
+
 from kalshi_weather.edge import analyze_city
 from kalshi_weather.nws_scraper import NWSScraper
 from kalshi_weather.rules import lookup_station
@@ -33,7 +38,7 @@ logger = logging.getLogger(__name__)
 # ── Price History ────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PriceSnapshot:
     """A single price observation."""
 
@@ -41,19 +46,35 @@ class PriceSnapshot:
     timestamp: float  # monotonic time
 
 
+# Stored form of a snapshot: a plain (price_cents, timestamp) tuple, in
+# PriceSnapshot field order. Every poll records one per bracket, so
+# PriceSnapshot objects are only built on demand by get_history().
+_PRICE = 0
+_TS = 1
+
+
 class PriceHistory:
-    """Rolling price history for all tracked brackets."""
+    """Rolling price history for all tracked brackets.
+
+    Each ticker's deque is kept in timestamp order and trimmed from the
+    left on every ``record``, so its front is the oldest snapshot still
+    within ``max_age_seconds`` of the latest one.
+    """
 
     def __init__(self, max_age_seconds: int = 600) -> None:
         self._max_age = max_age_seconds
-        self._data: dict[str, deque[PriceSnapshot]] = {}
+        self._data: dict[str, deque[tuple[int, float]]] = {}
 
     def record(self, ticker: str, price_cents: int, ts: float | None = None) -> None:
         if ts is None:
             ts = time.monotonic()
-        if ticker not in self._data:
-            self._data[ticker] = deque()
-        self._data[ticker].append(PriceSnapshot(price_cents, ts))
+        dq = self._data.get(ticker)
+        if dq is None:
+            dq = self._data[ticker] = deque()
+        dq.append((price_cents, ts))
+        cutoff = ts - self._max_age
+        while dq[0][_TS] < cutoff:
+            dq.popleft()
 
     def prune(self, ticker: str, now: float | None = None) -> None:
         if now is None:
@@ -62,21 +83,37 @@ class PriceHistory:
             return
         cutoff = now - self._max_age
         dq = self._data[ticker]
-        while dq and dq[0].timestamp < cutoff:
+        while dq and dq[0][_TS] < cutoff:
             dq.popleft()
 
-    def prune_all(self, now: float | None = None) -> None:
-        for ticker in list(self._data.keys()):
-            self.prune(ticker, now)
+    def prune_all(self, now: float | None = None) -> list[str]:
+        """Trim every ticker and forget those left empty.
+
+        A ticker that empties has gone unrecorded for ``max_age_seconds``
+        (settled or delisted), so its key is dropped rather than left to
+        slow every later pass. Returns the evicted tickers.
+        """
+        if now is None:
+            now = time.monotonic()
+        cutoff = now - self._max_age
+        evicted: list[str] = []
+        for ticker, dq in self._data.items():
+            while dq and dq[0][_TS] < cutoff:
+                dq.popleft()
+            if not dq:
+                evicted.append(ticker)
+        for ticker in evicted:
+            del self._data[ticker]
+        return evicted
 
     def get_history(self, ticker: str) -> list[PriceSnapshot]:
-        return list(self._data.get(ticker, []))
+        return [PriceSnapshot(*entry) for entry in self._data.get(ticker, ())]
 
 
 # ── Spike Detection ─────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SpikeEvent:
     """A detected price spike."""
 
@@ -103,58 +140,215 @@ def detect_spike(
         cooldowns = {}
 
     window_start = now - config.window_seconds
-    best: Optional[SpikeEvent] = None
+    # A ticker is still cooling down if its last spike came after this.
+    cooled_before = now - config.cooldown_seconds
+    # Track the leader as plain locals and build one SpikeEvent at the
+    # end; a delta must beat this to count, so it starts at threshold-1.
+    best_delta = config.spike_threshold_cents - 1
+    best_ticker: Optional[str] = None
+    best_old = best_new = None
 
     for ticker, snapshots in history._data.items():
-        # Check cooldown
-        if ticker in cooldowns:
-            if now - cooldowns[ticker] < config.cooldown_seconds:
-                continue
+        if cooldowns.get(ticker, -math.inf) > cooled_before:
+            continue
 
+        # Snapshots are time-ordered, so anything before the window sits
+        # at the front; once trimmed, the front is the oldest in window.
+        while snapshots and snapshots[0][_TS] < window_start:
+            snapshots.popleft()
         if len(snapshots) < 2:
             continue
+        old, new = snapshots[0], snapshots[-1]
+        delta = new[_PRICE] - old[_PRICE]
+        if delta > best_delta:
+            best_delta = delta
+            best_ticker, best_old, best_new = ticker, old, new
+
+    if best_ticker is None:
+        return None
+    return SpikeEvent(
+        ticker=best_ticker,
+        old_price=best_old[_PRICE],
+        new_price=best_new[_PRICE],
+        delta=best_delta,
+        seconds_elapsed=best_new[_TS] - best_old[_TS],
+    )
 
-        # Find the oldest snapshot within the window
-        oldest_in_window: Optional[PriceSnapshot] = None
-        for snap in snapshots:
-            if snap.timestamp >= window_start:
-                oldest_in_window = snap
-                break
 
-        if oldest_in_window is None:
-            continue
+# ── Adaptive polling ────────────────────────────────────────────────
+
+# Smoothing for the per-poll largest move, so one jumpy poll doesn't
+# pin the cadence to the floor.
+_MOVE_EWMA_ALPHA = 0.3
+
+
+def largest_move(history: PriceHistory) -> int:
+    """Largest absolute price move held in history, across all tickers.
 
-        # Current price is the latest snapshot
-        current = snapshots[-1]
-        delta = current.price_cents - oldest_in_window.price_cents
-
-        if delta >= config.spike_threshold_cents:
-            elapsed = current.timestamp - oldest_in_window.timestamp
-            event = SpikeEvent(
-                ticker=ticker,
-                old_price=oldest_in_window.price_cents,
-                new_price=current.price_cents,
-                delta=delta,
-                seconds_elapsed=elapsed,
+    Unlike detect_spike this ignores cooldowns and the threshold — it is
+    a volatility gauge for the poll cadence, not an alert trigger.
+    """
+    biggest = 0
+    for snapshots in history._data.values():
+        if len(snapshots) > 1:
+            move = abs(snapshots[-1][_PRICE] - snapshots[0][_PRICE])
+            if move > biggest:
+                biggest = move
+    return biggest
+
+
+def next_poll_interval(recent_move: float, config: SpikeConfig) -> float:
+    """Seconds to sleep before the next poll, given the smoothed move.
+
+    Runs at the configured cadence while moves stay under half the spike
+    threshold, then shortens in proportion as prices pick up, so a spike
+    building inside one window is caught on the way up. Never goes below
+    ``min_poll_interval_seconds``.
+    """
+    base = config.poll_interval_seconds
+    interval = base * (config.spike_threshold_cents / 2) / max(recent_move, 1.0)
+    return max(config.min_poll_interval_seconds, min(interval, base))
+
+
+def top_movers(
+    history: PriceHistory,
+    k: int,
+    exclude: frozenset[str] | set[str] = frozenset(),
+) -> list[tuple[str, int]]:
+    """The *k* tickers with the largest in-history move, as (ticker, last price).
+
+    Tickers in *exclude* (e.g. still cooling down after a burst) are skipped.
+    """
+    moves = [
+        (abs(dq[-1][_PRICE] - dq[0][_PRICE]), ticker, dq[-1][_PRICE])
+        for ticker, dq in history._data.items()
+        if dq and ticker not in exclude
+    ]
+    return [(ticker, last) for _, ticker, last in heapq.nlargest(k, moves)]
+
+
+def quick_check(
+    client: object,
+    movers: list[tuple[str, int]],
+    trigger_cents: int,
+) -> bool:
+    """True if any mover's best YES bid is *trigger_cents* off its last poll.
+
+    One bulk orderbook request at depth 1 — much lighter than re-fetching
+    every tracked series — so it can run several times between full polls.
+    Transient failures count as "no move"; a 4xx (bulk endpoint not
+    supported) propagates so the caller can stop peeking.
+    """
+    try:
+        books = client.get_orderbooks([ticker for ticker, _ in movers], depth=1)
+    except httpx.HTTPStatusError as exc:
+        if 400 <= exc.response.status_code < 500:
+            raise
+        logger.debug("Quick check failed", exc_info=True)
+        return False
+    except Exception:
+        logger.debug("Quick check failed", exc_info=True)
+        return False
+    for ticker, last_price in movers:
+        ob = books.get(ticker, {}).get("orderbook") or {}
+        yes_bids = ob.get("yes") or []
+        if yes_bids and abs(yes_bids[-1][0] - last_price) >= trigger_cents:
+            logger.info(
+                "Quick check: %s moved %d\u00a2 \u2192 %d\u00a2, polling early",
+                ticker, last_price, yes_bids[-1][0],
             )
-            if best is None or delta > best.delta:
-                best = event
+            return True
+    return False
+
+
+def wait_for_next_poll(
+    client: object,
+    history: PriceHistory,
+    interval: float,
+    config: SpikeConfig,
+    cooldowns: dict[str, float] | None = None,
+    peek: bool = True,
+) -> bool:
+    """Sleep up to *interval* seconds, returning early on a sharp move.
 
-    return best
+    The wait is split into ``quick_check_seconds`` slices; after each,
+    the top movers are peeked at and a move of half the spike threshold
+    ends the wait so the full poll runs now rather than at the next
+    fixed tick. Tickers still in *cooldowns* aren't peeked at — one that
+    just burst would otherwise keep cutting every wait short.
+
+    With *peek* False this is a plain sleep. Returns False once the bulk
+    orderbook endpoint has rejected a peek, so the caller can stop asking.
+    """
+    now = time.monotonic()
+    deadline = now + interval
+    movers: list[tuple[str, int]] = []
+    if peek:
+        cooling: set[str] = set()
+        if cooldowns:
+            cooled_before = now - config.cooldown_seconds
+            cooling = {t for t, at in cooldowns.items() if at > cooled_before}
+        movers = top_movers(history, config.quick_check_tickers, cooling)
+    step = config.quick_check_seconds
+    trigger = max(config.spike_threshold_cents // 2, 1)
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return peek
+        if not movers or step <= 0 or remaining <= step:
+            time.sleep(remaining)
+            return peek
+        time.sleep(step)
+        try:
+            if quick_check(client, movers, trigger):
+                return peek
+        except httpx.HTTPStatusError as exc:
+            logger.warning(
+                "Bulk orderbook endpoint rejected quick checks (HTTP %d) — "
+                "polling on the plain interval",
+                exc.response.status_code,
+            )
+            peek = False
+            movers = []
 
 
 # ── Market polling helpers ───────────────────────────────────────────
 
 
-def extract_bracket_prices(event: dict) -> dict[str, int]:
-    """Extract {ticker: yes_bid_cents} from nested markets."""
-    prices: dict[str, int] = {}
+def extract_bracket_data(event: dict) -> dict[str, tuple[int, str]]:
+    """Extract {ticker: (yes_bid_cents, bracket_def)} in one markets pass.
+
+    bracket_def is the market's ``yes_sub_title``, falling back to its
+    ``title``.
+    """
+    data: dict[str, tuple[int, str]] = {}
     for mkt in event.get("markets", []):
         ticker = mkt.get("ticker", "")
         yes_bid = mkt.get("yes_bid")
         if ticker and yes_bid is not None:
-            prices[ticker] = int(yes_bid)
-    return prices
+            data[ticker] = (
+                int(yes_bid),
+                mkt.get("yes_sub_title", mkt.get("title", "")),
+            )
+    return data
+
+
+def extract_bracket_prices(event: dict) -> dict[str, int]:
+    """Extract {ticker: yes_bid_cents} from nested markets."""
+    return {
+        ticker: price
+        for ticker, (price, _) in extract_bracket_data(event).items()
+    }
+
+
+def format_burst_time(dt: datetime) -> str:
+    """12-hour clock label for burst emails, e.g. ``"3:07 PM EST"``.
+
+    Same output as ``strftime("%I:%M %p EST").lstrip("0")`` without
+    parsing a format string or depending on the locale's AM/PM names.
+    """
+    hour = dt.hour
+    return f"{hour % 12 or 12}:{dt.minute:02d} {'AM' if hour < 12 else 'PM'} EST"
 
 
 def is_in_operating_window(
@@ -168,6 +362,49 @@ def is_in_operating_window(
     )
 
 
+def fetch_series_events(
+    client: object,
+    tracked_series: dict[str, str],
+    max_workers: int = 6,
+) -> list[tuple[str, list[dict]]]:
+    """Fetch open events (with nested markets) for every tracked series.
+
+    The per-series requests are independent, so they run on a bounded
+    thread pool rather than back to back. Returns ``(city, events)``
+    pairs in *tracked_series* order; series that fail are logged and
+    left out.
+    """
+    def fetch(series_ticker: str) -> Optional[list[dict]]:
+        try:
+            events, _ = client.get_events(
+                series_ticker=series_ticker,
+                status="open",
+                with_nested_markets=True,
+            )
+        except Exception:
+            logger.warning(
+                "Failed to fetch %s events",
+                tracked_series[series_ticker],
+                exc_info=True,
+            )
+            return None
+        return events
+
+    tickers = list(tracked_series)
+    if max_workers <= 1 or len(tickers) <= 1:
+        results = [fetch(t) for t in tickers]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(tickers)),
+        ) as ex:
+            results = list(ex.map(fetch, tickers))
+    return [
+        (tracked_series[t], events)
+        for t, events in zip(tickers, results)
+        if events is not None
+    ]
+
+
 # ── Series discovery ─────────────────────────────────────────────
 
 
@@ -198,7 +435,7 @@ def discover_tracked_series(
     canonical_set: dict[str, str] = {}
     for city in tracked_cities:
         station = lookup_station(city)
-        canonical = station["kalshi_city"] if station else city
+        canonical = station.kalshi_city if station else city
         canonical_set[canonical.lower()] = canonical
 
     result: dict[str, str] = {}
@@ -226,7 +463,7 @@ def discover_tracked_series(
 
         city = _extract_city_from_event(events[0])
         station = lookup_station(city)
-        canonical = station["kalshi_city"] if station else city
+        canonical = station.kalshi_city if station else city
 
         if canonical.lower() in canonical_set:
             result[series_ticker] = canonical
@@ -238,6 +475,19 @@ def discover_tracked_series(
 # ── Burst data collection ───────────────────────────────────────────
 
 
+def _fetch_best_yes_bid(client: object, ticker: str) -> Optional[int]:
+    """Best YES bid for *ticker* from its orderbook, or None on failure."""
+    try:
+        return client.get_orderbook_best_yes(ticker)
+    except Exception:
+        logger.warning(
+            "Failed to fetch orderbook for %s",
+            ticker,
+            exc_info=True,
+        )
+    return None
+
+
 def collect_burst_data(
     city: str,
     ticker: str,
@@ -249,25 +499,15 @@ def collect_burst_data(
     Returns a dict with all fields needed by
     build_spike_email_html, or None if analysis fails.
     """
-    report = analyze_city(city, scraper)
+    # The orderbook call doesn't depend on the NWS scrape, so issue it
+    # on a helper thread while analyze_city runs.
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        ob_future = ex.submit(_fetch_best_yes_bid, client, ticker)
+        report = analyze_city(city, scraper)
+        orderbook_price = ob_future.result()
     if report is None:
         return None
 
-    # Fetch orderbook for precise current price
-    orderbook_price: Optional[int] = None
-    try:
-        raw_ob = client.get_orderbook(ticker, depth=10)
-        ob = raw_ob.get("orderbook", {})
-        yes_bids = ob.get("yes") or []
-        if yes_bids:
-            orderbook_price = yes_bids[-1][0]
-    except Exception:
-        logger.warning(
-            "Failed to fetch orderbook for %s",
-            ticker,
-            exc_info=True,
-        )
-
     bracket_obj = report.bracket
     return {
         "signal": report.signal.value,
@@ -294,6 +534,33 @@ def collect_burst_data(
     }
 
 
+@dataclass(slots=True, frozen=True)
+class ConvictionEntry:
+    """One burst email's reading, shown as a conviction trend row."""
+
+    time_str: str
+    signal: str
+    temp_f: Optional[float]
+    market_price: Optional[int]
+
+
+def _conviction_row(
+    index: int, total: int, entry: ConvictionEntry, is_current: bool,
+) -> str:
+    """Render a filled ConvictionEntry as a table row."""
+    from kalshi_weather.spike_alerter import build_conviction_row
+
+    return build_conviction_row(
+        index=index,
+        total=total,
+        time_str=entry.time_str,
+        signal=entry.signal,
+        temp_f=entry.temp_f,
+        market_price=entry.market_price,
+        is_current=is_current,
+    )
+
+
 # ── Main monitoring loop ────────────────────────────────────────────
 
 
@@ -312,22 +579,41 @@ def run_spike_monitor(
     import time as _time
 
     from kalshi_weather.spike_alerter import (
+        QueuedSpikeMailer,
+        SpikeMailer,
         build_conviction_row,
         build_spike_email_html,
-        send_spike_email,
     )
 
     if config is None:
         config = SpikeConfig()
 
+    # Sized to the detection window so each deque's front is the
+    # spike baseline and detect_spike never scans.
     history = PriceHistory(
-        max_age_seconds=config.window_seconds + 120,
+        max_age_seconds=config.window_seconds,
     )
     cooldowns: dict[str, float] = {}
     ticker_meta: dict[str, tuple[str, str, str]] = {}
     et = ZoneInfo("US/Eastern")
     last_discovery_date = None
     tracked_series: dict[str, str] = {}
+    recent_move = 0.0  # EWMA of largest_move(), drives the poll cadence
+    quick_checks = True  # cleared if the bulk orderbook endpoint rejects peeks
+    # event_ticker -> targets today? An event's dates never change, so
+    # each decision holds until the date rolls over.
+    today_cache: dict[str, bool] = {}
+    today_cache_date = ""
+    # Opened on the first burst and kept for the run, so later bursts
+    # reuse its pooled NWS connections instead of new TLS handshakes.
+    scraper: Optional[NWSScraper] = None
+    # One SMTP session for the whole run, reused across bursts and
+    # driven from a background thread so sends never stall polling.
+    mailer = (
+        QueuedSpikeMailer(SpikeMailer(gmail_address, gmail_app_password))
+        if gmail_address and gmail_app_password
+        else None
+    )
 
     logger.info(
         "Spike monitor starting "
@@ -381,74 +667,72 @@ def run_spike_monitor(
 
             # ── MONITORING phase ─────────────────────────
             mono_now = _time.monotonic()
-            today_str = now_est.strftime("%Y-%m-%d")
+            today_str = current_date.isoformat()
+            if today_str != today_cache_date:
+                today_cache.clear()
+                today_cache_date = today_str
 
-            for series_ticker, city in (
-                tracked_series.items()
+            for city, events in fetch_series_events(
+                client, tracked_series,
             ):
-                try:
-                    events, _ = client.get_events(
-                        series_ticker=series_ticker,
-                        status="open",
-                        with_nested_markets=True,
-                    )
-                except Exception:
-                    logger.warning(
-                        "Failed to fetch %s events",
-                        city,
-                        exc_info=True,
-                    )
-                    continue
-
                 for event in events:
-                    if not _is_today_event(
-                        event, today_str,
-                    ):
-                        continue
-
                     evt_ticker = event.get(
                         "event_ticker", "",
                     )
-                    prices = extract_bracket_prices(event)
+                    is_today = today_cache.get(evt_ticker)
+                    if is_today is None:
+                        is_today = _is_today_event(
+                            event, today_str,
+                        )
+                        if evt_ticker:
+                            today_cache[evt_ticker] = is_today
+                    if not is_today:
+                        continue
 
-                    for ticker, price in prices.items():
+                    for ticker, (price, bracket_def) in (
+                        extract_bracket_data(event).items()
+                    ):
                         history.record(
                             ticker, price, mono_now,
                         )
-                        bracket_def = ""
-                        for mkt in event.get(
-                            "markets", [],
-                        ):
-                            if (
-                                mkt.get("ticker")
-                                == ticker
-                            ):
-                                bracket_def = mkt.get(
-                                    "yes_sub_title",
-                                    mkt.get(
-                                        "title", ""
-                                    ),
-                                )
-                                break
-                        ticker_meta[ticker] = (
-                            city,
-                            bracket_def,
-                            evt_ticker,
-                        )
+                        # A market ticker's city, bracket and event
+                        # never change, so record them once.
+                        if ticker not in ticker_meta:
+                            ticker_meta[ticker] = (
+                                city,
+                                bracket_def,
+                                evt_ticker,
+                            )
 
-            history.prune_all(mono_now)
+            for ticker in history.prune_all(mono_now):
+                ticker_meta.pop(ticker, None)
+            if cooldowns:
+                cooled_before = mono_now - config.cooldown_seconds
+                cooldowns = {
+                    t: at for t, at in cooldowns.items()
+                    if at > cooled_before
+                }
 
             spike = detect_spike(
                 history, config, mono_now, cooldowns,
             )
 
             if spike is None:
+                recent_move += _MOVE_EWMA_ALPHA * (
+                    largest_move(history) - recent_move
+                )
+                interval = next_poll_interval(recent_move, config)
                 logger.debug(
                     "No spike detected "
-                    "(%d tickers tracked)",
+                    "(%d tickers tracked, "
+                    "next poll in %.0fs)",
                     len(ticker_meta),
+                    interval,
+                )
+                quick_checks = wait_for_next_poll(
+                    client, history, interval, config, cooldowns,
+                    quick_checks,
                 )
-                _time.sleep(config.poll_interval_seconds)
                 continue
 
             # ── BURST phase ──────────────────────────────
@@ -469,186 +753,149 @@ def run_spike_monitor(
             )
 
             cooldowns[spike.ticker] = _time.monotonic()
-            conviction_history: list[dict] = []
-
-            with NWSScraper() as scraper:
-                for burst_idx in range(
-                    1, config.burst_count + 1,
-                ):
-                    burst_time = datetime.now(et)
-                    time_str = burst_time.strftime(
-                        "%I:%M %p EST",
-                    ).lstrip("0")
-
-                    data = collect_burst_data(
-                        city,
-                        spike.ticker,
-                        client,
-                        scraper,
-                    )
+            prev_entry: Optional[ConvictionEntry] = None
+            total = config.burst_count
+            # Rendered rows, one per burst email; pending until filled.
+            rows = [
+                build_conviction_row(
+                    index=j,
+                    total=total,
+                    time_str="(pending)",
+                    signal=None,
+                    temp_f=None,
+                    market_price=None,
+                    is_current=False,
+                )
+                for j in range(1, total + 1)
+            ]
+            # One wall-clock read per burst; later timestamps add the
+            # monotonic elapsed time instead of re-resolving the zone.
+            burst_wall = datetime.now(et)
+            burst_mono = _time.monotonic()
+
+            if scraper is None:
+                scraper = NWSScraper()
+            for burst_idx in range(
+                1, config.burst_count + 1,
+            ):
+                burst_time = burst_wall + timedelta(
+                    seconds=_time.monotonic() - burst_mono,
+                )
+                time_str = format_burst_time(burst_time)
 
-                    if data is not None:
-                        conviction_history.append({
-                            "time_str": time_str,
-                            "signal": data["signal"],
-                            "temp_f": (
-                                data["precise_f"]
-                            ),
-                            "market_price": (
-                                data.get(
-                                    "current_price",
-                                )
-                                or spike.new_price
-                            ),
-                        })
-                    else:
-                        conviction_history.append({
-                            "time_str": time_str,
-                            "signal": "NO_EDGE",
-                            "temp_f": None,
-                            "market_price": None,
-                        })
-
-                    rows: list[str] = []
-                    for i, entry in enumerate(
-                        conviction_history, 1,
-                    ):
-                        rows.append(
-                            build_conviction_row(
-                                index=i,
-                                total=(
-                                    config.burst_count
-                                ),
-                                time_str=(
-                                    entry["time_str"]
-                                ),
-                                signal=(
-                                    entry["signal"]
-                                ),
-                                temp_f=(
-                                    entry["temp_f"]
-                                ),
-                                market_price=(
-                                    entry[
-                                        "market_price"
-                                    ]
-                                ),
-                                is_current=(
-                                    i == burst_idx
-                                ),
-                            )
-                        )
-                    for j in range(
-                        burst_idx + 1,
-                        config.burst_count + 1,
-                    ):
-                        rows.append(
-                            build_conviction_row(
-                                index=j,
-                                total=(
-                                    config.burst_count
-                                ),
-                                time_str="(pending)",
-                                signal=None,
-                                temp_f=None,
-                                market_price=None,
-                                is_current=False,
-                            )
-                        )
+                data = collect_burst_data(
+                    city,
+                    spike.ticker,
+                    client,
+                    scraper,
+                )
 
-                    d = data or {}
-                    html = build_spike_email_html(
-                        city=city,
-                        bracket=bracket_def,
-                        email_number=burst_idx,
-                        email_total=(
-                            config.burst_count
-                        ),
-                        time_str=time_str,
-                        old_price=spike.old_price,
-                        new_price=spike.new_price,
-                        current_price=(
-                            d.get("current_price")
-                            or spike.new_price
-                        ),
-                        spike_delta=spike.delta,
-                        metar_f=d.get("metar_f"),
-                        precise_f=d.get("precise_f"),
-                        precise_c=d.get("precise_c"),
-                        precise_source=d.get(
-                            "precise_source", "",
-                        ),
-                        running_max_f=d.get(
-                            "running_max_f",
-                        ),
-                        margin_c=d.get("margin_c"),
-                        margin_status=d.get(
-                            "margin_status",
-                            "UNKNOWN",
-                        ),
-                        signal=d.get(
-                            "signal", "NO_EDGE",
-                        ),
-                        signal_reason=d.get(
-                            "signal_reason",
-                            "Analysis unavailable.",
-                        ),
-                        time_risk=d.get(
-                            "time_risk", "UNKNOWN",
-                        ),
-                        conviction_rows=rows,
+                if data is not None:
+                    entry = ConvictionEntry(
+                        time_str,
+                        data["signal"],
+                        data["precise_f"],
+                        data.get("current_price")
+                        or spike.new_price,
+                    )
+                else:
+                    entry = ConvictionEntry(
+                        time_str, "NO_EDGE", None, None,
                     )
 
-                    subject = (
-                        f"SPIKE: {city} "
-                        f"{bracket_def} "
-                        f"[{burst_idx}"
-                        f"/{config.burst_count}]"
+                # Fill this burst's row and re-render the previous one
+                # to drop its "you are here" marker; the rest are kept.
+                if prev_entry is not None:
+                    rows[burst_idx - 2] = _conviction_row(
+                        burst_idx - 1, total, prev_entry, False,
                     )
-                    if (
-                        gmail_address
-                        and gmail_app_password
-                    ):
-                        try:
-                            send_spike_email(
-                                subject,
-                                html,
-                                gmail_address,
-                                gmail_app_password,
-                            )
-                        except Exception:
-                            logger.exception(
-                                "Failed to send "
-                                "spike email "
-                                "%d/%d",
-                                burst_idx,
-                                config.burst_count,
-                            )
-                    else:
-                        logger.warning(
-                            "Email not configured "
-                            "— spike alert "
-                            "not sent",
-                        )
+                rows[burst_idx - 1] = _conviction_row(
+                    burst_idx, total, entry, True,
+                )
+                prev_entry = entry
+
+                d = data or {}
+                html = build_spike_email_html(
+                    city=city,
+                    bracket=bracket_def,
+                    email_number=burst_idx,
+                    email_total=(
+                        config.burst_count
+                    ),
+                    time_str=time_str,
+                    old_price=spike.old_price,
+                    new_price=spike.new_price,
+                    current_price=(
+                        d.get("current_price")
+                        or spike.new_price
+                    ),
+                    spike_delta=spike.delta,
+                    metar_f=d.get("metar_f"),
+                    precise_f=d.get("precise_f"),
+                    precise_c=d.get("precise_c"),
+                    precise_source=d.get(
+                        "precise_source", "",
+                    ),
+                    running_max_f=d.get(
+                        "running_max_f",
+                    ),
+                    margin_c=d.get("margin_c"),
+                    margin_status=d.get(
+                        "margin_status",
+                        "UNKNOWN",
+                    ),
+                    signal=d.get(
+                        "signal", "NO_EDGE",
+                    ),
+                    signal_reason=d.get(
+                        "signal_reason",
+                        "Analysis unavailable.",
+                    ),
+                    time_risk=d.get(
+                        "time_risk", "UNKNOWN",
+                    ),
+                    conviction_rows=rows,
+                )
 
-                    logger.info(
-                        "Burst email %d/%d sent: "
-                        "%s %s — signal=%s",
-                        burst_idx,
-                        config.burst_count,
-                        city,
-                        bracket_def,
-                        d.get("signal", "N/A"),
+                subject = (
+                    f"SPIKE: {city} "
+                    f"{bracket_def} "
+                    f"[{burst_idx}"
+                    f"/{config.burst_count}]"
+                )
+                if mailer is not None:
+                    # Send failures are logged by
+                    # the mailer's worker thread.
+                    mailer.submit(
+                        subject,
+                        html,
+                        d.get("signal", "NO_EDGE"),
+                    )
+                else:
+                    logger.warning(
+                        "Email not configured "
+                        "— spike alert "
+                        "not sent",
                     )
 
-                    if (
-                        burst_idx
-                        < config.burst_count
-                    ):
-                        _time.sleep(
-                            config
-                            .burst_interval_seconds,
-                        )
+                logger.info(
+                    "Burst email %d/%d queued: "
+                    "%s %s — signal=%s",
+                    burst_idx,
+                    config.burst_count,
+                    city,
+                    bracket_def,
+                    d.get("signal", "N/A"),
+                )
+
+                if (
+                    burst_idx
+                    < config.burst_count
+                ):
+                    _time.sleep(
+                        config
+                        .burst_interval_seconds,
+                    )
 
             logger.info(
                 "Burst complete. "
@@ -659,3 +906,8 @@ def run_spike_monitor(
         logger.info(
             "Spike monitor stopped by user.",
         )
+    finally:
+        if scraper is not None:
+            scraper.close()
+        if mailer is not None:
+            mailer.close()
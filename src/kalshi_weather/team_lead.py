@@ -8,7 +8,8 @@ ranks, and enforces pick count limits.
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional
 
 from kalshi_weather.config import DEFAULT_CONFIG, Config
 from kalshi_weather.planner import (
@@ -24,7 +25,6 @@ from kalshi_weather.schemas import (
     ModelOutput,
     RiskRecommendation,
     SettlementSpec,
-    UncertaintyLevel,
     UnifiedCandidate,
 )
 
@@ -60,14 +60,13 @@ def merge_candidate(
         bucket=Bucket.REJECTED,
         bucket_reason="",
         rank=None,
-        warnings=[],
     )
 
 
 # ── Task #34: Hard reject pipeline ──────────────────────────────────
 
 def apply_hard_rejects(candidate: UnifiedCandidate) -> tuple[bool, str]:
-    """Apply all hard reject gates in sequence.
+    """Apply all hard reject gates in sequence, cheapest first.
 
     Returns (rejected: bool, reason: str).
     """
@@ -76,48 +75,96 @@ def apply_hard_rejects(candidate: UnifiedCandidate) -> tuple[bool, str]:
     # 1. Mapping confidence must be HIGH.
     if candidate.settlement_spec is not None:
         if candidate.settlement_spec.mapping_confidence != MappingConfidence.HIGH:
-            conf = candidate.settlement_spec.mapping_confidence.value
+            conf = candidate.settlement_spec.mapping_confidence
             return True, f"Mapping confidence {conf} != HIGH"
 
     # 2. Must have implied NO ask (requires best_yes_bid).
     if ob.implied_best_no_ask_cents is None:
         return True, "Cannot compute implied_best_no_ask — missing best_yes_bid"
 
-    # 3. Spread sanity.
-    spread = assess_spread(ob)
-    if spread.verdict == SpreadVerdict.REJECT:
-        return True, f"Spread reject: {spread.notes}"
-
-    # 4. EV must be positive.
+    # 3. EV must be positive.
     if candidate.fees_ev is not None:
         if candidate.fees_ev.no_trade_reason_if_any:
             return True, f"EV reject: {candidate.fees_ev.no_trade_reason_if_any}"
 
-    # 5. LOW lock-in gate.
+    # 4. LOW lock-in gate.
     if candidate.model is not None:
         m = candidate.model
         if (
-            m.lock_in_flag_if_low is not None
-            and m.lock_in_flag_if_low.value == "LOCKING"
+            m.lock_in_flag_if_low == "LOCKING"
             and m.p_new_lower_low_after_now is not None
             and m.p_new_lower_low_after_now < 0.05
         ):
             return True, "LOW lock-in: past sunrise+2h and P(new low) < 5%"
 
-        # 6. HIGH lock-in gate.
+        # 5. HIGH lock-in gate.
         if (
-            m.high_lock_in_flag is not None
-            and m.high_lock_in_flag.value == "LOCKING"
+            m.high_lock_in_flag == "LOCKING"
             and m.p_new_higher_high_after_now is not None
             and m.p_new_higher_high_after_now < 0.05
         ):
             return True, "HIGH lock-in: past peak+2h and P(new high) < 5%"
 
+    # 6. Spread sanity — last, since it builds a SpreadAssessment.
+    spread = assess_spread(ob)
+    if spread.verdict == SpreadVerdict.REJECT:
+        return True, f"Spread reject: {spread.notes}"
+
     return False, ""
 
 
 # ── Task #35: Bucket classifier ─────────────────────────────────────
 
+_Classifier = Callable[[Optional[int], int], tuple[Bucket, str]]
+
+
+@lru_cache(maxsize=8)
+def _compile_classifier(config: Config) -> _Classifier:
+    """Build ``classify(ask, room) -> (Bucket, reason)`` for one config.
+
+    The price window is fixed for a run, so the bucket for every ask on
+    the 0-100c grid and the ask-dependent part of each reason are worked
+    out once; classifying is then a table lookup plus the bid-room check.
+    """
+    pw = config.price_window
+    min_room = config.spread.min_bid_room_primary
+    window = f"[{pw.primary_low},{pw.primary_high}]"
+    lo_lo, lo_hi = pw.near_miss_low_band
+    hi_lo, hi_hi = pw.near_miss_high_band
+
+    # by_ask[ask] = (bucket, reason); bucket None means "PRIMARY if the
+    # bid room allows, else TIGHT" and reason is the shared prefix.
+    by_ask: list[tuple[Optional[Bucket], str]] = []
+    for ask in range(101):
+        if pw.primary_low <= ask <= pw.primary_high:
+            by_ask.append((None, f"ask={ask}c in {window}, room="))
+        elif lo_lo <= ask <= lo_hi:
+            by_ask.append((
+                Bucket.NEAR_MISS, f"ask={ask}c in near-miss low band [{lo_lo},{lo_hi}]",
+            ))
+        elif hi_lo <= ask <= hi_hi:
+            by_ask.append((
+                Bucket.NEAR_MISS, f"ask={ask}c in near-miss high band [{hi_lo},{hi_hi}]",
+            ))
+        else:
+            by_ask.append((Bucket.REJECTED, f"ask={ask}c outside scan window"))
+
+    def classify(ask: Optional[int], room: int) -> tuple[Bucket, str]:
+        if ask is None:
+            return Bucket.REJECTED, "No implied NO ask price"
+        if not 0 <= ask <= 100:
+            return Bucket.REJECTED, f"ask={ask}c outside scan window"
+        bucket, reason = by_ask[ask]
+        if bucket is not None:
+            return bucket, reason
+        # PRIMARY: ask in [90, 93] AND bid_room >= 2
+        if room >= min_room:
+            return Bucket.PRIMARY, f"{reason}{room}c >= {min_room}"
+        return Bucket.TIGHT, f"{reason}{room}c < {min_room}"
+
+    return classify
+
+
 def classify_bucket(
     candidate: UnifiedCandidate,
     config: Config = DEFAULT_CONFIG,
@@ -127,49 +174,12 @@ def classify_bucket(
     Assumes hard rejects have already been filtered out.
     """
     ob = candidate.orderbook_snapshot
-    ask = ob.implied_best_no_ask_cents
-    pw = config.price_window
-
-    if ask is None:
-        return Bucket.REJECTED, "No implied NO ask price"
-
     room = ob.bid_room_cents if ob.bid_room_cents is not None else 0
-
-    # PRIMARY: ask in [90, 93] AND bid_room >= 2
-    min_room = config.spread.min_bid_room_primary
-    if pw.primary_low <= ask <= pw.primary_high:
-        window = f"[{pw.primary_low},{pw.primary_high}]"
-        if room >= min_room:
-            return Bucket.PRIMARY, f"ask={ask}c in {window}, room={room}c >= {min_room}"
-        else:
-            return Bucket.TIGHT, f"ask={ask}c in {window}, room={room}c < {min_room}"
-
-    # NEAR-MISS: ask in [88,89] or [94,95]
-    lo_lo, lo_hi = pw.near_miss_low_band
-    hi_lo, hi_hi = pw.near_miss_high_band
-    if lo_lo <= ask <= lo_hi:
-        return Bucket.NEAR_MISS, f"ask={ask}c in near-miss low band [{lo_lo},{lo_hi}]"
-    if hi_lo <= ask <= hi_hi:
-        return Bucket.NEAR_MISS, f"ask={ask}c in near-miss high band [{hi_lo},{hi_hi}]"
-
-    return Bucket.REJECTED, f"ask={ask}c outside scan window"
+    return _compile_classifier(config)(ob.implied_best_no_ask_cents, room)
 
 
 # ── Task #36: Ranking engine ────────────────────────────────────────
 
-_UNCERTAINTY_RANK = {
-    UncertaintyLevel.LOW: 0,
-    UncertaintyLevel.MED: 1,
-    UncertaintyLevel.HIGH: 2,
-}
-
-_KNIFE_EDGE_RANK = {
-    "LOW": 0,
-    "MED": 1,
-    "HIGH": 2,
-}
-
-
 def _rank_sort_key(candidate: UnifiedCandidate) -> tuple:
     """Build a sort key for ranking (lower = better rank).
 
@@ -188,12 +198,11 @@ def _rank_sort_key(candidate: UnifiedCandidate) -> tuple:
     uncertainty = 1  # default MED
     knife_edge = 1
     if candidate.model is not None:
-        uncertainty = _UNCERTAINTY_RANK.get(candidate.model.uncertainty_level, 1)
-        knife_edge = _KNIFE_EDGE_RANK.get(candidate.model.knife_edge_risk.value, 1)
+        uncertainty = candidate.model.uncertainty_rank
+        knife_edge = candidate.model.knife_edge_rank
 
     # Liquidity: sum of top-3 depth from orderbook.
-    ob = candidate.orderbook_snapshot
-    depth = sum(q for _, q in ob.top3_yes_bids) + sum(q for _, q in ob.top3_no_bids)
+    depth = candidate.orderbook_snapshot.depth_top3_total
 
     hours_vol = 0.0
     if candidate.model is not None:
@@ -264,29 +273,27 @@ def run_bucket_pipeline(
     tight: list[UnifiedCandidate] = []
     near_miss: list[UnifiedCandidate] = []
     rejected: list[UnifiedCandidate] = []
+    classify = _compile_classifier(config)
+    by_bucket = {
+        Bucket.PRIMARY: primary,
+        Bucket.TIGHT: tight,
+        Bucket.NEAR_MISS: near_miss,
+        Bucket.REJECTED: rejected,
+    }
 
     for candidate in candidates:
         # Step 1: Hard reject check.
         is_rejected, reason = apply_hard_rejects(candidate)
         if is_rejected:
-            candidate.bucket = Bucket.REJECTED
-            candidate.bucket_reason = reason
-            rejected.append(candidate)
-            continue
-
-        # Step 2: Bucket classification.
-        bucket, reason = classify_bucket(candidate, config)
+            bucket = Bucket.REJECTED
+        else:
+            # Step 2: Bucket classification.
+            ob = candidate.orderbook_snapshot
+            room = ob.bid_room_cents if ob.bid_room_cents is not None else 0
+            bucket, reason = classify(ob.implied_best_no_ask_cents, room)
         candidate.bucket = bucket
         candidate.bucket_reason = reason
-
-        if bucket == Bucket.PRIMARY:
-            primary.append(candidate)
-        elif bucket == Bucket.TIGHT:
-            tight.append(candidate)
-        elif bucket == Bucket.NEAR_MISS:
-            near_miss.append(candidate)
-        else:
-            rejected.append(candidate)
+        by_bucket[bucket].append(candidate)
 
     # Step 3: Rank within each bucket.
     primary = rank_candidates(primary)
@@ -5,8 +5,14 @@ Uses api.weather.gov (no API key required, just User-Agent header).
 
 from __future__ import annotations
 
+import json
 import logging
+import os
+import threading
+import time
 from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
 from typing import Optional
 
 import httpx
@@ -22,6 +28,11 @@ _HEADERS = {
     "Accept": "application/geo+json",
 }
 
+# Station -> grid mappings change on the order of years, so resolved
+# forecastHourly URLs are kept on disk between runs.
+DEFAULT_GRIDPOINT_CACHE = Path.home() / ".cache" / "kalshi_weather" / "gridpoints.json"
+_GRIDPOINT_TTL_SECONDS = 30 * 86400
+
 
 @dataclass
 class CurrentObs:
@@ -47,13 +58,30 @@ class HourlyForecastPeriod:
 
 @dataclass
 class StationForecast:
-    """Hourly forecast for a station's grid point."""
+    """Hourly forecast for a station's grid point.
+
+    ``periods_raw`` holds the API's period dicts; ``periods`` parses them
+    on first access, since most callers only need the high/low.
+    """
 
     station_icao: str
-    periods: list[HourlyForecastPeriod] = field(default_factory=list)
+    periods_raw: list[dict] = field(default_factory=list, repr=False)
     forecast_high_f: Optional[float] = None
     forecast_low_f: Optional[float] = None
 
+    @cached_property
+    def periods(self) -> list[HourlyForecastPeriod]:
+        periods: list[HourlyForecastPeriod] = []
+        for p in self.periods_raw:
+            temp = p.get("temperature")
+            periods.append(HourlyForecastPeriod(
+                start_time=p.get("startTime", ""),
+                end_time=p.get("endTime", ""),
+                temp_f=float(temp) if temp is not None else None,
+                short_forecast=p.get("shortForecast", ""),
+            ))
+        return periods
+
 
 def _c_to_f(c: Optional[float]) -> Optional[float]:
     if c is None:
@@ -61,15 +89,50 @@ def _c_to_f(c: Optional[float]) -> Optional[float]:
     return round(c * 9 / 5 + 32, 1)
 
 
+def _load_gridpoint_cache(path: Path) -> dict[str, str]:
+    """Unexpired {icao: forecastHourly URL} entries from ``path``."""
+    try:
+        entries = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError):
+        logger.warning("Ignoring unreadable gridpoint cache %s", path, exc_info=True)
+        return {}
+    cutoff = time.time() - _GRIDPOINT_TTL_SECONDS
+    return {
+        icao: entry["url"]
+        for icao, entry in entries.items()
+        if isinstance(entry, dict) and entry.get("url") and entry.get("ts", 0) >= cutoff
+    }
+
+
 class WeatherAPI:
-    """Client for the NWS api.weather.gov."""
+    """Client for the NWS api.weather.gov.
+
+    Parameters
+    ----------
+    gridpoint_cache : JSON file persisting station -> forecast URL lookups
+        across runs (default: in-memory only).
+    refresh_gridpoints : ignore stored lookups and re-resolve every station.
+    """
 
     def __init__(
-        self, timeout: float = 15.0, config: Config = DEFAULT_CONFIG,
+        self,
+        timeout: float = 15.0,
+        config: Config = DEFAULT_CONFIG,
+        gridpoint_cache: str | Path | None = None,
+        refresh_gridpoints: bool = False,
     ) -> None:
         self._client = httpx.Client(timeout=timeout, headers=_HEADERS)
         self._config = config
         self._rate_limiter = RateLimiter(config.rate_limit.nws_requests_per_second)
+        # Station -> forecastHourly URL; the two-request resolution runs
+        # once per station (and once per TTL when persisted).
+        self._forecast_urls: dict[str, str] = {}
+        self._gridpoint_path = Path(gridpoint_cache) if gridpoint_cache else None
+        self._gridpoint_lock = threading.Lock()
+        if self._gridpoint_path is not None and not refresh_gridpoints:
+            self._forecast_urls.update(_load_gridpoint_cache(self._gridpoint_path))
         logger.info("WeatherAPI initialized")
 
     def close(self) -> None:
@@ -115,7 +178,10 @@ class WeatherAPI:
         )
 
     def _get_gridpoint_url(self, station_icao: str) -> Optional[str]:
-        """Resolve a station ICAO to its gridpoint forecast URL."""
+        """Resolve a station ICAO to its gridpoint forecast URL (cached)."""
+        cached = self._forecast_urls.get(station_icao)
+        if cached is not None:
+            return cached
         # Step 1: Get station metadata for coordinates.
         url = f"{_BASE}/stations/{station_icao}"
         try:
@@ -139,10 +205,41 @@ class WeatherAPI:
             logger.warning("Failed to get points for %s", station_icao, exc_info=True)
             return None
 
-        return points_data.get("properties", {}).get("forecastHourly")
+        forecast_url = points_data.get("properties", {}).get("forecastHourly")
+        if forecast_url:
+            self._forecast_urls[station_icao] = forecast_url
+            self._save_gridpoint(station_icao, forecast_url)
+        return forecast_url
+
+    def _save_gridpoint(self, station_icao: str, forecast_url: Optional[str]) -> None:
+        """Persist one lookup (``None`` drops it), merged with what's on disk."""
+        path = self._gridpoint_path
+        if path is None:
+            return
+        with self._gridpoint_lock:
+            try:
+                entries = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                entries = {}
+            if forecast_url is None:
+                entries.pop(station_icao, None)
+            else:
+                entries[station_icao] = {"url": forecast_url, "ts": time.time()}
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(".tmp")
+                tmp.write_text(json.dumps(entries, sort_keys=True), encoding="utf-8")
+                os.replace(tmp, path)
+            except OSError:
+                logger.warning("Failed to write gridpoint cache %s", path, exc_info=True)
 
     def get_hourly_forecast(self, station_icao: str) -> Optional[StationForecast]:
-        """Fetch hourly forecast for the grid point nearest a station."""
+        """Fetch hourly forecast for the grid point nearest a station.
+
+        A failed fetch from a cached URL drops the cache entry and retries
+        once with a freshly resolved URL, in case NWS moved the grid.
+        """
+        was_cached = station_icao in self._forecast_urls
         forecast_url = self._get_gridpoint_url(station_icao)
         if not forecast_url:
             return None
@@ -151,34 +248,26 @@ class WeatherAPI:
             resp = self._get(forecast_url)
             data = resp.json()
         except Exception:
+            if was_cached:
+                logger.info(
+                    "Cached forecast URL for %s failed — re-resolving", station_icao,
+                )
+                self._forecast_urls.pop(station_icao, None)
+                self._save_gridpoint(station_icao, None)
+                return self.get_hourly_forecast(station_icao)
             logger.warning(
                 "Failed to fetch hourly forecast for %s", station_icao, exc_info=True
             )
             return None
 
         periods_raw = data.get("properties", {}).get("periods", [])
-        periods: list[HourlyForecastPeriod] = []
-        temps: list[float] = []
-
-        for p in periods_raw:
-            temp = p.get("temperature")
-            temp_f = float(temp) if temp is not None else None
-            period = HourlyForecastPeriod(
-                start_time=p.get("startTime", ""),
-                end_time=p.get("endTime", ""),
-                temp_f=temp_f,
-                short_forecast=p.get("shortForecast", ""),
-            )
-            periods.append(period)
-            if temp_f is not None:
-                temps.append(temp_f)
-
-        forecast_high = max(temps) if temps else None
-        forecast_low = min(temps) if temps else None
+        temps = [
+            float(t) for p in periods_raw if (t := p.get("temperature")) is not None
+        ]
 
         return StationForecast(
             station_icao=station_icao,
-            periods=periods,
-            forecast_high_f=forecast_high,
-            forecast_low_f=forecast_low,
+            periods_raw=periods_raw,
+            forecast_high_f=max(temps) if temps else None,
+            forecast_low_f=min(temps) if temps else None,
         )
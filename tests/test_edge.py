@@ -307,6 +307,19 @@ class TestCurrentConditionsParsing:
         assert cc.temp_f == pytest.approx(-5.3)
         assert cc.temp_c == pytest.approx(-20.7)
 
+    def test_anchor_without_value_skipped(self):
+        html = (
+            "<th>Temperature</th>" + "x" * 500
+            + "Temperature: 39.9 &deg;F (4.4 &deg;C)"
+        )
+        cc = NWSScraper._parse_current_conditions(html, "KMDW")
+        assert cc.temp_f == pytest.approx(39.9)
+
+    def test_anchor_case_mismatch_falls_back(self):
+        html = "TEMPERATURE: 39.9 &deg;F (4.4 &deg;C)"
+        cc = NWSScraper._parse_current_conditions(html, "KMDW")
+        assert cc.temp_f == pytest.approx(39.9)
+
 
 class TestCliParsing:
     """Test CLI product text parsing."""
@@ -334,6 +347,15 @@ class TestCliParsing:
         report = NWSScraper._parse_cli_product(self.SAMPLE_CLI, "MDW")
         assert report.min_temp_f == 18
 
+    def test_value_far_from_anchor(self):
+        text = "MAXIMUM TEMPERATURE" + " " * 178 + "\n 85\n"
+        report = NWSScraper._parse_cli_product(text, "MDW")
+        assert report.max_temp_f == 85
+
+    def test_first_valid_timestamp_wins(self):
+        report = NWSScraper._parse_cli_product("AS OF: 5 PM\nVALID: 6 PM", "MDW")
+        assert report.valid_as_of == "5 PM"
+
     def test_preliminary_flag(self):
         report = NWSScraper._parse_cli_product(self.SAMPLE_CLI, "MDW")
         assert report.is_preliminary is True
@@ -1,14 +1,20 @@
 """Phase 1 validation — imports, config defaults, schema construction, artifact output."""
 
+import pytest
+from pydantic import ValidationError
 
 from kalshi_weather.artifacts import write_daily_slate_json, write_report_md
 from kalshi_weather.config import DEFAULT_CONFIG, Config
+from kalshi_weather.output import load_prior_slate
 from kalshi_weather.schemas import (
     CandidateRaw,
     DailySlate,
     MarketType,
     OrderbookSnapshot,
     ScanStats,
+    UnifiedCandidate,
+    dump_slate_json,
+    load_slate,
 )
 
 
@@ -61,6 +67,99 @@ def test_candidate_raw_construction():
     assert c.orderbook_snapshot.bid_room_cents == 3
 
 
+def test_enums_render_as_plain_strings():
+    assert f"{MarketType.HIGH_TEMP}" == "HIGH_TEMP"
+    assert str(MarketType.LOW_TEMP) == "LOW_TEMP"
+    assert MarketType("HIGH_TEMP") is MarketType.HIGH_TEMP
+
+
+def test_level_enums_carry_rank():
+    from kalshi_weather.schemas import KnifeEdgeRisk, UncertaintyLevel
+
+    assert [u.rank for u in UncertaintyLevel] == [0, 1, 2]
+    assert KnifeEdgeRisk("HIGH").rank == 2
+    assert f"{KnifeEdgeRisk.MED}" == "MED"
+
+
+def test_candidate_json_has_no_enum_reprs():
+    from kalshi_weather.schemas import (
+        UNIFIED_CANDIDATE_ADAPTER,
+        Bucket,
+        KnifeEdgeRisk,
+        LockInFlag,
+        ModelOutput,
+        UncertaintyLevel,
+    )
+
+    c = UnifiedCandidate(
+        run_time_et="2026-02-12T07:00:00-05:00",
+        target_date_local="2026-02-12",
+        city="Chicago",
+        market_type=MarketType.HIGH_TEMP,
+        event_name="Highest temperature in Chicago",
+        market_ticker="KXHIGHCHI-26FEB12-T40",
+        market_url="https://kalshi.com/markets/KXHIGHCHI-26FEB12-T40",
+        bracket_definition="40°F or above",
+        orderbook_snapshot=OrderbookSnapshot(),
+        model=ModelOutput(
+            market_ticker="KXHIGHCHI-26FEB12-T40",
+            p_yes=0.05,
+            p_no=0.95,
+            method="test",
+            uncertainty_level=UncertaintyLevel.MED,
+            local_time_at_station="07:00",
+            hours_remaining_until_cli_day_close=17.0,
+            hours_remaining_in_meaningful_volatility_window=8.0,
+            high_lock_in_flag=LockInFlag.NOT_LOCKED,
+            knife_edge_risk=KnifeEdgeRisk.LOW,
+        ),
+        bucket=Bucket.PRIMARY,
+    )
+    data = UNIFIED_CANDIDATE_ADAPTER.dump_json(c)
+    for enum_cls in (MarketType, UncertaintyLevel, LockInFlag, KnifeEdgeRisk, Bucket):
+        assert f"{enum_cls.__name__}.".encode() not in data
+    assert b'"market_type":"HIGH_TEMP"' in data
+    assert b'"bucket":"PRIMARY"' in data
+
+
+def test_orderbook_snapshot_frozen_tuples():
+    ob = OrderbookSnapshot(top3_yes_bids=[[8, 50], [7, 30]])
+    assert ob.top3_yes_bids == ((8, 50), (7, 30))
+    with pytest.raises(ValidationError):
+        ob.best_no_bid_cents = 90
+
+
+def test_orderbook_snapshot_depth_top3_total():
+    ob = OrderbookSnapshot(top3_yes_bids=[[8, 50], [7, 30]], top3_no_bids=[[89, 5]])
+    assert ob.depth_top3_total == 85
+    assert "depth_top3_total" not in ob.model_dump()
+    assert ob.model_copy(update={"top3_yes_bids": ((8, 100),)}).depth_top3_total == 105
+
+    scanned = OrderbookSnapshot(yes_cumdepth=(50, 80, 90, 95), no_cumdepth=(5,))
+    assert scanned.depth_top3_total == 95
+
+
+def test_note_fields_default_to_empty_tuple():
+    c = UnifiedCandidate(
+        run_time_et="2026-02-12T07:00:00-05:00",
+        target_date_local="2026-02-12",
+        city="Chicago",
+        market_type=MarketType.HIGH_TEMP,
+        event_name="Highest temperature in Chicago",
+        market_ticker="KXHIGHCHI-26FEB12-B42",
+        market_url="https://kalshi.com/markets/kxhighchi",
+        bracket_definition="42-43°F",
+        orderbook_snapshot=OrderbookSnapshot(),
+    )
+    assert c.warnings == ()
+    c2 = c.model_copy(update={"warnings": ("stale obs",)})
+    assert c.warnings == ()
+    from kalshi_weather.schemas import UNIFIED_CANDIDATE_ADAPTER
+
+    loaded = UNIFIED_CANDIDATE_ADAPTER.validate_json(UNIFIED_CANDIDATE_ADAPTER.dump_json(c2))
+    assert loaded.warnings == ("stale obs",)
+
+
 def test_daily_slate_empty():
     slate = DailySlate(
         run_time_et="2026-02-12T07:00:00-05:00",
@@ -69,6 +168,8 @@ def test_daily_slate_empty():
     assert slate.bankroll_usd == 42.0
     assert slate.scan_stats.primary_count == 0
     assert slate.picks_primary == []
+    with pytest.raises(ValidationError):
+        slate.scan_stats.primary_count = 1
 
 
 def test_write_daily_slate_json(tmp_path):
@@ -85,6 +186,43 @@ def test_write_daily_slate_json(tmp_path):
     assert data["scan_stats"]["events_scanned"] == 5
 
 
+def test_daily_slate_json_round_trip(tmp_path):
+    pick = UnifiedCandidate(
+        run_time_et="2026-02-12T07:00:00-05:00",
+        target_date_local="2026-02-12",
+        city="Chicago",
+        market_type=MarketType.HIGH_TEMP,
+        event_name="Highest temperature in Chicago",
+        market_ticker="KXHIGHCHI-26FEB12-T40",
+        market_url="https://kalshi.com/markets/KXHIGHCHI-26FEB12-T40",
+        bracket_definition="40°F or above",
+        orderbook_snapshot=OrderbookSnapshot(top3_no_bids=[[89, 30]]),
+    )
+    slate = DailySlate(
+        run_time_et="2026-02-12T07:00:00-05:00",
+        target_date_local="2026-02-12",
+        picks_primary=[pick],
+    )
+    out = write_daily_slate_json(slate, path=tmp_path / "slate.json")
+    assert load_prior_slate(out) == slate
+
+    archived = write_daily_slate_json(slate, path=tmp_path / "slate.json.gz")
+    assert archived.stat().st_size < out.stat().st_size
+    assert load_slate(archived.read_bytes()) == slate
+
+
+def test_slate_json_helpers():
+    slate = DailySlate(
+        run_time_et="2026-02-12T07:00:00-05:00",
+        target_date_local="2026-02-12",
+        notes=["40°F bracket"],
+    )
+    data = dump_slate_json(slate)
+    assert isinstance(data, bytes)
+    assert load_slate(data) == slate
+    assert load_slate(data.decode("utf-8")) == slate
+
+
 def test_write_report_md(tmp_path):
     slate = DailySlate(
         run_time_et="2026-02-12T07:00:00-05:00",
@@ -170,6 +170,31 @@ class TestRateLimiter:
         elapsed = time.monotonic() - t0
         assert elapsed >= 0.09  # At least ~100ms
 
+    def test_rate_limiter_schedules_next_slot(self, monkeypatch):
+        """After sleeping, the next slot is computed from the scheduled time."""
+        import kalshi_weather.rate_limiter as rl_mod
+
+        sleeps: list[float] = []
+        monkeypatch.setattr(rl_mod, "_monotonic", lambda: 100.0)
+        monkeypatch.setattr(rl_mod.time, "sleep", sleeps.append)
+        rl = RateLimiter(requests_per_second=10.0)
+        rl._last_request_time = 99.95
+        rl.wait()
+        assert sleeps == [pytest.approx(0.05)]
+        assert rl._last_request_time == pytest.approx(100.05)
+
+    def test_rate_limiter_queues_concurrent_callers(self, monkeypatch):
+        """Callers arriving at the same instant get successive slots."""
+        import kalshi_weather.rate_limiter as rl_mod
+
+        sleeps: list[float] = []
+        monkeypatch.setattr(rl_mod, "_monotonic", lambda: 100.0)
+        monkeypatch.setattr(rl_mod.time, "sleep", sleeps.append)
+        rl = RateLimiter(requests_per_second=10.0)
+        for _ in range(3):
+            rl.wait()
+        assert sleeps == [pytest.approx(0.1), pytest.approx(0.2)]
+
     def test_rate_limiter_zero_rps(self):
         """RateLimiter with 0 rps should not block."""
         rl = RateLimiter(requests_per_second=0)
@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from kalshi_weather.candidate_cache import CandidateCache
 from kalshi_weather.emailer import build_email, send_report_email
 from kalshi_weather.runner import enrich_candidate, run_full_scan
 from kalshi_weather.schemas import CandidateRaw, MarketType, OrderbookSnapshot
@@ -132,6 +133,19 @@ class TestRunFullScan:
         )
         assert total == 1
 
+    def test_full_scan_fetches_each_station_once(self, tmp_path):
+        client = MagicMock(spec=["close"])
+        weather = _mock_weather()
+        raw_candidates = [
+            _make_raw(ticker=f"KXHIGHCHI-26FEB14-T{t}") for t in (48, 50, 52)
+        ]
+
+        with patch("kalshi_weather.runner.scan_today_markets", return_value=raw_candidates):
+            run_full_scan(client, weather, output_dir=tmp_path)
+
+        weather.get_current_obs.assert_called_once_with("KMDW")
+        weather.get_hourly_forecast.assert_called_once_with("KMDW")
+
     def test_full_scan_skips_failed_enrichment(self, tmp_path):
         client = MagicMock(spec=["close"])
         weather = _mock_weather()
@@ -153,6 +167,59 @@ class TestRunFullScan:
         assert total == 0
 
 
+class TestCandidateCache:
+    """SQLite cache of enriched candidates across runs."""
+
+    def test_round_trip_restamps_run_time(self, tmp_path):
+        raw = _make_raw()
+        uc = enrich_candidate(raw, _mock_weather())
+        with CandidateCache(tmp_path / "c.db") as cache:
+            cache.store(raw, uc)
+            later = raw.model_copy(update={"run_time_et": "2026-02-14 08:00 ET"})
+            hit = cache.lookup(later)
+
+        assert hit is not None
+        assert hit.run_time_et == "2026-02-14 08:00 ET"
+        assert hit.model == uc.model
+
+    def test_orderbook_change_misses(self, tmp_path):
+        raw = _make_raw()
+        with CandidateCache(tmp_path / "c.db") as cache:
+            cache.store(raw, enrich_candidate(raw, _mock_weather()))
+            moved = raw.model_copy(update={
+                "orderbook_snapshot": raw.orderbook_snapshot.model_copy(
+                    update={"best_no_bid_cents": 89},
+                ),
+            })
+            assert cache.lookup(moved) is None
+
+    def test_expired_entries_ignored(self, tmp_path):
+        raw = _make_raw()
+        with CandidateCache(tmp_path / "c.db", max_age_seconds=-1) as cache:
+            cache.store(raw, enrich_candidate(raw, _mock_weather()))
+            assert cache.lookup(raw) is None
+
+    def test_full_scan_reuses_cache(self, tmp_path):
+        client = MagicMock(spec=["close"])
+        raw_candidates = [_make_raw()]
+        with (
+            CandidateCache(tmp_path / "c.db") as cache,
+            patch("kalshi_weather.runner.scan_today_markets", return_value=raw_candidates),
+        ):
+            run_full_scan(client, _mock_weather(), output_dir=tmp_path, cache=cache)
+            weather = _mock_weather()
+            slate, _ = run_full_scan(client, weather, output_dir=tmp_path, cache=cache)
+
+        weather.get_current_obs.assert_not_called()
+        total = (
+            len(slate.picks_primary)
+            + len(slate.picks_tight)
+            + len(slate.picks_near_miss)
+            + len(slate.rejected)
+        )
+        assert total == 1
+
+
 # ── Emailer tests ─────────────────────────────────────────────────────
 
 
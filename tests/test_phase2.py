@@ -5,6 +5,8 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
+import httpx
+
 from kalshi_weather.kalshi_client import _ALLOWED_PATH_PREFIXES, KalshiClient
 from kalshi_weather.scanner import (
     _bracket_definition,
@@ -15,7 +17,7 @@ from kalshi_weather.scanner import (
     _parse_orderbook,
     scan_today_markets,
 )
-from kalshi_weather.schemas import MarketType
+from kalshi_weather.schemas import MarketType, OrderbookSnapshot
 
 # ── Client safety tests ───────────────────────────────────────────────
 
@@ -34,6 +36,48 @@ class TestClientSafety:
             assert "cancel" not in lower, f"Found cancel-like method: {attr}"
             assert "delete" not in lower, f"Found delete-like method: {attr}"
 
+    def test_bulk_orderbooks_chunked_and_keyed_by_ticker(self):
+        client = KalshiClient.__new__(KalshiClient)
+        client._get = MagicMock(side_effect=lambda path, params: {
+            "orderbooks": [
+                {"ticker": t, "orderbook": {"yes": [[5, 1]], "no": []}}
+                for t in params["tickers"].split(",")
+            ],
+        })
+        tickers = [f"T{i}" for i in range(150)]
+        books = client.get_orderbooks(tickers)
+        assert list(books) == tickers
+        assert books["T7"] == {"orderbook": {"yes": [[5, 1]], "no": []}}
+        assert client._get.call_count == 2
+        assert client._get.call_args.args[0] == "/trade-api/v2/markets/orderbooks"
+        assert client._get.call_args.kwargs["params"]["depth"] == 10
+
+    def test_bulk_orderbooks_keep_batches_before_a_failure(self):
+        import pytest
+
+        ok = {"orderbooks": [{"ticker": "T0", "orderbook": {"yes": [], "no": []}}]}
+        client = KalshiClient.__new__(KalshiClient)
+        client._get = MagicMock(side_effect=[ok, httpx.ConnectError("boom"), ok])
+        tickers = [f"T{i}" for i in range(250)]
+        assert list(client.get_orderbooks(tickers)) == ["T0"]
+        assert client._get.call_count == 3
+
+        client._get = MagicMock(side_effect=httpx.ConnectError("boom"))
+        with pytest.raises(httpx.ConnectError):
+            client.get_orderbooks(tickers)
+
+    def test_best_yes_requests_one_level(self):
+        client = KalshiClient.__new__(KalshiClient)
+        client._get = MagicMock(return_value={
+            "orderbook": {"yes": [[41, 3]], "no": [[55, 2]]},
+        })
+        assert client.get_orderbook_best_yes("KXHIGHNY-T50") == 41
+        client._get.assert_called_once_with(
+            "/trade-api/v2/markets/KXHIGHNY-T50/orderbook", params={"depth": 1},
+        )
+        client._get.return_value = {"orderbook": {"yes": None, "no": [[55, 2]]}}
+        assert client.get_orderbook_best_yes("KXHIGHNY-T50") is None
+
     def test_allowed_paths_are_read_only(self):
         """All allowed path prefixes must be read-only endpoints."""
         for prefix in _ALLOWED_PATH_PREFIXES:
@@ -57,6 +101,10 @@ class TestClassifySeries:
         assert _classify_series("KXRAIN") is None
         assert _classify_series("ELECTION") is None
 
+    def test_case_insensitive(self):
+        assert _classify_series("kxhighchi") == MarketType.HIGH_TEMP
+        assert _classify_series("KxLowNy") == MarketType.LOW_TEMP
+
 
 # ── City extraction ────────────────────────────────────────────────────
 
@@ -119,8 +167,27 @@ class TestParseOrderbook:
         }
         ob = _parse_orderbook(raw)
         # top3 should be highest-first
-        assert ob.top3_yes_bids == [[8, 15], [7, 20], [5, 10]]
-        assert ob.top3_no_bids == [[90, 8], [89, 10], [88, 5]]
+        assert ob.top3_yes_bids == ((8, 15), (7, 20), (5, 10))
+        assert ob.top3_no_bids == ((90, 8), (89, 10), (88, 5))
+
+    def test_cumulative_depth_best_first(self):
+        raw = {
+            "orderbook": {
+                "yes": [[3, 5], [5, 10], [7, 20], [8, 15]],
+                "no": [[90, 8]],
+            }
+        }
+        ob = _parse_orderbook(raw)
+        assert ob.yes_cumdepth == (15, 35, 45, 50)
+        assert ob.no_cumdepth == (8,)
+        assert "yes_depth=50, no_depth=8" in ob.depth_notes
+
+    def test_matches_validated_snapshot(self):
+        raw = {"orderbook": {"yes": [[6, 4], [8, 15]], "no": [[90, 8]]}}
+        ob = _parse_orderbook(raw)
+        validated = OrderbookSnapshot.model_validate(ob.model_dump())
+        assert validated == ob
+        assert validated.model_dump_json() == ob.model_dump_json()
 
     def test_empty_yes_bids(self):
         raw = {"orderbook": {"yes": [], "no": [[90, 8]]}}
@@ -170,6 +237,13 @@ class TestMarketTradable:
     def test_missing_status(self):
         assert _market_is_tradable({}) is False
 
+    def test_status_casing_tolerated(self):
+        assert _market_is_tradable({"status": "Active"}) is True
+        assert _market_is_tradable({"status": "OPEN"}) is True
+        assert _market_is_tradable({"status": "aCtive"}) is True
+        assert _market_is_tradable({"status": "active "}) is True
+        assert _market_is_tradable({"status": None}) is False
+
 
 # ── Bracket definition ──────────────────────────────────────────────────
 
@@ -273,6 +347,12 @@ class TestScanTodayMarkets:
             return books.get(ticker, {"orderbook": {"yes": [], "no": []}})
 
         client.get_orderbook.side_effect = get_orderbook
+        # Bulk endpoint unavailable by default — scanner falls back per ticker.
+        client.get_orderbooks.side_effect = httpx.HTTPStatusError(
+            "not found",
+            request=httpx.Request("GET", "https://example.invalid"),
+            response=httpx.Response(404),
+        )
         return client
 
     def test_scan_finds_candidates(self):
@@ -305,6 +385,42 @@ class TestScanTodayMarkets:
         assert chi_high.orderbook_snapshot.bid_room_cents == 3  # 92 - 89
         assert "kalshi.com" in chi_high.market_url
 
+    def test_scan_skips_failed_orderbook(self):
+        client = self._make_mock_client()
+        fetch = client.get_orderbook.side_effect
+
+        def flaky(ticker, depth=10):
+            if ticker == "KXHIGHCHI-26FEB12-T40":
+                raise RuntimeError("boom")
+            return fetch(ticker, depth)
+
+        client.get_orderbook.side_effect = flaky
+        run_time = datetime(2026, 2, 12, 12, 0, 0, tzinfo=timezone.utc)
+
+        candidates = scan_today_markets(client, run_time=run_time)
+        assert [c.market_ticker for c in candidates] == ["KXLOWCHI-26FEB12-T20"]
+
+    def test_scan_uses_bulk_orderbooks(self):
+        client = self._make_mock_client()
+        fetch = client.get_orderbook.side_effect
+
+        def bulk(tickers, depth):
+            assert depth == 10
+            # The API omits T20; it should be fetched on its own.
+            return {t: fetch(t) for t in tickers if not t.endswith("-T20")}
+
+        client.get_orderbooks.side_effect = bulk
+        run_time = datetime(2026, 2, 12, 12, 0, 0, tzinfo=timezone.utc)
+
+        candidates = scan_today_markets(client, run_time=run_time)
+        assert sorted(c.market_ticker for c in candidates) == [
+            "KXHIGHCHI-26FEB12-T40", "KXLOWCHI-26FEB12-T20",
+        ]
+        client.get_orderbooks.assert_called_once()
+        assert [c.args[0] for c in client.get_orderbook.call_args_list] == [
+            "KXLOWCHI-26FEB12-T20",
+        ]
+
     def test_scan_skips_non_today(self):
         client = self._make_mock_client()
         # Run on a different day — no events should match
@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 
 from kalshi_weather.rules import (
+    build_all_settlement_specs,
     build_settlement_spec,
     get_cli_day_window,
     get_station_icao,
@@ -19,22 +20,22 @@ class TestLookupStation:
     def test_exact_match(self):
         entry = lookup_station("Chicago")
         assert entry is not None
-        assert entry["station_icao"] == "KMDW"
+        assert entry.station_icao == "KMDW"
 
     def test_case_insensitive(self):
         entry = lookup_station("CHICAGO")
         assert entry is not None
-        assert entry["station_icao"] == "KMDW"
+        assert entry.station_icao == "KMDW"
 
     def test_alias_match(self):
         entry = lookup_station("NYC")
         assert entry is not None
-        assert entry["station_icao"] == "KNYC"
+        assert entry.station_icao == "KNYC"
 
     def test_alias_full_name(self):
         entry = lookup_station("New York City")
         assert entry is not None
-        assert entry["station_icao"] == "KNYC"
+        assert entry.station_icao == "KNYC"
 
     def test_substring_match(self):
         # "Highest temperature in Chicago" contains "chicago"
@@ -45,6 +46,13 @@ class TestLookupStation:
         entry = lookup_station("Timbuktu")
         assert entry is None
 
+    def test_punctuation_and_spacing_normalized(self):
+        for city in ("Washington D.C.", "washington dc", " Washington  DC "):
+            entry = lookup_station(city)
+            assert entry is not None
+            assert entry.kalshi_city == "Washington"
+        assert lookup_station("Dallas Fort Worth").station_icao == "KDFW"
+
     def test_all_major_cities_mapped(self):
         cities = [
             "New York", "Chicago", "Miami", "Austin",
@@ -55,7 +63,7 @@ class TestLookupStation:
         for city in cities:
             entry = lookup_station(city)
             assert entry is not None, f"City '{city}' not found in station DB"
-            assert entry["confidence"] == MappingConfidence.HIGH
+            assert entry.confidence == MappingConfidence.HIGH
 
 
 class TestStationHelpers:
@@ -165,3 +173,21 @@ class TestBuildSettlementSpec:
             "https://forecast.weather.gov/product.php"
             "?site=NWS&product=CLI&issuedby=SEA"
         )
+
+    def test_cli_url_shared_across_aliases(self):
+        a = build_settlement_spec("NYC", MarketType.HIGH_TEMP)
+        b = build_settlement_spec("New York", MarketType.LOW_TEMP)
+        assert a.cli_url is b.cli_url
+        assert a.cli_url.endswith("issuedby=NYC")
+
+    def test_batch_matches_single(self):
+        target = datetime(2026, 7, 4)
+        pairs = [
+            ("Denver", MarketType.HIGH_TEMP),
+            ("Phoenix", MarketType.LOW_TEMP),
+            ("Chicago", MarketType.HIGH_TEMP),
+            ("Austin", MarketType.LOW_TEMP),
+            ("Timbuktu", MarketType.HIGH_TEMP),
+        ]
+        batch = build_all_settlement_specs(pairs, target)
+        assert batch == [build_settlement_spec(c, mt, target) for c, mt in pairs]
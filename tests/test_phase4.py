@@ -52,7 +52,6 @@ def _make_candidate(
 def _make_forecast(high_f=45.0, low_f=25.0) -> StationForecast:
     return StationForecast(
         station_icao="KMDW",
-        periods=[],
         forecast_high_f=high_f,
         forecast_low_f=low_f,
     )
@@ -275,3 +274,100 @@ class TestModelCandidate:
         # Late result should have less volatility window.
         assert r_late.hours_remaining_in_meaningful_volatility_window < \
                r_morning.hours_remaining_in_meaningful_volatility_window
+
+
+# ── Weather API gridpoints ────────────────────────────────────────────
+
+class TestWeatherAPIGridpoints:
+    @staticmethod
+    def _api(calls: list[str], **kwargs):
+        import httpx
+
+        from kalshi_weather.weather_api import WeatherAPI
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            path = request.url.path
+            calls.append(path)
+            if path.endswith("/observations/latest"):
+                return httpx.Response(200, json={"properties": {
+                    "timestamp": "2026-02-12T12:00:00Z",
+                    "temperature": {"value": 10.0},
+                }})
+            if path.startswith("/stations/"):
+                return httpx.Response(200, json={"geometry": {"coordinates": [-87.7, 41.8]}})
+            if path.startswith("/gridpoints/OLD/"):
+                return httpx.Response(404)
+            if path.startswith("/points/"):
+                return httpx.Response(200, json={"properties": {
+                    "forecastHourly": "https://api.weather.gov/gridpoints/LOT/1,2/forecast/hourly",
+                }})
+            return httpx.Response(200, json={"properties": {"periods": [
+                {"startTime": "a", "endTime": "b", "temperature": 40},
+                {"startTime": "b", "endTime": "c", "temperature": 48},
+            ]}})
+
+        api = WeatherAPI(**kwargs)
+        api._client.close()
+        api._client = httpx.Client(transport=httpx.MockTransport(handler))
+        return api
+
+    def test_gridpoint_url_resolved_once_per_station(self):
+        calls: list[str] = []
+        with self._api(calls) as api:
+            first = api.get_hourly_forecast("KMDW")
+            second = api.get_hourly_forecast("KMDW")
+        assert first.forecast_high_f == second.forecast_high_f == 48.0
+        assert sum(p.startswith("/points/") for p in calls) == 1
+        assert calls.count("/stations/KMDW") == 1
+
+    def test_forecast_periods_parsed_lazily(self):
+        calls: list[str] = []
+        with self._api(calls) as api:
+            forecast = api.get_hourly_forecast("KMDW")
+        assert "periods" not in vars(forecast)
+        assert [p.temp_f for p in forecast.periods] == [40.0, 48.0]
+        assert forecast.periods[1].start_time == "b"
+
+    def test_gridpoint_cache_persists_across_instances(self, tmp_path):
+        import json
+
+        cache = tmp_path / "gridpoints.json"
+        calls: list[str] = []
+        with self._api(calls, gridpoint_cache=cache) as api:
+            api.get_hourly_forecast("KMDW")
+        assert "KMDW" in json.loads(cache.read_text())
+
+        calls.clear()
+        with self._api(calls, gridpoint_cache=cache) as api:
+            assert api.get_hourly_forecast("KMDW").forecast_high_f == 48.0
+        assert calls == ["/gridpoints/LOT/1,2/forecast/hourly"]
+
+        calls.clear()
+        with self._api(calls, gridpoint_cache=cache, refresh_gridpoints=True) as api:
+            api.get_hourly_forecast("KMDW")
+        assert "/stations/KMDW" in calls
+
+    def test_expired_gridpoint_entries_ignored(self, tmp_path):
+        import json
+
+        cache = tmp_path / "gridpoints.json"
+        cache.write_text(json.dumps({"KMDW": {"url": "https://stale", "ts": 0}}))
+        calls: list[str] = []
+        with self._api(calls, gridpoint_cache=cache) as api:
+            api.get_hourly_forecast("KMDW")
+        assert "/stations/KMDW" in calls
+        assert json.loads(cache.read_text())["KMDW"]["url"].endswith("/forecast/hourly")
+
+    def test_failing_cached_gridpoint_url_is_re_resolved(self, tmp_path):
+        import json
+        import time
+
+        cache = tmp_path / "gridpoints.json"
+        stale = "https://api.weather.gov/gridpoints/OLD/1,2/forecast/hourly"
+        cache.write_text(json.dumps({"KMDW": {"url": stale, "ts": time.time()}}))
+        calls: list[str] = []
+        with self._api(calls, gridpoint_cache=cache) as api:
+            assert api.get_hourly_forecast("KMDW").forecast_high_f == 48.0
+        assert calls[0] == "/gridpoints/OLD/1,2/forecast/hourly"
+        assert "/stations/KMDW" in calls
+        assert json.loads(cache.read_text())["KMDW"]["url"] != stale
@@ -12,6 +12,7 @@ from kalshi_weather.planner import (
     generate_cancel_replace_rules,
     generate_manual_steps,
 )
+from kalshi_weather.scanner import _parse_orderbook
 from kalshi_weather.schemas import OrderbookSnapshot
 
 # ── Helpers ────────────────────────────────────────────────────────────
@@ -68,6 +69,19 @@ class TestLiquidity:
         # top_of_book = 0 + 30 = 30, top3 = 50
         assert result.verdict == LiquidityVerdict.OK
 
+    def test_uses_scanner_cumulative_depth(self):
+        ob = _parse_orderbook({
+            "orderbook": {
+                "yes": [[4, 100], [6, 10], [7, 2], [8, 3]],
+                "no": [[88, 1], [89, 2]],
+            }
+        })
+        result = assess_liquidity(ob)
+        # Only the top three yes levels count: 3 + 2 + 10, plus 2 + 1.
+        assert result.top_of_book_depth == 5
+        assert result.top3_depth == 18
+        assert result.verdict == LiquidityVerdict.THIN
+
 
 # ── Spread sanity (Task #25) ──────────────────────────────────────────
 
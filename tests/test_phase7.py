@@ -86,6 +86,16 @@ class TestCorrelationGroups:
         assert get_correlation_group("NYC") == "Northeast"
         assert get_correlation_group("DFW") == "South Central"
 
+    def test_whitespace_normalized(self):
+        assert get_correlation_group("  new york city ") == "Northeast"
+        assert get_metro_cluster(" LGA ") == "NYC Metro"
+
+    def test_unlisted_spelling_falls_back_to_alias(self):
+        assert get_correlation_group("Chicago O'Hare") == "Great Lakes"
+        assert get_metro_cluster("Dallas-Fort Worth Intl") == "DFW Metro"
+        # Short aliases ("LA") are never matched inside longer names.
+        assert get_correlation_group("LA Downtown") == "Other"
+
 
 class TestMetroClusters:
     def test_nyc_metro(self):
@@ -178,6 +188,15 @@ class TestAllocateStakes:
     def test_empty_picks(self):
         assert allocate_stakes([]) == []
 
+    def test_stakes_are_whole_cents(self):
+        picks = [
+            {"market_ticker": f"T{i}", "limit_cents": 90, "risk_multiplier": 0.35}
+            for i in range(3)
+        ]
+        result = allocate_stakes(picks)
+        # $42 / 3 * 0.35 = $4.90 exactly.
+        assert all(p["suggested_stake_usd"] == 4.9 for p in result)
+
     def test_max_loss_equals_stake(self):
         picks = [{"market_ticker": "T1", "limit_cents": 90}]
         result = allocate_stakes(picks)
@@ -218,6 +237,17 @@ class TestRiskMultiplier:
         )
         assert mult >= 0.1
 
+    def test_hours_boundaries(self):
+        """Exactly 1h and 8h fall in the neutral middle bucket."""
+        for hours in (1.0, 8.0):
+            mult = compute_risk_multiplier(
+                UncertaintyLevel.LOW, KnifeEdgeRisk.LOW, hours
+            )
+            assert mult == 1.0
+        assert compute_risk_multiplier(
+            UncertaintyLevel.LOW, KnifeEdgeRisk.LOW, 8.5
+        ) == 0.8
+
 
 # ── Risk flag aggregation ─────────────────────────────────────────────
 
@@ -273,7 +303,7 @@ class TestBuildRiskRecommendation:
         assert rec.metro_cluster == "Chicago Metro"
         assert rec.suggested_stake_usd > 0
         assert rec.max_loss_usd > 0
-        assert isinstance(rec.risk_flags, list)
+        assert isinstance(rec.risk_flags, tuple)
 
     def test_high_risk_reduced_stake(self):
         rec = build_risk_recommendation(
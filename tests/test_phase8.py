@@ -221,6 +221,18 @@ class TestHardRejects:
         rejected, reason = apply_hard_rejects(uc)
         assert not rejected
 
+    def test_spread_checked_after_cheaper_gates(self, monkeypatch):
+        import kalshi_weather.team_lead as tl
+
+        def fail(*a, **kw):
+            raise AssertionError("assess_spread should not run")
+
+        monkeypatch.setattr(tl, "assess_spread", fail)
+        uc = _unified(room=8, lock_high=LockInFlag.LOCKING, p_high=0.03)
+        rejected, reason = apply_hard_rejects(uc)
+        assert rejected
+        assert "HIGH lock-in" in reason
+
 
 # ── Bucket classification (Task #35) ────────────────────────────────
 
@@ -278,6 +290,18 @@ class TestBucketClassifier:
         bucket, _ = classify_bucket(uc)
         assert bucket == Bucket.REJECTED
 
+    def test_compiled_classifier_follows_config(self):
+        from kalshi_weather.config import Config, PriceWindowConfig
+        from kalshi_weather.team_lead import _compile_classifier
+
+        config = Config(price_window=PriceWindowConfig(primary_low=80, primary_high=85))
+        classify = _compile_classifier(config)
+        assert _compile_classifier(config) is classify
+        assert classify(82, 3) == (Bucket.PRIMARY, "ask=82c in [80,85], room=3c >= 2")
+        assert classify(91, 3)[0] == Bucket.REJECTED
+        assert classify(140, 3) == (Bucket.REJECTED, "ask=140c outside scan window")
+        assert classify_bucket(_unified(ask=82, room=1), config)[0] == Bucket.TIGHT
+
 
 # ── Ranking (Task #36) ──────────────────────────────────────────────
 
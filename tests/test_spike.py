@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import email
 import time
 from datetime import datetime
 from unittest.mock import MagicMock, patch
@@ -42,6 +43,18 @@ class TestSpikeConfig:
         assert "New York" in cfg.tracked_cities
         assert "Washington" in cfg.tracked_cities
 
+    def test_frozen(self):
+        import dataclasses
+
+        import pytest
+
+        from kalshi_weather.spike_config import SpikeConfig
+
+        cfg = SpikeConfig()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            cfg.spike_threshold_cents = 5
+        assert not hasattr(cfg, "__dict__")
+
 
 # ======================================================================
 # Spike Detection Tests
@@ -69,12 +82,41 @@ class TestPriceHistory:
         ph.prune("TICKER-A")
         assert len(ph.get_history("TICKER-A")) == 1
 
+    def test_prune_all_trims_every_ticker(self):
+        from kalshi_weather.spike_monitor import PriceHistory
+
+        ph = PriceHistory(max_age_seconds=360)
+        now = time.monotonic()
+        ph.record("TICKER-A", 10, now - 300)
+        ph.record("TICKER-B", 20, now - 100)
+        assert ph.prune_all(now + 200) == ["TICKER-A"]
+        assert ph.get_history("TICKER-A") == []
+        assert "TICKER-A" not in ph._data
+        assert len(ph.get_history("TICKER-B")) == 1
+
+    def test_record_trims_to_max_age(self):
+        from kalshi_weather.spike_monitor import PriceHistory
+
+        ph = PriceHistory(max_age_seconds=360)
+        now = time.monotonic()
+        for offset in (-500, -361, -200, 0):
+            ph.record("TICKER-A", 10, now + offset)
+        assert [s.timestamp for s in ph.get_history("TICKER-A")] == [now - 200, now]
+
     def test_unknown_ticker_empty(self):
         from kalshi_weather.spike_monitor import PriceHistory
 
         ph = PriceHistory(max_age_seconds=360)
         assert ph.get_history("UNKNOWN") == []
 
+    def test_snapshot_and_event_are_slotted(self):
+        from kalshi_weather.spike_monitor import PriceSnapshot, SpikeEvent
+
+        snap = PriceSnapshot(10, 1.0)
+        event = SpikeEvent("T", 5, 25, 20, 60.0)
+        assert not hasattr(snap, "__dict__")
+        assert not hasattr(event, "__dict__")
+
 
 class TestSpikeDetection:
     """Test the spike detection algorithm."""
@@ -125,6 +167,24 @@ class TestSpikeDetection:
         result = detect_spike(ph, cfg, now)
         assert result is None
 
+    def test_baseline_is_oldest_in_window(self):
+        from kalshi_weather.spike_config import SpikeConfig
+        from kalshi_weather.spike_monitor import PriceHistory, detect_spike
+
+        cfg = SpikeConfig(spike_threshold_cents=20, window_seconds=360)
+        ph = PriceHistory(max_age_seconds=600)
+        now = time.monotonic()
+
+        ph.record("BRACKET-A", 2, now - 420)   # before the window
+        ph.record("BRACKET-A", 8, now - 300)
+        ph.record("BRACKET-A", 5, now - 120)
+        ph.record("BRACKET-A", 30, now)
+
+        result = detect_spike(ph, cfg, now)
+        assert result is not None
+        assert result.old_price == 8
+        assert result.seconds_elapsed == 300
+
     def test_largest_spike_wins(self):
         from kalshi_weather.spike_config import SpikeConfig
         from kalshi_weather.spike_monitor import PriceHistory, detect_spike
@@ -168,6 +228,192 @@ class TestSpikeDetection:
         result = detect_spike(ph, cfg, now + 601, cooldowns=cooldowns)
         assert result is not None
 
+    def test_cooldown_ends_exactly_at_expiry(self):
+        from kalshi_weather.spike_config import SpikeConfig
+        from kalshi_weather.spike_monitor import PriceHistory, detect_spike
+
+        cfg = SpikeConfig(spike_threshold_cents=20, cooldown_seconds=600)
+        ph = PriceHistory(max_age_seconds=360)
+        now = time.monotonic()
+        ph.record("BRACKET-A", 7, now - 180)
+        ph.record("BRACKET-A", 32, now)
+
+        assert detect_spike(ph, cfg, now, cooldowns={"BRACKET-A": now - 599}) is None
+        assert detect_spike(ph, cfg, now, cooldowns={"BRACKET-A": now - 600}) is not None
+
+    def test_cooled_down_leader_skipped(self):
+        from kalshi_weather.spike_config import SpikeConfig
+        from kalshi_weather.spike_monitor import PriceHistory, detect_spike
+
+        cfg = SpikeConfig(spike_threshold_cents=20, cooldown_seconds=600)
+        ph = PriceHistory(max_age_seconds=360)
+        now = time.monotonic()
+
+        ph.record("BRACKET-A", 5, now - 180)
+        ph.record("BRACKET-A", 60, now)
+        ph.record("BRACKET-B", 10, now - 180)
+        ph.record("BRACKET-B", 30, now)
+
+        result = detect_spike(ph, cfg, now, cooldowns={"BRACKET-A": now - 60})
+        assert result is not None
+        assert result.ticker == "BRACKET-B"
+        assert result.delta == 20
+        assert result.seconds_elapsed == 180
+
+
+class TestAdaptivePolling:
+    def test_largest_move_ignores_threshold_and_direction(self):
+        from kalshi_weather.spike_monitor import PriceHistory, largest_move
+
+        ph = PriceHistory(max_age_seconds=360)
+        now = time.monotonic()
+        assert largest_move(ph) == 0
+        ph.record("A", 40, now - 60)
+        ph.record("A", 43, now)
+        ph.record("B", 30, now - 60)
+        ph.record("B", 22, now)
+        ph.record("C", 50, now)
+        assert largest_move(ph) == 8
+
+    def test_interval_shrinks_with_movement(self):
+        from kalshi_weather.spike_config import SpikeConfig
+        from kalshi_weather.spike_monitor import next_poll_interval
+
+        cfg = SpikeConfig(
+            spike_threshold_cents=16, poll_interval_seconds=30,
+            min_poll_interval_seconds=5,
+        )
+        assert next_poll_interval(0.0, cfg) == 30
+        assert next_poll_interval(8.0, cfg) == 30
+        assert next_poll_interval(16.0, cfg) == 15
+        assert next_poll_interval(200.0, cfg) == 5
+
+    def test_floor_equal_to_base_disables(self):
+        from kalshi_weather.spike_config import SpikeConfig
+        from kalshi_weather.spike_monitor import next_poll_interval
+
+        cfg = SpikeConfig(poll_interval_seconds=30, min_poll_interval_seconds=30)
+        assert next_poll_interval(100.0, cfg) == 30
+
+
+class TestQuickCheck:
+    @staticmethod
+    def _book(best_yes):
+        return {"orderbook": {"yes": [[best_yes - 2, 10], [best_yes, 5]]}}
+
+    def test_top_movers_ranked_by_move(self):
+        from kalshi_weather.spike_monitor import PriceHistory, top_movers
+
+        ph = PriceHistory(max_age_seconds=360)
+        now = time.monotonic()
+        for ticker, old, new in (("A", 10, 12), ("B", 40, 20), ("C", 5, 14)):
+            ph.record(ticker, old, now - 60)
+            ph.record(ticker, new, now)
+        assert top_movers(ph, 2) == [("B", 20), ("C", 14)]
+        assert top_movers(ph, 2, {"B"}) == [("C", 14), ("A", 12)]
+
+    def test_wait_skips_cooling_movers(self):
+        from kalshi_weather.spike_config import SpikeConfig
+        from kalshi_weather.spike_monitor import PriceHistory, wait_for_next_poll
+
+        ph = PriceHistory(max_age_seconds=360)
+        ph.record("A", 10, 900.0)
+        ph.record("A", 40, 990.0)
+        client = MagicMock()
+        cfg = SpikeConfig(cooldown_seconds=600)
+        with patch("kalshi_weather.spike_monitor.time") as fake_time:
+            fake_time.monotonic.return_value = 1000.0
+            wait_for_next_poll(client, ph, 30, cfg, {"A": 995.0})
+        fake_time.sleep.assert_called_once_with(30.0)
+        client.get_orderbooks.assert_not_called()
+
+    def test_quick_check_triggers_on_move(self):
+        from kalshi_weather.spike_monitor import quick_check
+
+        client = MagicMock()
+        client.get_orderbooks.return_value = {
+            "A": self._book(12), "B": self._book(29),
+        }
+        assert quick_check(client, [("A", 12), ("B", 20)], 8) is True
+        assert quick_check(client, [("A", 12), ("B", 25)], 8) is False
+
+    def test_quick_check_requests_one_level(self):
+        from kalshi_weather.spike_monitor import quick_check
+
+        client = MagicMock()
+        client.get_orderbooks.return_value = {"A": self._book(12)}
+        quick_check(client, [("A", 12)], 8)
+        client.get_orderbooks.assert_called_once_with(["A"], depth=1)
+
+    def test_wait_stops_peeking_after_4xx(self):
+        import httpx
+
+        from kalshi_weather.spike_config import SpikeConfig
+        from kalshi_weather.spike_monitor import PriceHistory, wait_for_next_poll
+
+        clock = [1000.0]
+        fake_time = MagicMock()
+        fake_time.monotonic.side_effect = lambda: clock[0]
+        fake_time.sleep.side_effect = lambda s: clock.__setitem__(0, clock[0] + s)
+
+        ph = PriceHistory(max_age_seconds=360)
+        ph.record("A", 10, 900.0)
+        ph.record("A", 14, 990.0)
+        client = MagicMock()
+        client.get_orderbooks.side_effect = httpx.HTTPStatusError(
+            "not found",
+            request=httpx.Request("GET", "https://example.invalid"),
+            response=httpx.Response(404),
+        )
+        cfg = SpikeConfig(quick_check_seconds=5)
+        with patch("kalshi_weather.spike_monitor.time", fake_time):
+            assert wait_for_next_poll(client, ph, 30, cfg) is False
+            assert clock[0] == 1030.0
+            assert wait_for_next_poll(client, ph, 30, cfg, peek=False) is False
+        assert clock[0] == 1060.0
+        assert client.get_orderbooks.call_count == 1
+
+    def test_quick_check_swallows_errors(self):
+        from kalshi_weather.spike_monitor import quick_check
+
+        client = MagicMock()
+        client.get_orderbooks.side_effect = RuntimeError("down")
+        assert quick_check(client, [("A", 12)], 8) is False
+
+    def test_wait_returns_early_on_move(self):
+        from kalshi_weather.spike_config import SpikeConfig
+        from kalshi_weather.spike_monitor import PriceHistory, wait_for_next_poll
+
+        clock = [1000.0]
+        fake_time = MagicMock()
+        fake_time.monotonic.side_effect = lambda: clock[0]
+        fake_time.sleep.side_effect = lambda s: clock.__setitem__(0, clock[0] + s)
+
+        ph = PriceHistory(max_age_seconds=360)
+        ph.record("A", 10, 900.0)
+        ph.record("A", 14, 990.0)
+        client = MagicMock()
+        client.get_orderbooks.side_effect = [
+            {"A": self._book(15)},
+            {"A": self._book(30)},
+        ]
+        cfg = SpikeConfig(spike_threshold_cents=16, quick_check_seconds=5)
+        with patch("kalshi_weather.spike_monitor.time", fake_time):
+            wait_for_next_poll(client, ph, 30, cfg)
+        assert clock[0] == 1010.0
+        assert client.get_orderbooks.call_count == 2
+
+    def test_wait_without_movers_sleeps_once(self):
+        from kalshi_weather.spike_config import SpikeConfig
+        from kalshi_weather.spike_monitor import PriceHistory, wait_for_next_poll
+
+        client = MagicMock()
+        with patch("kalshi_weather.spike_monitor.time") as fake_time:
+            fake_time.monotonic.return_value = 50.0
+            wait_for_next_poll(client, PriceHistory(), 30, SpikeConfig())
+        fake_time.sleep.assert_called_once_with(30.0)
+        client.get_orderbooks.assert_not_called()
+
 
 # ======================================================================
 # HTML Email Builder Tests
@@ -175,36 +421,33 @@ class TestSpikeDetection:
 
 
 class TestSignalColor:
-    def test_strong_buy_green(self):
-        from kalshi_weather.spike_alerter import signal_to_color
+    @staticmethod
+    def _cell(signal):
+        from kalshi_weather.spike_alerter import build_conviction_row
 
-        color, label = signal_to_color("STRONG_BUY")
-        assert color == "#22c55e"
-        assert label == "STRONG_BUY"
+        row = build_conviction_row(1, 5, "3:39 PM", signal, 40.0, 30, False)
+        return row.split("<td ")[1]
 
-    def test_buy_green(self):
-        from kalshi_weather.spike_alerter import signal_to_color
+    def test_strong_buy_green(self):
+        assert self._cell("STRONG_BUY") == (
+            'style="color:#22c55e;font-weight:bold;">STRONG_BUY</td><td>40.0\u00b0F</td>'
+            "<td>30\u00a2</td></tr>"
+        )
 
-        color, _ = signal_to_color("BUY")
-        assert color == "#22c55e"
+    def test_buy_green(self):
+        assert "color:#22c55e;" in self._cell("BUY")
 
     def test_hold_yellow(self):
-        from kalshi_weather.spike_alerter import signal_to_color
-
-        color, _ = signal_to_color("HOLD")
-        assert color == "#eab308"
+        assert "color:#eab308;" in self._cell("HOLD")
 
     def test_caution_red(self):
-        from kalshi_weather.spike_alerter import signal_to_color
-
-        color, _ = signal_to_color("CAUTION")
-        assert color == "#ef4444"
+        assert "color:#ef4444;" in self._cell("CAUTION")
 
     def test_no_edge_red(self):
-        from kalshi_weather.spike_alerter import signal_to_color
+        assert "color:#ef4444;" in self._cell("NO_EDGE")
 
-        color, _ = signal_to_color("NO_EDGE")
-        assert color == "#ef4444"
+    def test_unknown_signal_grey(self):
+        assert "color:#6b7280;" in self._cell("MYSTERY")
 
 
 class TestBuildConvictionRow:
@@ -239,6 +482,22 @@ class TestBuildConvictionRow:
         )
         assert "(pending)" in row
 
+    def test_failed_analysis_row_without_readings(self):
+        from kalshi_weather.spike_alerter import build_conviction_row
+
+        row = build_conviction_row(
+            index=2,
+            total=5,
+            time_str="3:40 PM",
+            signal="NO_EDGE",
+            temp_f=None,
+            market_price=None,
+            is_current=True,
+        )
+        assert "NO_EDGE" in row
+        assert "None" not in row
+        assert "\u2014 \u2190 you are here" in row
+
     def test_current_row_marker(self):
         from kalshi_weather.spike_alerter import build_conviction_row
 
@@ -314,6 +573,36 @@ class TestBuildSpikeEmailHtml:
         )
         assert "#ef4444" in html  # red for CAUTION
 
+    def test_dollar_signs_in_values_kept_verbatim(self):
+        from kalshi_weather.spike_alerter import build_spike_email_html
+
+        html = build_spike_email_html(
+            city="Denver",
+            bracket="$city 50-51\u00b0F",
+            email_number=1,
+            email_total=1,
+            time_str="1:00 PM MST",
+            old_price=5,
+            new_price=20,
+            current_price=20,
+            spike_delta=15,
+            metar_f=None,
+            precise_f=None,
+            precise_c=None,
+            precise_source="none",
+            running_max_f=None,
+            margin_c=None,
+            margin_status="",
+            signal="UNKNOWN",
+            signal_reason="Costs $5 ${label}",
+            time_risk="UNKNOWN",
+            conviction_rows=[],
+        )
+        assert "SPIKE ALERT: Denver $city 50-51" in html
+        assert "Costs $5 ${label}" in html
+        assert "#6b7280" in html  # default grey
+        assert "\u2014" in html  # missing readings render as dashes
+
 
 class TestSendSpikeEmail:
     def test_send_constructs_html_message(self):
@@ -334,10 +623,167 @@ class TestSendSpikeEmail:
                 gmail_app_password="password",
             )
 
-            mock_server.send_message.assert_called_once()
-            msg = mock_server.send_message.call_args[0][0]
+            mock_server.sendmail.assert_called_once()
+            from_addr, to_addrs, raw = mock_server.sendmail.call_args[0]
+            assert from_addr == "test@gmail.com"
+            assert to_addrs == ["test@gmail.com"]
+            msg = email.message_from_bytes(raw)
             assert msg["To"] == "test@gmail.com"
             assert msg["From"] == "test@gmail.com"
+            assert msg.get_content_type() == "text/html"
+
+
+class TestBuildMessage:
+    def test_non_ascii_subject_is_encoded(self):
+        from email.header import decode_header, make_header
+
+        from kalshi_weather.spike_alerter import _build_message
+
+        html = "<p>\u00a2</p>\n<p>b</p>" * 20
+        raw = _build_message("SPIKE: Miami 84\u00b0 to 85\u00b0 [1/5]", html, "a@b.c")
+        assert raw.isascii()
+        assert b"\n" not in raw.replace(b"\r\n", b"")
+        msg = email.message_from_bytes(raw)
+        assert str(make_header(decode_header(msg["Subject"]))) == (
+            "SPIKE: Miami 84\u00b0 to 85\u00b0 [1/5]"
+        )
+        assert msg.get_payload(decode=True).decode("utf-8") == html
+
+    def test_long_non_ascii_subject_folds_with_crlf(self):
+        from email.header import decode_header, make_header
+
+        from kalshi_weather.spike_alerter import _build_message
+
+        subject = (
+            "SPIKE: San Francisco Will the high temp in San Francisco be "
+            "63\u00b0 or above today? [1/5]"
+        )
+        raw = _build_message(subject, "<p>a</p>\n<p>b</p>", "a@b.c")
+        head, _, _ = raw.partition(b"\r\n\r\n")
+        assert b"\r\n " in head  # folded
+        assert b"\n" not in raw.replace(b"\r\n", b"")
+        msg = email.message_from_bytes(raw)
+        assert str(make_header(decode_header(msg["Subject"]))) == subject
+
+
+class TestSpikeMailer:
+    def test_reuses_connection_across_sends(self):
+        from unittest.mock import patch
+
+        from kalshi_weather.spike_alerter import SpikeMailer
+
+        with patch("kalshi_weather.spike_alerter.smtplib.SMTP") as mock_smtp:
+            server = mock_smtp.return_value
+            server.noop.return_value = (250, b"OK")
+            with SpikeMailer("me@gmail.com", "pw") as mailer:
+                for i in range(3):
+                    mailer.send(f"SPIKE {i}", "<p>x</p>")
+
+            assert mock_smtp.call_count == 1
+            server.login.assert_called_once_with("me@gmail.com", "pw")
+            assert server.sendmail.call_count == 3
+            server.quit.assert_called_once()
+
+    def test_reconnects_after_server_drop(self):
+        import smtplib
+        from unittest.mock import MagicMock, patch
+
+        from kalshi_weather.spike_alerter import SpikeMailer
+
+        stale, fresh = MagicMock(), MagicMock()
+        stale.noop.side_effect = smtplib.SMTPServerDisconnected("idle timeout")
+        with patch(
+            "kalshi_weather.spike_alerter.smtplib.SMTP", side_effect=[stale, fresh],
+        ):
+            mailer = SpikeMailer("me@gmail.com", "pw")
+            mailer.send("first", "<p>1</p>")
+            mailer.send("second", "<p>2</p>")
+
+        stale.sendmail.assert_called_once()
+        stale.close.assert_called_once()
+        fresh.sendmail.assert_called_once()
+        raw = fresh.sendmail.call_args[0][2]
+        assert email.message_from_bytes(raw)["Subject"] == "second"
+
+    def test_close_without_send_opens_nothing(self):
+        from unittest.mock import patch
+
+        from kalshi_weather.spike_alerter import SpikeMailer
+
+        with patch("kalshi_weather.spike_alerter.smtplib.SMTP") as mock_smtp:
+            SpikeMailer("me@gmail.com", "pw").close()
+        mock_smtp.assert_not_called()
+
+
+class TestQueuedSpikeMailer:
+    def test_sends_in_order_and_survives_failures(self):
+        from unittest.mock import MagicMock
+
+        from kalshi_weather.spike_alerter import QueuedSpikeMailer
+
+        inner = MagicMock()
+        inner.send.side_effect = [RuntimeError("smtp down"), None, None]
+        with QueuedSpikeMailer(inner) as q:
+            for i in range(3):
+                assert q.submit(f"SPIKE {i}", "<p/>", "BUY")
+
+        assert [c.args[0] for c in inner.send.call_args_list] == [
+            "SPIKE 0", "SPIKE 1", "SPIKE 2",
+        ]
+        inner.close.assert_called_once()
+
+    def test_full_queue_sheds_low_priority_first(self):
+        import threading
+        from unittest.mock import MagicMock
+
+        from kalshi_weather.spike_alerter import QueuedSpikeMailer
+
+        started, release = threading.Event(), threading.Event()
+        sent: list[str] = []
+
+        def slow_send(subject, html_body):
+            started.set()
+            release.wait(5)
+            sent.append(subject)
+
+        inner = MagicMock()
+        inner.send.side_effect = slow_send
+        q = QueuedSpikeMailer(inner, max_pending=2)
+        q.submit("in-flight", "", "BUY")
+        assert started.wait(5)
+
+        assert q.submit("hold", "", "HOLD")
+        assert q.submit("buy", "", "STRONG_BUY")
+        assert q.submit("buy2", "", "BUY")  # evicts "hold"
+        assert not q.submit("caution", "", "CAUTION")  # nothing low left to shed
+
+        release.set()
+        q.close()
+        assert sent == ["in-flight", "buy", "buy2"]
+
+    def test_close_timeout_leaves_session_open_until_send_finishes(self):
+        import threading
+        from unittest.mock import MagicMock
+
+        from kalshi_weather.spike_alerter import QueuedSpikeMailer
+
+        started, release = threading.Event(), threading.Event()
+
+        def slow_send(subject, html_body):
+            started.set()
+            release.wait(5)
+
+        inner = MagicMock()
+        inner.send.side_effect = slow_send
+        q = QueuedSpikeMailer(inner)
+        q.submit("in-flight", "", "BUY")
+        assert started.wait(5)
+
+        q.close(timeout=0.01)
+        inner.close.assert_not_called()
+        release.set()
+        q._worker.join(5)
+        inner.close.assert_called_once()
 
 
 # ======================================================================
@@ -392,6 +838,75 @@ class TestExtractBracketPrices:
         assert len(prices) == 0
 
 
+class TestExtractBracketData:
+    def test_prices_and_bracket_defs_in_one_pass(self):
+        from kalshi_weather.spike_monitor import extract_bracket_data
+
+        event = {
+            "markets": [
+                {
+                    "ticker": "KXHIGHCHI-26FEB25-B40",
+                    "yes_bid": 7,
+                    "yes_sub_title": "40\u00b0 to 41\u00b0",
+                    "title": "ignored",
+                },
+                {"ticker": "KXHIGHCHI-26FEB25-T45", "yes_bid": 50, "title": "45+"},
+                {"ticker": "KXHIGHCHI-26FEB25-T30", "yes_sub_title": "no bid"},
+            ],
+        }
+        assert extract_bracket_data(event) == {
+            "KXHIGHCHI-26FEB25-B40": (7, "40\u00b0 to 41\u00b0"),
+            "KXHIGHCHI-26FEB25-T45": (50, "45+"),
+        }
+
+
+class TestFetchSeriesEvents:
+    def test_concurrent_fetch_keeps_order_and_skips_failures(self):
+        from kalshi_weather.spike_monitor import fetch_series_events
+
+        def get_events(series_ticker, **kwargs):
+            if series_ticker == "KXHIGHMIA":
+                raise RuntimeError("boom")
+            return [{"event_ticker": f"{series_ticker}-26FEB25"}], None
+
+        client = MagicMock()
+        client.get_events.side_effect = get_events
+        tracked = {
+            "KXHIGHNY": "New York",
+            "KXHIGHMIA": "Miami",
+            "KXHIGHDEN": "Denver",
+        }
+        result = fetch_series_events(client, tracked, max_workers=3)
+        assert [city for city, _ in result] == ["New York", "Denver"]
+        assert result[1][1][0]["event_ticker"] == "KXHIGHDEN-26FEB25"
+        assert client.get_events.call_count == 3
+
+
+class TestFormatBurstTime:
+    def test_matches_strftime_label(self):
+        from kalshi_weather.spike_monitor import format_burst_time
+
+        for hour in range(24):
+            for minute in (0, 7, 59):
+                dt = datetime(2026, 2, 25, hour, minute)
+                expected = dt.strftime("%I:%M %p EST").lstrip("0")
+                assert format_burst_time(dt) == expected
+        assert format_burst_time(datetime(2026, 2, 25, 0, 5)) == "12:05 AM EST"
+
+
+class TestConvictionRowFromEntry:
+    def test_matches_direct_build(self):
+        from kalshi_weather.spike_alerter import build_conviction_row
+        from kalshi_weather.spike_monitor import ConvictionEntry, _conviction_row
+
+        entry = ConvictionEntry("3:07 PM EST", "BUY", 71.4, 42)
+        for current in (True, False):
+            assert _conviction_row(2, 5, entry, current) == build_conviction_row(
+                index=2, total=5, time_str="3:07 PM EST", signal="BUY",
+                temp_f=71.4, market_price=42, is_current=current,
+            )
+
+
 class TestIsInOperatingWindow:
     def test_inside_window(self):
         from kalshi_weather.spike_config import SpikeConfig
@@ -464,6 +979,7 @@ class TestBurstCollectData:
 
         mock_scraper = MagicMock()
         mock_client = MagicMock()
+        mock_client.get_orderbook_best_yes.return_value = 42
 
         mock_report = MagicMock()
         mock_report.running_max_f_precise = 39.9
@@ -496,6 +1012,10 @@ class TestBurstCollectData:
         assert data is not None
         assert data["signal"] == "STRONG_BUY"
         assert data["precise_f"] == 39.9
+        assert data["current_price"] == 42
+        mock_client.get_orderbook_best_yes.assert_called_once_with(
+            "KXHIGHCHI-26FEB25-B40",
+        )
 
 
 # ======================================================================